@@ -0,0 +1,87 @@
+"""Local stand-in for the NHL API hosts, shared by the benchmark scripts."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        payload = self.server.payload
+        body = json.dumps(payload(self.path) if callable(payload) else payload).encode()
+        self.server.requests += 1
+        self.server.bytes_sent += len(body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServer:
+    """Threaded HTTP/1.1 keep-alive server answering every GET with the same JSON payload.
+
+    ``payload`` may also be a callable taking the request path (with query string) and returning the payload.
+    ``latency`` seconds are slept before each response to stand in for the round trip to the real hosts.
+    """
+
+    def __init__(self, payload=None, latency: float = 0.0):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.connections = 0
+        self._server.requests = 0
+        self._server.bytes_sent = 0
+        self._server.latency = latency
+        self._server.payload = payload if payload is not None else {"data": [], "total": 0}
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    @property
+    def bytes_sent(self) -> int:
+        """JSON body bytes served so far."""
+        return self._server.bytes_sent
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class LocalTransport(httpx.HTTPTransport):
+    """Rewrites api-web.nhle.com / api.nhle.com urls to the local server, keeping path and query."""
+
+    def __init__(self, port: int, **kwargs):
+        super().__init__(**kwargs)
+        self._port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self._port)
+        return super().handle_request(request)
@@ -0,0 +1,66 @@
+"""Per request latency: a fresh httpx.Client per call (the pre 3.2 behaviour) vs the pooled HttpClient.
+
+Runs against a local keep-alive server, so the gap shown here is TCP setup only.  Against the real
+api-web.nhle.com / api.nhle.com hosts each fresh client also pays a TLS handshake, so the real world gap is larger.
+
+    PYTHONPATH=. python benchmarks/bench_connection_pool.py --requests 500
+"""
+
+import argparse
+import statistics
+import time
+
+import httpx
+
+from _local_server import LocalServer, LocalTransport
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import Endpoint, HttpClient
+
+RESOURCE = "gamecenter/2023020001/boxscore"
+
+
+def _per_client(port: int, n: int) -> list:
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        with httpx.Client(transport=LocalTransport(port)) as client:
+            client.get(f"{Endpoint.API_WEB_V1.value}{RESOURCE}")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _pooled(port: int, n: int) -> list:
+    timings = []
+    with HttpClient(ClientConfig(transport=LocalTransport(port), rate_limit=None)) as http_client:
+        for _ in range(n):
+            start = time.perf_counter()
+            http_client.get(endpoint=Endpoint.API_WEB_V1, resource=RESOURCE)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(name: str, timings: list, connections: int) -> None:
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    print(
+        f"{name:<18} mean={statistics.mean(ms):7.3f}ms  p50={statistics.median(ms):7.3f}ms  p95={p95:7.3f}ms  "
+        f"connections={connections}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    with LocalServer() as server:
+        timings = _per_client(server.port, args.requests)
+        _report("client per request", timings, server.connections)
+
+    with LocalServer() as server:
+        timings = _pooled(server.port, args.requests)
+        _report("pooled HttpClient", timings, server.connections)
+
+
+if __name__ == "__main__":
+    main()
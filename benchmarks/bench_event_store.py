@@ -0,0 +1,153 @@
+"""Memory and filter speed of a season of play-by-play: the parsed JSON dicts vs an EventTable.
+
+Builds synthetic play-by-play payloads shaped like GameCenter.play_by_play responses (~320 plays per game),
+then measures the memory still held after loading ``--games`` games both ways (tracemalloc) and the time to find
+every shot by one player, scanning the dicts vs ``EventTable.select``.  Load times include tracemalloc overhead.
+
+    PYTHONPATH=. python benchmarks/bench_event_store.py --games 1312
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from nhlpy.tables import SHOT_EVENTS, EventTable
+
+PLAYS_PER_GAME = 320
+# (typeCode, typeDescKey, weight)
+PLAY_TYPES = [
+    (502, "faceoff", 60),
+    (503, "hit", 45),
+    (504, "giveaway", 15),
+    (505, "goal", 6),
+    (506, "shot-on-goal", 60),
+    (507, "missed-shot", 25),
+    (508, "blocked-shot", 30),
+    (509, "penalty", 8),
+    (516, "stoppage", 55),
+    (525, "takeaway", 16),
+]
+TEAMS = list(range(1, 33))
+PLAYERS = {team: [8470000 + team * 100 + n for n in range(20)] for team in TEAMS}
+
+
+def _details(rng: random.Random, desc: str, team: int, opponent: int) -> dict:
+    us, them = rng.choice(PLAYERS[team]), rng.choice(PLAYERS[opponent])
+    details = {
+        "eventOwnerTeamId": team,
+        "xCoord": rng.randint(-99, 99),
+        "yCoord": rng.randint(-42, 42),
+        "zoneCode": rng.choice("ODN"),
+    }
+    if desc == "faceoff":
+        details.update(winningPlayerId=us, losingPlayerId=them)
+    elif desc == "hit":
+        details.update(hittingPlayerId=us, hitteePlayerId=them)
+    elif desc in ("shot-on-goal", "missed-shot"):
+        details.update(shootingPlayerId=us, goalieInNetId=PLAYERS[opponent][0], shotType="wrist")
+    elif desc == "blocked-shot":
+        details.update(shootingPlayerId=us, blockingPlayerId=them)
+    elif desc == "goal":
+        details.update(
+            scoringPlayerId=us,
+            assist1PlayerId=rng.choice(PLAYERS[team]),
+            goalieInNetId=PLAYERS[opponent][0],
+            shotType="snap",
+            homeScore=1,
+            awayScore=0,
+        )
+    elif desc == "penalty":
+        details.update(committedByPlayerId=us, drawnByPlayerId=them, typeCode="MIN", descKey="tripping", duration=2)
+    elif desc in ("giveaway", "takeaway"):
+        details["playerId"] = us
+    else:
+        details = {"reason": "puck-in-netting"}
+    return details
+
+
+def _game_json(game_id: int, rng: random.Random) -> str:
+    home, away = rng.sample(TEAMS, 2)
+    plays = []
+    for n in range(PLAYS_PER_GAME):
+        code, desc, _ = rng.choices(PLAY_TYPES, weights=[w for _, _, w in PLAY_TYPES])[0]
+        team, opponent = (home, away) if rng.random() < 0.5 else (away, home)
+        period, second = n * 3 // PLAYS_PER_GAME + 1, (n * 3600 // PLAYS_PER_GAME) % 1200
+        plays.append(
+            {
+                "eventId": n + 1,
+                "periodDescriptor": {"number": period, "periodType": "REG", "maxRegulationPeriods": 3},
+                "timeInPeriod": f"{second // 60:02d}:{second % 60:02d}",
+                "timeRemaining": f"{(1200 - second) // 60:02d}:{(1200 - second) % 60:02d}",
+                "situationCode": "1551",
+                "homeTeamDefendingSide": "left",
+                "typeCode": code,
+                "typeDescKey": desc,
+                "sortOrder": n * 10,
+                "details": _details(rng, desc, team, opponent),
+            }
+        )
+    game = {
+        "id": game_id,
+        "season": 20232024,
+        "gameType": 2,
+        "gameDate": "2023-11-01",
+        "homeTeam": {"id": home, "abbrev": f"T{home}"},
+        "awayTeam": {"id": away, "abbrev": f"T{away}"},
+        "plays": plays,
+    }
+    return json.dumps(game)
+
+
+def _measure(load):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=300, help="Games to load, a regular season is 1312.")
+    args = parser.parse_args()
+    rng = random.Random(0)
+    payloads = [_game_json(2023020001 + n, rng) for n in range(args.games)]
+    player = PLAYERS[1][3]
+
+    games, dict_bytes, dict_load = _measure(lambda: [json.loads(p) for p in payloads])
+    events, table_bytes, table_load = _measure(lambda: EventTable.from_games(json.loads(p) for p in payloads))
+
+    start = time.perf_counter()
+    scanned = [
+        play
+        for game in games
+        for play in game["plays"]
+        if play["typeDescKey"] in SHOT_EVENTS
+        and (play["details"].get("shootingPlayerId") or play["details"].get("scoringPlayerId")) == player
+    ]
+    scan_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    selected = events.select(event_types=SHOT_EVENTS, player_id=player)
+    select_ms = (time.perf_counter() - start) * 1000
+    assert len(scanned) == len(selected)
+
+    plays = len(events)
+    print(f"{args.games} games, {plays} plays")
+    print(
+        f"dicts        held={dict_bytes / 1024 / 1024:8.1f}MB  load={dict_load:6.2f}s  shots by player={scan_ms:7.2f}ms"
+    )
+    print(
+        f"EventTable   held={table_bytes / 1024 / 1024:8.1f}MB  load={table_load:6.2f}s  "
+        f"shots by player={select_ms:7.2f}ms  ({table_bytes / plays:.0f} bytes/play, indexes included)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""JSON decoders (and raw mode) on the heaviest payloads: play-by-play, shift charts and a stats report page.
+
+Calls go through NHLClient end to end against an in process transport serving pre encoded bodies, so the numbers
+are decode time plus the fixed cost of a request.  Decoders that aren't installed are skipped.
+
+    PYTHONPATH=. python benchmarks/bench_json_decoding.py --calls 50
+"""
+
+import argparse
+import json
+import random
+import time
+
+import httpx
+
+from bench_event_store import _game_json
+from nhlpy.config import ClientConfig
+from nhlpy.decoding import get_decoder, raw_responses
+from nhlpy.nhl_client import NHLClient
+
+# Report methods return the decoded payload's "data", raw mode doesn't apply to them.
+RESHAPED = {"skater/summary"}
+
+
+def _shift_chart(rng: random.Random) -> str:
+    shifts = []
+    for n in range(850):
+        team = rng.choice((7, 22))
+        period = n * 3 // 850 + 1
+        start = rng.randint(0, 1150)
+        shifts.append(
+            {
+                "id": 14000000 + n,
+                "detailCode": 0,
+                "duration": "00:45",
+                "endTime": f"{(start + 45) // 60:02d}:{(start + 45) % 60:02d}",
+                "eventDescription": None,
+                "eventDetails": None,
+                "eventNumber": None,
+                "firstName": "First",
+                "gameId": 2023020001,
+                "hexValue": "#002654",
+                "lastName": "Last",
+                "period": period,
+                "playerId": 8470000 + team * 100 + rng.randrange(20),
+                "shiftNumber": n // 40 + 1,
+                "startTime": f"{start // 60:02d}:{start % 60:02d}",
+                "teamAbbrev": "BUF" if team == 7 else "EDM",
+                "teamId": team,
+                "teamName": "Buffalo Sabres" if team == 7 else "Edmonton Oilers",
+                "typeCode": 517,
+            }
+        )
+    return json.dumps({"data": shifts, "total": len(shifts)})
+
+
+def _skater_summary(rng: random.Random) -> str:
+    keys = ["assists", "evGoals", "evPoints", "faceoffWinPct", "gameWinningGoals", "gamesPlayed", "goals"]
+    keys += ["otGoals", "penaltyMinutes", "plusMinus", "points", "pointsPerGame", "ppGoals", "ppPoints"]
+    keys += ["shGoals", "shPoints", "shootingPct", "shots", "timeOnIcePerGame"]
+    rows = []
+    for n in range(100):
+        row = {key: round(rng.random() * 80, 5) for key in keys}
+        row.update(
+            playerId=8470000 + n,
+            seasonId=20232024,
+            skaterFullName=f"Player {n}",
+            lastName=f"Player{n}",
+            positionCode=rng.choice("CLRD"),
+            shootsCatches=rng.choice("LR"),
+            teamAbbrevs="EDM",
+        )
+        rows.append(row)
+    return json.dumps({"data": rows, "total": 900})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=50, help="Calls per endpoint and decoder.")
+    args = parser.parse_args()
+    rng = random.Random(0)
+    bodies = {
+        "play-by-play": _game_json(2023020001, rng).encode(),
+        "shiftcharts": _shift_chart(rng).encode(),
+        "skater/summary": _skater_summary(rng).encode(),
+    }
+    calls = {
+        "play-by-play": lambda client: client.game_center.play_by_play("2023020001"),
+        "shiftcharts": lambda client: client.game_center.shift_chart_data("2023020001"),
+        "skater/summary": lambda client: client.stats.skater_stats_summary("20232024", "20232024"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        for name, body in bodies.items():
+            if name in request.url.path:
+                return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        return httpx.Response(404)
+
+    decoders = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            get_decoder(name)
+        except ImportError:
+            print(f"{name} not installed, skipped")
+            continue
+        decoders.append(name)
+
+    print(f"{'':16}" + "".join(f"{name:>16}" for name in bodies))
+    print(f"{'body size':16}" + "".join(f"{len(body) / 1024:>14.0f}KB" for body in bodies.values()))
+    for mode in decoders + ["raw"]:
+        config = ClientConfig(
+            transport=httpx.MockTransport(handler),
+            rate_limit=None,
+            json_decoder="json" if mode == "raw" else mode,
+        )
+        row = f"{mode:16}"
+        with NHLClient(config=config) as client:
+            for name, call in calls.items():
+                if mode == "raw" and name in RESHAPED:
+                    row += f"{'n/a':>16}"
+                    continue
+                start = time.perf_counter()
+                for _ in range(args.calls):
+                    if mode == "raw":
+                        with raw_responses():
+                            call(client)
+                    else:
+                        call(client)
+                row += f"{(time.perf_counter() - start) / args.calls * 1000:>14.2f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
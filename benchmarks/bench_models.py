@@ -0,0 +1,62 @@
+"""Memory and build time of play-by-play plays kept as decoded dicts vs ``nhlpy.models.Play``.
+
+Each game's body is decoded and converted, then the decoded payload is dropped, as a caller loading a season would.
+Models are measured before and after reading every play's ``details`` (which converts them), and
+``Play.from_dict`` is also timed alone, over plays already decoded.
+
+    PYTHONPATH=. python benchmarks/bench_models.py --games 100
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from bench_event_store import _game_json
+from nhlpy import models
+from nhlpy.decoding import get_decoder
+
+
+def _measure(bodies, build):
+    start = time.perf_counter()
+    [build(body) for body in bodies]
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    kept = [build(body) for body in bodies]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return kept, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=100)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    bodies = [_game_json(2023020001 + n, rng).encode() for n in range(args.games)]
+    decode = get_decoder()
+
+    plays, dict_size, dict_time = _measure(bodies, lambda body: decode(body)["plays"])
+    count = sum(map(len, plays))
+    start = time.perf_counter()
+    for game in plays:
+        models.Play.many(game)
+    from_dict_time = time.perf_counter() - start
+    del plays
+    kept, model_size, model_time = _measure(bodies, lambda body: models.plays(body, decoder=decode))
+    tracemalloc.start()
+    for game in kept:
+        for play in game:
+            play.details
+    touched_size = model_size + tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{count} plays from {args.games} games")
+    print(f"{'dicts':32}{dict_size / 2**20:>10.1f}MB{dict_time * 1000:>12.0f}ms")
+    print(f"{'models':32}{model_size / 2**20:>10.1f}MB{model_time * 1000:>12.0f}ms")
+    print(f"{'models, details read':32}{touched_size / 2**20:>10.1f}MB")
+    print(f"{'Play.from_dict only':32}{'':>12}{from_dict_time * 1000:>12.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
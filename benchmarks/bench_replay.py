@@ -0,0 +1,206 @@
+"""Offline benchmark suite: the heavy sub-API calls, replayed from a cassette through the full HttpClient stack.
+
+Scenarios: ``Teams.teams``, ``Helpers.game_ids_by_season``, ``Helpers.all_players_summary_statistics``, a paged
+stats report (``Stats.iter_skater_stats_summary``) and play-by-play parsing (``GameCenter.play_by_play_events``).
+Each is run once to warm up, once timed, and once under tracemalloc for its peak memory.  Reports requests,
+throttled (429) responses, bytes served, wall time and peak memory.
+
+The cassette is, by default, a synthetic full size season recorded into a temporary directory.  ``--record DIR``
+records the real NHL API first (needs network), ``--cassette DIR`` replays an earlier recording.  Responses are
+held back ``--latency`` ms plus their size over ``--bandwidth``, and ``--server-rate`` makes the replayed hosts
+turn down requests beyond a rate like the real ones do.
+
+    PYTHONPATH=. python benchmarks/bench_replay.py --latency 50 --server-rate 20/20
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+
+import httpx
+
+from bench_event_store import _game_json
+from bench_season_games import SEASON, TEAMS, _build_season
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+from nhlpy.replay import Cassette, RecordingTransport, ReplayTransport
+
+SKATERS_PER_TEAM = 26
+POSITIONS = ["C"] * 8 + ["L"] * 5 + ["R"] * 5 + ["D"] * 8
+
+
+def _synthetic_api():
+    """A MockTransport answering the endpoints the scenarios use with full size synthetic payloads."""
+    games = _build_season()
+    rng = random.Random(0)
+    players = {
+        abbr: [
+            {
+                "id": 8470000 + t * 100 + n,
+                "headshot": f"https://assets.nhle.com/mugs/nhl/20232024/{abbr}/{8470000 + t * 100 + n}.png",
+                "firstName": {"default": f"First{n}"},
+                "lastName": {"default": f"Last{t}x{n}"},
+                "sweaterNumber": n + 2,
+                "positionCode": "G" if n >= SKATERS_PER_TEAM else POSITIONS[n],
+                "shootsCatches": rng.choice("LR"),
+                "heightInInches": 72,
+                "weightInPounds": 200,
+                "birthDate": "1997-01-13",
+                "birthCity": {"default": "Somewhere"},
+                "birthCountry": "CAN",
+            }
+            for n in range(SKATERS_PER_TEAM + 3)
+        ]
+        for t, abbr in enumerate(TEAMS)
+    }
+    skaters = [p for roster in players.values() for p in roster if p["positionCode"] != "G"]
+    keys = ["assists", "evGoals", "evPoints", "faceoffWinPct", "gameWinningGoals", "gamesPlayed", "goals"]
+    keys += ["otGoals", "penaltyMinutes", "plusMinus", "points", "pointsPerGame", "ppGoals", "ppPoints", "shots"]
+    summary = [
+        dict(
+            {key: round(rng.random() * 80, 5) for key in keys},
+            playerId=p["id"],
+            seasonId=SEASON,
+            skaterFullName=f"{p['firstName']['default']} {p['lastName']['default']}",
+            lastName=p["lastName"]["default"],
+            positionCode=p["positionCode"],
+            shootsCatches=p["shootsCatches"],
+            teamAbbrevs=p["headshot"].split("/")[-2],
+        )
+        for p in skaters
+    ]
+
+    def team(t: int, abbr: str) -> dict:
+        return {
+            "teamName": {"default": f"{abbr} Team"},
+            "teamCommonName": {"default": abbr},
+            "teamAbbrev": {"default": abbr},
+            "teamLogo": f"https://assets.nhle.com/logos/nhl/svg/{abbr}_light.svg",
+            "conferenceAbbrev": "E" if t < 16 else "W",
+            "conferenceName": "Eastern" if t < 16 else "Western",
+            "divisionAbbrev": "ACMP"[t // 8],
+            "divisionName": ["Atlantic", "Metropolitan", "Central", "Pacific"][t // 8],
+        }
+
+    def payload(request: httpx.Request):
+        path, params = request.url.path, request.url.params
+        if path.startswith("/v1/standings/"):
+            return {"standings": [team(t, abbr) for t, abbr in enumerate(TEAMS)]}
+        if path == "/stats/rest/en/franchise":
+            return {"data": [{"id": t + 1, "fullName": f"{abbr} Team"} for t, abbr in enumerate(TEAMS)]}
+        if path.startswith("/v1/club-schedule-season/"):
+            abbr = path.split("/")[3]
+            return {"games": [g for g in games if abbr in (g["homeTeam"]["abbrev"], g["awayTeam"]["abbrev"])]}
+        if path.startswith("/v1/roster/"):
+            roster = players[path.split("/")[3]]
+            return {
+                "forwards": [p for p in roster if p["positionCode"] in "CLR"],
+                "defensemen": [p for p in roster if p["positionCode"] == "D"],
+                "goalies": [p for p in roster if p["positionCode"] == "G"],
+            }
+        if path == "/stats/rest/en/skater/summary":
+            start, limit = int(params.get("start", 0)), int(params.get("limit", 25))
+            return {"data": summary[start : start + limit], "total": len(summary)}
+        if path.startswith("/v1/gamecenter/") and path.endswith("/play-by-play"):
+            game_id = int(path.split("/")[3])
+            return json.loads(_game_json(game_id, random.Random(game_id)))
+        return None
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = payload(request)
+        if body is None:
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, json=body)
+
+    return httpx.MockTransport(handler)
+
+
+SCENARIOS = [
+    ("teams", lambda client, game_ids: len(client.teams.teams())),
+    ("game_ids_by_season", lambda client, game_ids: len(client.helpers.game_ids_by_season(str(SEASON), [2]))),
+    (
+        "all_players_summary_statistics",
+        lambda client, game_ids: len(client.helpers.all_players_summary_statistics(str(SEASON))),
+    ),
+    (
+        "stats pagination",
+        lambda client, game_ids: sum(1 for _ in client.stats.iter_skater_stats_summary(str(SEASON), str(SEASON))),
+    ),
+    ("play-by-play parsing", lambda client, game_ids: len(client.game_center.play_by_play_events(game_ids))),
+]
+
+
+def _record(cassette: Cassette, transport, games: int) -> None:
+    config = ClientConfig(transport=RecordingTransport(cassette, transport=transport))
+    with NHLClient(config=config) as client:
+        game_ids = [str(g) for g in client.helpers.game_ids_by_season(str(SEASON), [2])[:games]]
+        for _, scenario in SCENARIOS:
+            scenario(client, game_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cassette", help="Replay this cassette directory instead of a synthetic season.")
+    parser.add_argument("--record", metavar="DIR", help="Record the live NHL API into DIR first, then replay it.")
+    parser.add_argument("--games", type=int, default=50, help="Games in the play-by-play scenario.")
+    parser.add_argument("--latency", type=float, default=50, help="Simulated round trip per request, in ms.")
+    parser.add_argument("--bandwidth", type=float, default=20, help="Simulated download speed in MB/s, 0 for none.")
+    parser.add_argument("--server-rate", default=None, help="Server side limit per host as RATE/BURST, e.g. 20/20.")
+    parser.add_argument("--client-rate", type=float, default=10, help="ClientConfig(rate_limit=...), 0 for none.")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.record:
+        cassette = Cassette(args.record)
+        _record(cassette, None, args.games)
+    elif args.cassette:
+        cassette = Cassette(args.cassette)
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        cassette = Cassette(tmp.name)
+        _record(cassette, _synthetic_api(), args.games)
+    server_rate = tuple(float(x) for x in args.server_rate.split("/")) if args.server_rate else None
+    transport = ReplayTransport(
+        cassette,
+        latency=args.latency / 1000,
+        bandwidth=args.bandwidth * 1024 * 1024 if args.bandwidth else None,
+        rate_limit=(server_rate[0], int(server_rate[1])) if server_rate else None,
+    )
+    config = ClientConfig(transport=transport, rate_limit=args.client_rate or None)
+
+    with NHLClient(config=config) as client:
+        game_ids = [str(g) for g in client.helpers.game_ids_by_season(str(SEASON), [2])[: args.games]]
+
+    print(f"cassette: {cassette.path} ({len(cassette)} responses)")
+    print(f"{'scenario':32}{'result':>8}{'requests':>10}{'429s':>6}{'MB':>9}{'time':>11}{'peak':>11}")
+    for name, scenario in SCENARIOS:
+        with NHLClient(config=config) as client:
+            scenario(client, game_ids)
+        requests, throttled, sent = transport.requests, transport.throttled, transport.bytes_sent
+        with NHLClient(config=config) as client:
+            start = time.perf_counter()
+            result = scenario(client, game_ids)
+            elapsed = time.perf_counter() - start
+        requests, throttled, sent = (
+            transport.requests - requests,
+            transport.throttled - throttled,
+            transport.bytes_sent - sent,
+        )
+        with NHLClient(config=config) as client:
+            tracemalloc.start()
+            scenario(client, game_ids)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(
+            f"{name:32}{result:>8}{requests:>10}{throttled:>6}{sent / 1024 / 1024:>9.2f}"
+            f"{elapsed * 1000:>9.0f}ms{peak / 1024 / 1024:>9.1f}MB"
+        )
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
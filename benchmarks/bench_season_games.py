@@ -0,0 +1,141 @@
+"""Enumerating a season's games: the 32 team schedules (Helpers.game_ids_by_season) vs walking the league wide
+weekly schedule (Schedule.season_games), serially and in parallel.
+
+Runs against a local server serving a synthetic, full size season (preseason, 1312 regular season games,
+playoffs) with realistically sized game stubs, adding ``--latency`` ms to every response.  Reports requests made,
+JSON bytes downloaded and wall time.
+
+    PYTHONPATH=. python benchmarks/bench_season_games.py --latency 50
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from _local_server import LocalServer, LocalTransport
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+
+SEASON = 20232024
+TEAMS = [
+    "ANA", "BOS", "BUF", "CAR", "CBJ", "CGY", "CHI", "COL", "DAL", "DET", "EDM", "FLA", "LAK", "MIN", "MTL", "NJD",
+    "NSH", "NYI", "NYR", "OTT", "PHI", "PIT", "SEA", "SJS", "STL", "TBL", "TOR", "UTA", "VAN", "VGK", "WPG", "WSH",
+]  # fmt: skip
+PRESEASON = (date(2023, 9, 23), date(2023, 10, 8), 100, 1)
+REGULAR = (date(2023, 10, 10), date(2024, 4, 18), 1312, 2)
+PLAYOFFS = (date(2024, 4, 20), date(2024, 6, 24), 87, 3)
+
+
+def _stub(game_id: int, game_type: int, day: date, home: str, away: str) -> dict:
+    """Roughly the shape and size of a real schedule game stub."""
+
+    def team(abbr: str) -> dict:
+        return {
+            "id": TEAMS.index(abbr) + 1,
+            "abbrev": abbr,
+            "placeName": {"default": f"{abbr} City"},
+            "logo": f"https://assets.nhle.com/logos/nhl/svg/{abbr}_light.svg",
+            "darkLogo": f"https://assets.nhle.com/logos/nhl/svg/{abbr}_dark.svg",
+        }
+
+    return {
+        "id": game_id,
+        "season": SEASON,
+        "gameType": game_type,
+        "gameDate": day.isoformat(),
+        "venue": {"default": f"{home} Arena"},
+        "neutralSite": False,
+        "startTimeUTC": f"{day.isoformat()}T23:00:00Z",
+        "easternUTCOffset": "-04:00",
+        "venueUTCOffset": "-04:00",
+        "venueTimezone": "America/New_York",
+        "gameState": "OFF",
+        "gameScheduleState": "OK",
+        "tvBroadcasts": [{"id": i, "market": "N", "countryCode": "US", "network": f"NET{i}"} for i in range(3)],
+        "awayTeam": team(away),
+        "homeTeam": team(home),
+        "gameCenterLink": f"/gamecenter/{away.lower()}-vs-{home.lower()}/{day.isoformat()}/{game_id}",
+    }
+
+
+def _build_season() -> list:
+    rng = random.Random(0)
+    games = []
+    for start, end, count, game_type in (PRESEASON, REGULAR, PLAYOFFS):
+        days = (end - start).days + 1
+        for n in range(count):
+            home, away = rng.sample(TEAMS, 2)
+            day = start + timedelta(days=n * days // count)
+            games.append(_stub(SEASON // 10000 * 1000000 + game_type * 10000 + n + 1, game_type, day, home, away))
+    return games
+
+
+def _router(games: list):
+    by_day = {}
+    for game in games:
+        by_day.setdefault(game["gameDate"], []).append(game)
+    first, last = PRESEASON[0], PLAYOFFS[1]
+
+    def week(start: date) -> dict:
+        days = [start + timedelta(days=i) for i in range(7)]
+        next_start = start + timedelta(days=7)
+        return {
+            "nextStartDate": next_start.isoformat() if next_start <= last else None,
+            "previousStartDate": (start - timedelta(days=7)).isoformat() if start > first else None,
+            "preSeasonStartDate": PRESEASON[0].isoformat(),
+            "regularSeasonStartDate": REGULAR[0].isoformat(),
+            "regularSeasonEndDate": REGULAR[1].isoformat(),
+            "playoffEndDate": PLAYOFFS[1].isoformat(),
+            "numberOfGames": sum(len(by_day.get(d.isoformat(), [])) for d in days),
+            "gameWeek": [{"date": d.isoformat(), "games": by_day.get(d.isoformat(), [])} for d in days],
+        }
+
+    def route(path: str):
+        path = path.split("?", 1)[0]
+        if path == "/v1/standings/now":
+            return {"standings": [{"teamAbbrev": {"default": abbr}, "teamName": {"default": abbr}} for abbr in TEAMS]}
+        if path == "/v1/standings-season":
+            return {"seasons": [{"id": SEASON, "standingsStart": "2023-10-10", "standingsEnd": "2024-04-18"}]}
+        if path.startswith("/v1/club-schedule-season/"):
+            abbr = path.split("/")[3]
+            return {"games": [g for g in games if abbr in (g["homeTeam"]["abbrev"], g["awayTeam"]["abbrev"])]}
+        if path.startswith("/v1/schedule/"):
+            return week(date.fromisoformat(path.rsplit("/", 1)[1]))
+        return {"data": []}
+
+    return route
+
+
+def _run(name: str, games: list, latency: float, func) -> None:
+    with LocalServer(_router(games), latency=latency) as server:
+        config = ClientConfig(transport=LocalTransport(server.port), rate_limit=None)
+        with NHLClient(config=config) as client:
+            start = time.perf_counter()
+            found = func(client)
+            elapsed = time.perf_counter() - start
+        print(
+            f"{name:<28} games={found:5d}  requests={server.requests:3d}  "
+            f"bytes={server.bytes_sent / 1024 / 1024:6.2f}MB  time={elapsed * 1000:7.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=50, help="Simulated round trip per request, in ms.")
+    args = parser.parse_args()
+    games = _build_season()
+    latency = args.latency / 1000
+
+    _run("team schedules", games, latency, lambda client: len(client.helpers.game_ids_by_season(str(SEASON))))
+    _run("weekly walk", games, latency, lambda client: sum(1 for _ in client.schedule.season_games(str(SEASON))))
+    _run(
+        "weekly walk, parallel",
+        games,
+        latency,
+        lambda client: sum(1 for _ in client.schedule.season_games(str(SEASON), parallel=True)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,14 @@
-from .nhl_client import NHLClient  # noqa: F401
+# The clients are imported on first use, ``import nhlpy`` alone doesn't load httpx or the API modules.
+__all__ = ["NHLClient", "AsyncNHLClient"]
+
+
+def __getattr__(name: str):
+    if name == "NHLClient":
+        from nhlpy.nhl_client import NHLClient
+
+        return NHLClient
+    if name == "AsyncNHLClient":
+        from nhlpy.async_nhl_client import AsyncNHLClient
+
+        return AsyncNHLClient
+    raise AttributeError(f"module 'nhlpy' has no attribute {name!r}")
@@ -1,5 +1,94 @@
-from typing import Optional, List
-from nhlpy.http_client import HttpClient, Endpoint
+import asyncio
+import time
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional, List, Sequence, Union
+
+import httpx
+
+from nhlpy.concurrency import as_completed_bounded, worker_pool
+from nhlpy.http_client import HttpClient, Endpoint, NHLApiException
+from nhlpy.tables.events import EventTable
+from nhlpy.tables.shifts import ShiftIndex
+
+if TYPE_CHECKING:
+    from nhlpy.archive import DownloadProgress, GameArchive
+
+FINAL_GAME_STATES = frozenset({"FINAL", "OFF"})
+LIVE_GAME_STATES = frozenset({"LIVE", "CRIT"})
+
+
+def _diff(old: Any, new: Any, path: str, changes: Dict[str, Any]) -> None:
+    """Collects the leaves of ``new`` that differ from ``old`` as ``{"dotted.path": new value}``.  Lists are
+    compared item by item, leaves missing from ``new`` are reported as None."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in new.keys() | old.keys():
+            _diff(old.get(key), new.get(key), f"{path}.{key}" if path else key, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        for i in range(max(len(old), len(new))):
+            _diff(old[i] if i < len(old) else None, new[i] if i < len(new) else None, f"{path}.{i}", changes)
+    elif isinstance(new, (dict, list)):
+        _diff({} if isinstance(new, dict) else [], new, path, changes)
+    elif old != new:
+        changes[path] = new
+
+
+class _LiveGame:
+    """What a ``GameCenter.live_game`` subscriber has been told so far, turned into events from each poll."""
+
+    def __init__(self, game_id: str) -> None:
+        self.game_id = game_id
+        self.game_state: Optional[str] = None
+        self.in_intermission = False
+        self._plays: Dict[int, dict] = {}
+        self._boxscore: Dict[str, Any] = {}
+        self._last: Dict[str, bytes] = {}
+
+    def _unchanged(self, name: str, response: httpx.Response) -> bool:
+        """Same body as the previous poll: a 304 replay of the cached copy, or identical bytes."""
+        if self._last.get(name) == response.content:
+            return True
+        self._last[name] = response.content
+        return False
+
+    def play_by_play(self, response: httpx.Response) -> List[dict]:
+        if self._unchanged("play_by_play", response):
+            return []
+        data = response.json()
+        events = []
+        state = data.get("gameState")
+        if state != self.game_state:
+            events.append({"type": "state", "gameId": self.game_id, "gameState": state, "previous": self.game_state})
+            self.game_state = state
+        self.in_intermission = bool((data.get("clock") or {}).get("inIntermission"))
+        for play in data.get("plays", []):
+            event_id = play.get("eventId")
+            seen = self._plays.get(event_id)
+            if seen is None:
+                events.append({"type": "play", "gameId": self.game_id, "play": play})
+            elif seen != play:
+                events.append({"type": "play-updated", "gameId": self.game_id, "play": play})
+            self._plays[event_id] = play
+        return events
+
+    def boxscore(self, response: httpx.Response) -> List[dict]:
+        if self._unchanged("boxscore", response):
+            return []
+        data = response.json()
+        changes: Dict[str, Any] = {}
+        _diff(self._boxscore, data, "", changes)
+        self._boxscore = data
+        return [{"type": "boxscore", "gameId": self.game_id, "changes": changes}] if changes else []
+
+    @property
+    def final(self) -> bool:
+        return self.game_state in FINAL_GAME_STATES
+
+    def interval(self, live: float, intermission: float, pregame: float) -> float:
+        """Seconds to wait before the next poll."""
+        if self.game_state in LIVE_GAME_STATES:
+            return intermission if self.in_intermission else live
+        return intermission if self.final else pregame
 
 
 class GameCenter:
@@ -31,6 +120,106 @@ class GameCenter:
         """
         return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play").json()
 
+    def play_by_play_events(self, game_ids: Iterable[str], events: Optional[EventTable] = None) -> EventTable:
+        """Loads the play-by-play of several games into a compact ``EventTable``.
+
+        Games are fetched concurrently (up to ``ClientConfig.max_concurrency`` ahead of the one being appended) and
+        appended in the order given.  Each response is folded into the table's typed columns and then dropped.
+
+        Args:
+           game_ids (Iterable[str]): Game ids, e.g. from ``Helpers.game_ids_by_season``.
+           events (EventTable, optional): Table to append to, e.g. one built from an earlier season.
+
+        Example:
+           events = client.game_center.play_by_play_events(client.helpers.game_ids_by_season("20232024"))
+           shots = events.select(event_types=SHOT_EVENTS, player_id=8478402)
+
+        Returns:
+           EventTable: The events of every game.
+        """
+        events = EventTable() if events is None else events
+        game_ids = iter(game_ids)
+        window = self.client.config.max_concurrency
+        with worker_pool(window) as pool:
+            # At most ``window`` games are requested ahead of the one being appended, so a slow or retrying game
+            # holds back a bounded number of parsed responses rather than the whole list.
+            pending = deque(pool.submit(self.play_by_play, game_id) for game_id in islice(game_ids, window))
+            while pending:
+                play_by_play = pending.popleft().result()
+                for game_id in islice(game_ids, 1):
+                    pending.append(pool.submit(self.play_by_play, game_id))
+                events.append_game(play_by_play)
+        return events
+
+    def download_games(
+        self,
+        game_ids: Iterable[str],
+        archive: Union[str, "GameArchive"],
+        kinds: Sequence[str] = ("boxscore", "play-by-play"),
+        progress: Optional[Callable[["DownloadProgress"], None]] = None,
+    ) -> "DownloadProgress":
+        """Downloads the ``kinds`` payloads of many games into a compressed ``GameArchive``, resuming where an
+        earlier run stopped.
+
+        Games already stored as final are skipped.  The rest are fetched concurrently (up to
+        ``ClientConfig.max_concurrency`` at once) and each game is written, in one transaction, as soon as all its
+        payloads are in, so an interrupted download loses at most the games in flight.  Bodies are stored as sent,
+        without decoding the JSON.  A game that still fails after the retry policy is recorded in
+        ``progress.failed`` and the download goes on; the next run fetches it again.
+
+        Args:
+           game_ids (Iterable[str]): Game ids, e.g. from ``Helpers.game_ids_by_season``.
+           archive (str | GameArchive): The archive, or the path of its SQLite file.
+           kinds (Sequence[str]): ``gamecenter/{game_id}/{kind}`` resources to fetch per game, e.g. "landing".
+           progress (callable, optional): Called with the ``DownloadProgress`` after each game, ``print`` shows
+              games done, games/s, MB/s and the time left.
+
+        Example:
+           game_ids = client.helpers.game_ids_by_season("20232024")
+           report = client.game_center.download_games(game_ids, "data/20232024.sqlite", progress=print)
+
+        Returns:
+           DownloadProgress: Counts of downloaded, skipped and failed games and the throughput of the run.
+        """
+        from nhlpy.archive import DownloadProgress, GameArchive
+
+        owned = not isinstance(archive, GameArchive)
+        if owned:
+            archive = GameArchive(archive)
+        game_ids = list(dict.fromkeys(str(game_id) for game_id in game_ids))
+        completed = archive.completed(kinds)
+        todo = [game_id for game_id in game_ids if int(game_id) not in completed]
+        report = DownloadProgress(total=len(game_ids), skipped=len(game_ids) - len(todo))
+
+        def fetch(game_id: str) -> Dict[str, bytes]:
+            return {
+                kind: self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/{kind}").content
+                for kind in kinds
+            }
+
+        try:
+            window = self.client.config.max_concurrency
+            with worker_pool(window) as pool:
+                # Each game's payloads are dropped once written, only the games in flight are held in memory.
+                for game_id, future in as_completed_bounded(pool, fetch, todo, window):
+                    try:
+                        payloads = future.result()
+                    except (NHLApiException, httpx.HTTPError) as e:
+                        report.failed[game_id] = e
+                    else:
+                        if not archive.put(game_id, payloads):
+                            report.not_final += 1
+                        report.downloaded += 1
+                        report.bytes += sum(len(body) for body in payloads.values())
+                    report._tick()
+                    if progress is not None:
+                        progress(report)
+        finally:
+            if owned:
+                archive.close()
+        report._tick()
+        return report
+
     def match_up(self, game_id: str) -> dict:
         """Get detailed match up information for a specific NHL game. GameIds can be retrieved
         from the schedule endpoint.
@@ -75,6 +264,22 @@ class GameCenter:
             endpoint=Endpoint.API_STATS, resource=f"en/shiftcharts?cayenneExp={expr_p}&exclude={exclude_p}"
         ).json()
 
+    def shift_index(self, game_id: str) -> ShiftIndex:
+        """Who was on the ice at any moment of a game, built from its shift chart.
+
+        Args:
+           game_id (str): ID of the game.
+
+        Example:
+           index = client.game_center.shift_index("2023020204")
+           index.on_ice(period=2, period_seconds=754)
+           index.annotate(client.game_center.play_by_play("2023020204"))
+
+        Returns:
+           ShiftIndex: See ``nhlpy.tables.ShiftIndex``.
+        """
+        return ShiftIndex.from_shift_chart(self.shift_chart_data(game_id))
+
     def season_series_matchup(self, game_id: str) -> dict:
         """Gets game stats and season series information for a specific game.
 
@@ -98,3 +303,90 @@ class GameCenter:
            Dict containing game story data.
         """
         return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"wsc/game-story/{game_id}").json()
+
+    def live_game(
+        self,
+        game_id: str,
+        boxscore: bool = True,
+        live_interval: float = 5.0,
+        intermission_interval: float = 30.0,
+        pregame_interval: float = 60.0,
+        stop_when_final: bool = True,
+    ) -> Iterator[dict]:
+        """Follows a game as it is played, yielding only what changed since the previous poll.
+
+        Polls the play-by-play (and boxscore) every ``live_interval`` seconds while the puck is in play, slower
+        during intermissions and before the game, and stops once the game is final.  Polls revalidate instead of
+        reading the response cache.  With ``ClientConfig(cache=True)`` they are conditional requests, so an unchanged
+        game costs a 304 and no parsing.  Unchanged bodies are never parsed or diffed either way.
+
+        Events are dicts with a ``type``:
+           - ``state``: ``gameState`` changed (FUT, PRE, LIVE, CRIT, FINAL, OFF), with the ``previous`` one.
+           - ``play``: a new play, ``play`` is the play-by-play entry.
+           - ``play-updated``: a play already yielded was corrected.
+           - ``boxscore``: ``changes`` maps the dotted path of every boxscore field that changed to its new
+             value, e.g. ``{"homeTeam.score": 3, "clock.timeRemaining": "12:41"}``.  The first one holds them all.
+
+        Args:
+           game_id (str): ID of the game to follow.
+           boxscore (bool): Also poll the boxscore and yield its changes.  Defaults to True.
+           live_interval (float): Seconds between polls while the game is being played.  Defaults to 5.
+           intermission_interval (float): Seconds between polls during intermissions.  Defaults to 30.
+           pregame_interval (float): Seconds between polls before the game starts.  Defaults to 60.
+           stop_when_final (bool): End the generator once the game is final.  Defaults to True.
+
+        Example:
+           for event in client.game_center.live_game("2024020345"):
+               if event["type"] == "play" and event["play"]["typeDescKey"] == "goal":
+                   ...
+
+        Returns:
+           Iterator[dict]: Events, as described above.  ``AsyncNHLClient`` exposes it as an async iterator.
+        """
+        tracker = _LiveGame(game_id)
+        while True:
+            response = self.client.get(
+                endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play", revalidate=True
+            )
+            yield from tracker.play_by_play(response)
+            if boxscore:
+                response = self.client.get(
+                    endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/boxscore", revalidate=True
+                )
+                yield from tracker.boxscore(response)
+
+            if tracker.final and stop_when_final:
+                return
+            time.sleep(tracker.interval(live_interval, intermission_interval, pregame_interval))
+
+    async def _async_live_game(
+        self,
+        game_id: str,
+        boxscore: bool = True,
+        live_interval: float = 5.0,
+        intermission_interval: float = 30.0,
+        pregame_interval: float = 60.0,
+        stop_when_final: bool = True,
+    ) -> AsyncIterator[dict]:
+        """``live_game`` for ``AsyncNHLClient``, where ``self.client`` is an ``AsyncHttpClient``.
+
+        Polls are awaited and waits between them use ``asyncio.sleep``, so a subscription doesn't hold one of the
+        client's worker threads for the whole game and stops polling as soon as it is cancelled.
+        """
+        tracker = _LiveGame(game_id)
+        while True:
+            response = await self.client.get(
+                endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play", revalidate=True
+            )
+            for event in tracker.play_by_play(response):
+                yield event
+            if boxscore:
+                response = await self.client.get(
+                    endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/boxscore", revalidate=True
+                )
+                for event in tracker.boxscore(response):
+                    yield event
+
+            if tracker.final and stop_when_final:
+                return
+            await asyncio.sleep(tracker.interval(live_interval, intermission_interval, pregame_interval))
@@ -1,15 +1,35 @@
 import logging
+import threading
 import time
-from typing import List, Any
+import warnings
+from typing import List, Any, Iterator, Optional
 
-from nhlpy.api.query.builder import QueryBuilder
-from nhlpy.api.query.filters.franchise import FranchiseQuery
-from nhlpy.api.query.filters.season import SeasonQuery
-from nhlpy.api.stats import Stats
 from nhlpy.api.teams import Teams
+from nhlpy.concurrency import worker_pool
 from nhlpy.http_client import HttpClient
 
 
+logger = logging.getLogger(__name__)
+
+
+class _CountingClient:
+    """Passes requests through to the http client, counting them so helpers can report their request budget."""
+
+    def __init__(self, http_client) -> None:
+        self._http_client = http_client
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    @property
+    def config(self):
+        return self._http_client.config
+
+    def get(self, *args, **kwargs):
+        with self._lock:
+            self.calls += 1
+        return self._http_client.get(*args, **kwargs)
+
+
 class Helpers:
     def __init__(self, http_client: HttpClient) -> None:
         self.client = http_client
@@ -20,111 +40,177 @@ class Helpers:
         """
         return name[ntype]["default"]
 
-    def game_ids_by_season(self, season: str, game_types: List[int] = None, api_sleep_rate: float = 1) -> List[str]:
+    def _legacy_sleep(self, api_sleep_rate: Optional[float]) -> None:
+        """Honors the deprecated ``api_sleep_rate`` argument when a caller still passes one."""
+        if api_sleep_rate:
+            time.sleep(api_sleep_rate)
+
+    def _warn_sleep_rate(self, api_sleep_rate: Optional[float]) -> None:
+        if api_sleep_rate is not None:
+            warnings.warn(
+                "api_sleep_rate is deprecated, requests are now paced by the client wide rate limiter "
+                "(ClientConfig(rate_limit=...)).",
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+    def _max_workers(self, api_sleep_rate: Optional[float]) -> int:
+        """Threads to fan requests out over.  A legacy ``api_sleep_rate`` keeps the old one at a time pacing."""
+        if api_sleep_rate:
+            return 1
+        return self.client.config.max_concurrency
+
+    def game_ids_by_season(
+        self, season: str, game_types: List[int] = None, api_sleep_rate: Optional[float] = None
+    ) -> List[int]:
         """Gets all game IDs for a specified season.
 
+        Team schedules are fetched concurrently (up to ``ClientConfig.max_concurrency`` at once, paced by the
+        client rate limiter).  Every game shows up on both teams' schedules, duplicates are dropped.
+
         Args:
            season (str): Season to retrieve game IDs for in YYYYYYYY format (e.g., 20232024).
            game_types (List[int]): List of game types to include. Valid types:
                1: Preseason
                2: Regular season
                3: Playoffs
-        api_sleep_rate (float): Sleep rate in seconds between API calls to avoid hitting rate limits.
+           api_sleep_rate (float): Deprecated.  Requests are paced by the client rate limiter,
+               see ClientConfig(rate_limit=...).
 
         Returns:
-           List of game IDs for the specified season and game types.
+           Sorted list of unique game IDs for the specified season and game types.
         """
-        from nhlpy.api.teams import Teams
+        self._warn_sleep_rate(api_sleep_rate)
         from nhlpy.api.schedule import Schedule
 
         teams = Teams(self.client).teams()
-
-        game_ids = []
+        team_abbrs = [team["abbr"] for team in teams if team.get("abbr")]
         schedule_api = Schedule(self.client)
-        for team in teams:
-            team_abbr = team.get("abbr", "")
-            if not team_abbr:
-                continue
 
-            time.sleep(api_sleep_rate)
-            schedule = schedule_api.team_season_schedule(team_abbr, season)
-            games = schedule.get("games", [])
+        def season_schedule(team_abbr: str) -> dict:
+            self._legacy_sleep(api_sleep_rate)
+            return schedule_api.team_season_schedule(team_abbr, season)
+
+        game_ids = set()
+        with worker_pool(self._max_workers(api_sleep_rate)) as pool:
+            for schedule in pool.map(season_schedule, team_abbrs):
+                for game in schedule.get("games", []):
+                    game_id = game.get("id")
+                    if game_id and (not game_types or game.get("gameType") in game_types):
+                        game_ids.add(game_id)
+
+        return sorted(game_ids)
+
+    def _roster_players(self, client, teams: List[dict], season: str, api_sleep_rate: Optional[float]) -> Iterator[dict]:
+        """Every team's roster for the season, fetched concurrently and flattened into cleaned player dicts.  Yields
+        a team's players as soon as its roster (and those of the teams before it) arrived."""
+        teams_client = Teams(client)
+
+        def roster(team: dict) -> dict:
+            self._legacy_sleep(api_sleep_rate)
+            return teams_client.team_roster(team_abbr=team["abbr"], season=season)
+
+        with worker_pool(self._max_workers(api_sleep_rate)) as pool:
+            for team, players in zip(teams, pool.map(roster, teams)):
+                # Tweak and clean some player data.  Copies, the roster payload may be shared through the response cache.
+                for p in players["forwards"] + players["defensemen"] + players["goalies"]:
+                    yield {
+                        **p,
+                        "team": team["abbr"],
+                        "firstName": self._clean_name("firstName", p),
+                        "lastName": self._clean_name("lastName", p),
+                    }
+
+    def all_players(self, season: str, api_sleep_rate: Optional[float] = None) -> List[dict[str, Any]]:
+        """Gets all player base stats.
 
-            for game in games:
-                game_type = game.get("gameType")
-                game_id = game.get("id")
+        Rosters are fetched concurrently, up to ``ClientConfig.max_concurrency`` at once.  See
+        ``iter_all_players`` to stream them instead.
 
-                if game_id and (not game_types or game_type in game_types):
-                    game_ids.append(game_id)
+        Args:
+            api_sleep_rate (float): Deprecated.  Requests are paced by the client rate limiter,
+                see ClientConfig(rate_limit=...).
 
-        return game_ids
+        Returns:
+            List of player base stats.
+        """
+        self._warn_sleep_rate(api_sleep_rate)
+        print("Fetching all player base stats. This may take a while...")
+        teams = Teams(self.client).teams()
+        return list(self._roster_players(self.client, teams, season, api_sleep_rate))
 
-    def all_players(self, season: str, api_sleep_rate: float = 0.5) -> List[dict[str, Any]]:
-        """Gets all player base stats.
+    def iter_all_players(self, season: str) -> Iterator[dict]:
+        """Streams the rows of ``all_players``, team by team as the rosters arrive.
 
         Args:
-            api_sleep_rate (float): Sleep rate in seconds between API calls to avoid hitting rate limits.
+            season (str): Season in YYYYYYYY format (e.g., 20232024).
+
+        Example:
+            with NdjsonSink("players.ndjson") as sink:
+                for season in ("20222023", "20232024"):
+                    sink.write_all(client.helpers.iter_all_players(season))
 
         Returns:
-            List of player base stats.
+            Iterator[dict]: Player base stats.
         """
-        from nhlpy.api.teams import Teams
+        teams = Teams(self.client).teams()
+        yield from self._roster_players(self.client, teams, season, None)
 
-        teams_client = Teams(self.client)
-        teams = teams_client.teams()
+    def all_players_summary_statistics(self, season: str, api_sleep_rate: Optional[float] = None) -> List[dict]:
+        """Gets all player summary statistics for a specified season.
 
-        print("Fetching all player base stats. This may take a while...")
-        out_data = []
-        for team in teams:
-            time.sleep(api_sleep_rate)
-            players = teams_client.roster_by_team(team_abbr=team["abbr"], season=season)
+        One league wide, paginated summary report is joined on ``playerId`` to the players of all 32 rosters
+        (fetched concurrently).  Skaters missing from the rosters are still included, with their stats only.
+        The number of requests used is logged at INFO level.  See ``iter_all_players_summary_statistics`` to
+        stream the rows instead.
 
-            # Tweak and clean some player data
-            for p in players["forwards"] + players["defensemen"] + players["goalies"]:
-                p["team"] = team["abbr"]
-                p["firstName"] = self._clean_name("firstName", p)
-                p["lastName"] = self._clean_name("lastName", p)
+        Args:
+            season (str): Season in YYYYYYYY format (e.g., 20232024).
+            api_sleep_rate (float): Deprecated.  Requests are paced by the client rate limiter,
+                see ClientConfig(rate_limit=...).
 
-                out_data.append(p)
+        Returns:
+            List of summary stats rows merged with the player's roster entry.
+        """
+        self._warn_sleep_rate(api_sleep_rate)
+        return list(self._summary_statistics(season, api_sleep_rate))
 
-        return out_data
+    def iter_all_players_summary_statistics(self, season: str) -> Iterator[dict]:
+        """Streams the rows of ``all_players_summary_statistics``, a page of the summary report at a time.
 
-    def all_players_summary_statistics(self, season: str, api_sleep_rate: float = 1):
-        """Gets all player summary statistics for a specified season."""
-        logging.warning(
-            "This method will take a while to run.  In the event of rate limiting, you may need to increase the api_sleep_rate."
-        )
-        players = self.all_players(season, api_sleep_rate=api_sleep_rate)
-        teams = Teams(self.client).teams()
-        stats_client = Stats(self.client)
+        The rosters are read first (32 requests, held in memory to join on), then rows are yielded as each stats
+        page arrives.
+
+        Args:
+            season (str): Season in YYYYYYYY format (e.g., 20232024).
+
+        Returns:
+            Iterator[dict]: Summary stats rows merged with the player's roster entry.
+        """
+        yield from self._summary_statistics(season, None)
 
-        season_query = SeasonQuery(season_start=season, season_end=season)
-        query_builder = QueryBuilder()
+    def _summary_statistics(self, season: str, api_sleep_rate: Optional[float]) -> Iterator[dict]:
+        client = _CountingClient(self.client)
 
-        out_data = []
-        for team in teams:
-            time.sleep(api_sleep_rate)
-            fran_query = FranchiseQuery(franchise_id=team["franchise_id"])
-            context = query_builder.build(filters=[fran_query, season_query])
+        teams = Teams(client).teams()
+        players_by_id = {p["id"]: p for p in self._roster_players(client, teams, season, api_sleep_rate)}
+        roster_requests = client.calls
 
-            data = stats_client.skater_stats_with_query_context(
-                report_type="summary", query_context=context, aggregate=True
-            )
-            out_data.extend(data.get("data", []))
-
-        # Create a dictionary for fast player lookup by id
-        player_dict = {player["id"]: player for player in players}
-
-        # Merge player data with stats data
-        merged_data = []
-        for stat_entry in out_data:
-            player_id = stat_entry.get("playerId")
-            if player_id and player_id in player_dict:
-                # Merge player data with stats data
-                merged_entry = {**player_dict[player_id], **stat_entry}
-                merged_data.append(merged_entry)
-            else:
-                # Include stats entry even if no matching player found
-                merged_data.append(stat_entry)
-
-        return merged_data
+        # Only this helper needs the query builder and the stats module, imported here to keep client start up lean.
+        from nhlpy.api.query.builder import QueryBuilder
+        from nhlpy.api.query.filters.season import SeasonQuery
+        from nhlpy.api.stats import Stats
+
+        context = QueryBuilder().build(filters=[SeasonQuery(season_start=season, season_end=season)])
+        stats_rows = Stats(client).iter_skater_stats_with_query_context(
+            report_type="summary", query_context=context, aggregate=True
+        )
+
+        for stat_entry in stats_rows:
+            player = players_by_id.get(stat_entry.get("playerId"))
+            yield {**player, **stat_entry} if player else stat_entry
+
+        logger.info(
+            f"all_players_summary_statistics({season}) used {client.calls} requests: "
+            f"{roster_requests} for teams and rosters, {client.calls - roster_requests} for summary stats pages."
+        )
@@ -97,6 +97,29 @@ time_on_ice_default_sorting = [
 ]
 
 
+# Default sort per skater report type, as used by the NHL stats site.
+SKATER_REPORT_SORTING = {
+    "summary": skater_summary_default_sorting,
+    "bios": skater_bios_default_sorting,
+    "faceoffpercentages": faceoffs_default_sorting,
+    "faceoffwins": faceoff_wins_default_sorting,
+    "goalsForAgainst": goalsForAgainst_default_sorting,
+    "realtime": realtime_default_sorting,
+    "penalties": penalties_default_sorting,
+    "penaltykill": penaltyKill_default_sorting,
+    "penaltyShots": penalty_shot_default_sorting,
+    "powerplay": powerplay_default_sorting,
+    "puckPossessions": puckposs_default_sorting,
+    "summaryshooting": summary_shooting_default_sorting,
+    "percentages": percentages_default_sorting,
+    "scoringRates": scoringratesdefault_sorting,
+    "scoringpergame": scoring_per_game_default_sorting,
+    "shootout": shootout_default_scoring,
+    "shottype": shottype_default_sorting,
+    "timeonice": time_on_ice_default_sorting,
+}
+
+
 class SortingOptions:
     @staticmethod
     def get_default_sorting_for_report(report: str) -> List[dict]:
@@ -105,42 +128,13 @@ class SortingOptions:
         :param report:
         :return:
         """
-        if report == "summary":
-            return skater_summary_default_sorting
-        elif report == "bios":
-            return skater_bios_default_sorting
-        elif report == "faceoffpercentages":
-            return faceoffs_default_sorting
-        elif report == "faceoffwins":
-            return faceoff_wins_default_sorting
-        elif report == "goalsForAgainst":
-            return goalsForAgainst_default_sorting
-        elif report == "realtime":
-            return realtime_default_sorting
-        elif report == "penalties":
-            return penalties_default_sorting
-        elif report == "penaltykill":
-            return penaltyKill_default_sorting
-        elif report == "penaltyShots":
-            return penalty_shot_default_sorting
-        elif report == "powerplay":
-            return powerplay_default_sorting
-        elif report == "puckPossessions":
-            return puckposs_default_sorting
-        elif report == "summaryshooting":
-            return summary_shooting_default_sorting
-        elif report == "percentages":
-            return percentages_default_sorting
-        elif report == "scoringRates":
-            return scoringratesdefault_sorting
-        elif report == "scoringpergame":
-            return scoring_per_game_default_sorting
-        elif report == "shootout":
-            return shootout_default_scoring
-        elif report == "shottype":
-            return shottype_default_sorting
-        elif report == "timeonice":
-            return time_on_ice_default_sorting
-        else:
+        try:
+            return SKATER_REPORT_SORTING[report]
+        except KeyError:
             logger.info("No default sort criteria setup for this report type, defaulting to skater summary")
             return skater_summary_default_sorting
+
+    @staticmethod
+    def is_known_report(report: str) -> bool:
+        """True when ``report`` is a skater report type with default sorting set up."""
+        return report in SKATER_REPORT_SORTING
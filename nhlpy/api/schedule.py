@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Optional, List
+from datetime import date as date_cls, datetime, timedelta
+from typing import Iterator, Optional, List
 
+from nhlpy.api.standings import Standings
+from nhlpy.concurrency import worker_pool
 from nhlpy.http_client import HttpClient, Endpoint
 
+_WEEK = timedelta(days=7)
+
 
 class Schedule:
     def __init__(self, http_client: HttpClient) -> None:
@@ -162,3 +166,85 @@ class Schedule:
         """
 
         return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-bracket/{year}").json()
+
+    def season_games(
+        self, season: str, game_types: Optional[List[int]] = None, parallel: bool = False
+    ) -> Iterator[dict]:
+        """Yields every game of a season by walking the league wide weekly schedule.
+
+        A season takes around 30 requests and every game is downloaded once, where walking the 32 team schedules
+        downloads each game twice.  Games come out in date order as each week's page arrives.
+
+        Args:
+            season (str): Season in YYYYYYYY format (e.g., "20232024").
+            game_types (List[int], optional): Only yield these game types (1: Preseason, 2: Regular season,
+                3: Playoffs).  Defaults to every game.
+            parallel (bool): Defaults to False.  Pre-computes the week start dates and fetches those pages
+                concurrently (up to ``ClientConfig.max_concurrency`` at once) instead of following
+                ``nextStartDate`` one page at a time.
+
+        Returns:
+            Iterator[dict]: Game stubs from the schedule's ``gameWeek``, each with its ``gameDate`` added.
+
+        Raises:
+            ValueError: When the season isn't listed in ``Standings.season_standing_manifest``.
+        """
+        seen = set()
+        for page in self._season_weeks(season, game_types, parallel):
+            for day in page.get("gameWeek", []):
+                for game in day.get("games", []):
+                    if game.get("id") in seen or str(game.get("season", season)) != str(season):
+                        continue
+                    if game_types and game.get("gameType") not in game_types:
+                        continue
+                    seen.add(game.get("id"))
+                    yield {**game, "gameDate": day.get("date")}
+
+    def _season_weeks(self, season: str, game_types: Optional[List[int]], parallel: bool) -> Iterator[dict]:
+        """Weekly schedule pages covering the season, in date order.
+
+        The walk is anchored on the regular season start from the manifest.  That first page also carries the
+        preseason start and playoff end dates, which bound the rest of the walk.
+        """
+        manifest = next(
+            (m for m in Standings(self.client).season_standing_manifest() if str(m.get("id")) == str(season)), None
+        )
+        if manifest is None:
+            raise ValueError(f"Unknown season {season}.")
+
+        anchor_date = manifest["standingsStart"]
+        anchor = self.weekly_schedule(anchor_date)
+        first = anchor_date
+        if (not game_types or 1 in game_types) and anchor.get("preSeasonStartDate"):
+            first = min(first, anchor["preSeasonStartDate"])
+        last = anchor.get("regularSeasonEndDate") or manifest["standingsEnd"]
+        if not game_types or 3 in game_types:
+            last = anchor.get("playoffEndDate") or last
+
+        anchor_day = date_cls.fromisoformat(anchor_date)
+        weeks_before = -(-(anchor_day - date_cls.fromisoformat(first)).days // 7)
+        before = [(anchor_day - _WEEK * k).isoformat() for k in range(weeks_before, 0, -1)]
+
+        if not parallel:
+            for week in before:
+                yield self.weekly_schedule(week)
+            yield anchor
+            week = anchor.get("nextStartDate")
+            while week and week <= last:
+                page = self.weekly_schedule(week)
+                yield page
+                week = page.get("nextStartDate")
+            return
+
+        after = []
+        week_day = anchor_day + _WEEK
+        while week_day.isoformat() <= last:
+            after.append(week_day.isoformat())
+            week_day += _WEEK
+
+        with worker_pool(self.client.config.max_concurrency) as pool:
+            pages = pool.map(self.weekly_schedule, before + after)
+            for _ in before:
+                yield next(pages)
+            yield anchor
+            yield from pages
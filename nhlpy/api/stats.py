@@ -1,10 +1,34 @@
 import json
-from typing import List
+from collections import deque
+from itertools import chain, islice
+from typing import Callable, Dict, Iterator, List, Union
 
 from nhlpy.api.query.builder import QueryContext
 from nhlpy.api.query.filters import _goalie_stats_sorts
 from nhlpy.api.query.sorting.sorting_options import SortingOptions
+from nhlpy.concurrency import worker_pool
 from nhlpy.http_client import HttpClient, Endpoint
+from nhlpy.tables import ColumnarTable
+
+
+# Columns every skater / goalie report carries with the same value.  Kept once when joining reports.
+_SHARED_COLUMNS = frozenset(
+    {
+        "playerId",
+        "seasonId",
+        "skaterFullName",
+        "goalieFullName",
+        "lastName",
+        "positionCode",
+        "shootsCatches",
+        "teamAbbrevs",
+        "gamesPlayed",
+    }
+)
+
+
+def _join_key(row: dict) -> tuple:
+    return row.get("playerId"), row.get("seasonId")
 
 
 class Stats:
@@ -130,7 +154,8 @@ class Stats:
         limit: int = 50,
         fact_cayenne_exp: str = "gamesPlayed>1",
         default_cayenne_exp: str = None,
-    ) -> List[dict]:
+        columnar: bool = False,
+    ) -> Union[List[dict], ColumnarTable]:
         """Retrieves team summary statistics across one or more seasons.
 
         Gets aggregated team statistics for a specified range of seasons with optional filtering and sorting.
@@ -158,6 +183,8 @@ class Stats:
             default_cayenne_exp (str, optional): Additional Apache Cayenne filter.
                 Example: "gameTypeId=2 and seasonId<=20232024 and seasonId>=20232024"
                 If provided, overrides the automatically generated expression.
+            columnar (bool, optional): Defaults False.  Return the rows as a ``ColumnarTable`` (typed column
+                arrays, exportable to NumPy / Arrow) instead of a list of dicts.
 
         Returns:
             List[dict]: List of dictionaries containing team summary statistics
@@ -193,11 +220,69 @@ class Stats:
               'winsInShootout': 3},
               ... ]
         """
+        q_params = self._team_summary_params(
+            start_season,
+            end_season,
+            game_type_id,
+            is_game,
+            is_aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        q_params.update(start=start, limit=limit)
+        data = self.client.get(endpoint=Endpoint.API_STATS, resource="en/team/summary", query_params=q_params).json()[
+            "data"
+        ]
+        return ColumnarTable.from_rows(data) if columnar else data
+
+    def iter_team_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        game_type_id: int = 2,
+        is_game: bool = False,
+        is_aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        fact_cayenne_exp: str = "gamesPlayed>1",
+        default_cayenne_exp: str = None,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Streams every row of ``team_summary``, fetching pages as needed.  See ``_paginate``.
+
+        Args:
+            Same as ``team_summary``, minus ``start`` / ``limit``.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: Team summary rows, in ``sort_expr`` order.
+        """
+        q_params = self._team_summary_params(
+            start_season,
+            end_season,
+            game_type_id,
+            is_game,
+            is_aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        yield from self._paginate("en/team/summary", q_params, page_size)
+
+    def _team_summary_params(
+        self,
+        start_season,
+        end_season,
+        game_type_id,
+        is_game,
+        is_aggregate,
+        sort_expr,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
         q_params = {
             "isAggregate": is_aggregate,
             "isGame": is_game,
-            "start": start,
-            "limit": limit,
             "factCayenneExp": fact_cayenne_exp,
         }
 
@@ -212,10 +297,7 @@ class Stats:
         if not default_cayenne_exp:
             default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
         q_params["cayenneExp"] = default_cayenne_exp
-
-        return self.client.get(endpoint=Endpoint.API_STATS, resource="en/team/summary", query_params=q_params).json()[
-            "data"
-        ]
+        return q_params
 
     def skater_stats_summary(
         self,
@@ -229,7 +311,8 @@ class Stats:
         limit: int = 25,
         fact_cayenne_exp: str = "gamesPlayed>=1",
         default_cayenne_exp: str = None,
-    ) -> List[dict]:
+        columnar: bool = False,
+    ) -> Union[List[dict], ColumnarTable]:
         """Gets simplified skater statistics summary for specified seasons and franchises.
 
         Retrieves aggregated or season-by-season skating statistics with optional filtering and sorting.
@@ -257,6 +340,8 @@ class Stats:
             fact_cayenne_exp (str, optional): Base filter criteria. Defaults to 'gamesPlayed>=1'
                 Can be modified for custom filtering
             default_cayenne_exp (str, optional): Additional filter expression
+            columnar (bool, optional): Defaults False.  Return the rows as a ``ColumnarTable`` (typed column
+                arrays, exportable to NumPy / Arrow) instead of a list of dicts.
 
         Returns:
             List[dict]: List of dictionaries containing skater statistics
@@ -294,11 +379,69 @@ class Stats:
               'timeOnIcePerGame': 1207.1341},
               ... ]
         """
+        q_params = self._skater_stats_summary_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        q_params.update(start=start, limit=limit)
+        data = self.client.get(endpoint=Endpoint.API_STATS, resource="en/skater/summary", query_params=q_params).json()[
+            "data"
+        ]
+        return ColumnarTable.from_rows(data) if columnar else data
+
+    def iter_skater_stats_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Streams every row of ``skater_stats_summary``, fetching pages as needed.  See ``_paginate``.
+
+        Args:
+            Same as ``skater_stats_summary``, minus ``start`` / ``limit``.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: Skater summary rows, in ``sort_expr`` order.
+        """
+        q_params = self._skater_stats_summary_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        yield from self._paginate("en/skater/summary", q_params, page_size)
+
+    def _skater_stats_summary_params(
+        self,
+        start_season,
+        end_season,
+        franchise_id,
+        game_type_id,
+        aggregate,
+        sort_expr,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
         q_params = {
             "isAggregate": aggregate,
             "isGame": False,
-            "start": start,
-            "limit": limit,
             "factCayenneExp": fact_cayenne_exp,
         }
 
@@ -315,10 +458,7 @@ class Stats:
             if franchise_id:
                 default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
         q_params["cayenneExp"] = default_cayenne_exp
-
-        return self.client.get(endpoint=Endpoint.API_STATS, resource="en/skater/summary", query_params=q_params).json()[
-            "data"
-        ]
+        return q_params
 
     def skater_stats_with_query_context(
         self,
@@ -328,7 +468,8 @@ class Stats:
         aggregate: bool = False,
         start: int = 0,
         limit: int = 25,
-    ) -> dict:
+        columnar: bool = False,
+    ) -> Union[dict, ColumnarTable]:
         """Retrieves skater statistics using a query context and specified report type.
 
         Gets detailed skater statistics with customizable filtering, sorting, and aggregation options.
@@ -352,6 +493,8 @@ class Stats:
                 When False, returns separate entries per season. Defaults to False.
             start (int, optional): Starting index for pagination. Defaults to 0.
             limit (int, optional): Maximum number of results to return. Defaults to 25.
+            columnar (bool, optional): Defaults False.  Return the ``data`` rows as a ``ColumnarTable`` (typed
+                column arrays, exportable to NumPy / Arrow) instead of the response dict.
 
         Returns:
             dict: Dictionary containing skater statistics based on the specified report type
@@ -402,22 +545,180 @@ class Stats:
            'timeOnIcePerGame': 904.5714},
            ...]
         """
-        q_params = {
+        q_params = self._skater_query_context_params(query_context, report_type, sort_expr, aggregate)
+        q_params.update(start=start, limit=limit)
+        response = self.client.get(
+            endpoint=Endpoint.API_STATS, resource=f"en/skater/{report_type}", query_params=q_params
+        ).json()
+        return ColumnarTable.from_rows(response.get("data", [])) if columnar else response
+
+    def iter_skater_stats_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_type: str,
+        sort_expr: List[dict] = None,
+        aggregate: bool = False,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Streams every row of ``skater_stats_with_query_context``, fetching pages as needed.  See ``_paginate``.
+
+        Args:
+            Same as ``skater_stats_with_query_context``, minus ``start`` / ``limit``.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: The report's ``data`` rows, in ``sort_expr`` order.
+        """
+        q_params = self._skater_query_context_params(query_context, report_type, sort_expr, aggregate)
+        yield from self._paginate(f"en/skater/{report_type}", q_params, page_size)
+
+    def _skater_query_context_params(self, query_context, report_type, sort_expr, aggregate) -> dict:
+        if not sort_expr:
+            sort_expr = SortingOptions.get_default_sorting_for_report(report_type)
+        return self._query_context_params(query_context, sort_expr, aggregate)
+
+    def _query_context_params(self, query_context: QueryContext, sort_expr: List[dict], aggregate: bool) -> dict:
+        return {
             "isAggregate": aggregate,
             "isGame": False,
-            "start": start,
-            "limit": limit,
             "factCayenneExp": query_context.fact_query,
+            "sort": json.dumps(sort_expr),
+            "cayenneExp": query_context.query_str,
         }
 
-        if not sort_expr:
-            sort_expr = SortingOptions.get_default_sorting_for_report(report_type)
+    def skater_reports_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_types: List[str],
+        aggregate: bool = False,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Joins several skater reports into one row per player (per season unless ``aggregate``).
 
-        q_params["sort"] = json.dumps(sort_expr)
-        q_params["cayenneExp"] = query_context.query_str
-        return self.client.get(
-            endpoint=Endpoint.API_STATS, resource=f"en/skater/{report_type}", query_params=q_params
-        ).json()
+        Every report is fetched concurrently and in full through the paginated stats API.  Rows of the first
+        report are streamed and left joined, on ``playerId`` / ``seasonId``, to hash tables built from the others.
+        Columns every report carries (names, position, team, games played) are kept once.  Any other column name
+        already taken by an earlier report is prefixed with its report type, e.g. ``realtime_timeOnIcePerGame``.
+
+        Args:
+            query_context (QueryContext): Filters shared by every report, see ``skater_stats_with_query_context``.
+            report_types (List[str]): Report types to join, e.g. ['summary', 'realtime', 'timeonice'].  Rows come
+                from the first one.
+            aggregate (bool, optional): When True, combines multiple seasons' data per player. Defaults to False.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: One merged row per player (and season).
+
+        Raises:
+            ValueError: For an unknown report type.
+
+        Example:
+            rows = client.stats.skater_reports_with_query_context(
+                query_context=query_builder.build(filters=[SeasonQuery("20232024", "20232024")]),
+                report_types=["summary", "realtime", "timeonice", "powerplay", "puckPossessions"],
+            )
+        """
+        unknown = [r for r in report_types if not SortingOptions.is_known_report(r)]
+        if unknown:
+            raise ValueError(f"Unknown skater report type(s): {', '.join(unknown)}.")
+        yield from self._join_reports(
+            "skater", report_types, query_context, aggregate, page_size, SortingOptions.get_default_sorting_for_report
+        )
+
+    def goalie_reports_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_types: List[str],
+        aggregate: bool = False,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Goalie counterpart of ``skater_reports_with_query_context``.
+
+        Args:
+            query_context (QueryContext): Filters shared by every report.
+            report_types (List[str]): Goalie report types to join, see ``goalie_stats_summary`` stats_type.
+            aggregate (bool, optional): When True, combines multiple seasons' data per goalie. Defaults to False.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: One merged row per goalie (and season).
+
+        Raises:
+            ValueError: For an unknown report type.
+        """
+        unknown = [r for r in report_types if _goalie_stats_sorts(report=r) == [{}]]
+        if unknown:
+            raise ValueError(f"Unknown goalie report type(s): {', '.join(unknown)}.")
+        yield from self._join_reports("goalie", report_types, query_context, aggregate, page_size, _goalie_stats_sorts)
+
+    def _join_reports(
+        self,
+        player_type: str,
+        report_types: List[str],
+        query_context: QueryContext,
+        aggregate: bool,
+        page_size: int,
+        default_sorting: Callable[[str], List[dict]],
+    ) -> Iterator[dict]:
+        """Hash join of several reports on (playerId, seasonId), streaming the first report's rows."""
+        if not report_types:
+            return
+
+        def report_rows(report_type: str, window: int = None) -> Iterator[dict]:
+            q_params = self._query_context_params(query_context, default_sorting(report_type), aggregate)
+            return self._paginate(f"en/{player_type}/{report_type}", q_params, page_size, window)
+
+        def hash_table(report_type: str) -> Dict[tuple, dict]:
+            return {_join_key(row): row for row in report_rows(report_type, window)}
+
+        probe_report, build_reports = report_types[0], report_types[1:]
+        probe = report_rows(probe_report)
+
+        # The requests made while the hash tables are built share the max_concurrency budget: the probe report's
+        # first page takes one slot (none if that is all there is), the build reports split the rest.
+        concurrency = self.client.config.max_concurrency
+        overlap_probe = concurrency > 1 and bool(build_reports)
+        budget = concurrency - 1 if overlap_probe else concurrency
+        builders = max(1, min(len(build_reports), budget))
+        window = max(1, budget // builders)
+        with worker_pool(builders) as pool:
+            futures = [pool.submit(hash_table, report_type) for report_type in build_reports]
+            # Only the probe report's first page is fetched here; its other pages are fetched once the hash tables
+            # are built, as the rows are consumed.
+            first = next(probe, None) if overlap_probe else None
+            tables = [future.result() for future in futures]
+        if not overlap_probe:
+            first = next(probe, None)
+        if first is None:
+            return
+
+        # Column names are resolved once per report from a sample row, so every output row has the same shape.
+        seen = set(first)
+        renames = []
+        for report_type, table in zip(build_reports, tables):
+            columns = next(iter(table.values()), {}).keys()
+            rename = {}
+            for column in columns:
+                if column in _SHARED_COLUMNS:
+                    rename[column] = None if column in seen else column
+                else:
+                    rename[column] = f"{report_type}_{column}" if column in seen else column
+            seen.update(columns)
+            renames.append(rename)
+
+        for row in chain((first,), probe):
+            merged = dict(row)
+            key = _join_key(row)
+            for table, rename in zip(tables, renames):
+                other = table.get(key)
+                if other is None:
+                    continue
+                for column, value in other.items():
+                    name = rename.get(column, column)
+                    if name is not None:
+                        merged.setdefault(name, value)
+            yield merged
 
     def goalie_stats_summary(
         self,
@@ -432,7 +733,8 @@ class Stats:
         limit: int = 25,
         fact_cayenne_exp: str = None,
         default_cayenne_exp: str = None,
-    ) -> List[dict]:
+        columnar: bool = False,
+    ) -> Union[List[dict], ColumnarTable]:
         """Retrieves goalie statistics with various filtering and aggregation options.
 
         A simple endpoint that returns different types of goalie statistics based on the specified stats_type parameter.
@@ -457,6 +759,8 @@ class Stats:
             limit (int, optional): Defaults to 25. Maximum number of results to return
             fact_cayenne_exp (str, optional): Base filter criteria
             default_cayenne_exp (str, optional): Additional filter expression
+            columnar (bool, optional): Defaults False.  Return the rows as a ``ColumnarTable`` (typed column
+                arrays, exportable to NumPy / Arrow) instead of a list of dicts.
 
         Returns:
             dict: Dictionary containing goalie statistics based on the specified parameters
@@ -488,11 +792,74 @@ class Stats:
               'timeOnIce': 119145,
               'wins': 25},
         """
+        q_params = self._goalie_stats_summary_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        q_params.update(start=start, limit=limit)
+        response = self.client.get(
+            endpoint=Endpoint.API_STATS, resource=f"en/goalie/{stats_type}", query_params=q_params
+        ).json()
+        data = response.get("data", [])
+        return ColumnarTable.from_rows(data) if columnar else data
+
+    def iter_goalie_stats_summary(
+        self,
+        start_season: str,
+        end_season: str = None,
+        stats_type: str = "summary",
+        game_type_id: int = 2,
+        franchise_id: str = None,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        fact_cayenne_exp: str = None,
+        default_cayenne_exp: str = None,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Streams every row of ``goalie_stats_summary``, fetching pages as needed.  See ``_paginate``.
+
+        Args:
+            Same as ``goalie_stats_summary``, minus ``start`` / ``limit``.
+            page_size (int, optional): Rows per request. Defaults to 100.
+
+        Returns:
+            Iterator[dict]: Goalie rows, in ``sort_expr`` order.
+        """
+        q_params = self._goalie_stats_summary_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        yield from self._paginate(f"en/goalie/{stats_type}", q_params, page_size)
+
+    def _goalie_stats_summary_params(
+        self,
+        start_season,
+        end_season,
+        stats_type,
+        game_type_id,
+        franchise_id,
+        aggregate,
+        sort_expr,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
         q_params = {
             "isAggregate": aggregate,
             "isGame": False,
-            "start": start,
-            "limit": limit,
             "factCayenneExp": fact_cayenne_exp,
         }
 
@@ -511,8 +878,30 @@ class Stats:
             default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
 
         q_params["cayenneExp"] = default_cayenne_exp
+        return q_params
 
-        response = self.client.get(
-            endpoint=Endpoint.API_STATS, resource=f"en/goalie/{stats_type}", query_params=q_params
-        ).json()
-        return response.get("data", [])
+    def _paginate(self, resource: str, q_params: dict, page_size: int, window: int = None) -> Iterator[dict]:
+        """Yields every row of a stats REST report, in order.
+
+        The first page gives the report's ``total``.  The remaining pages are fetched concurrently, but at most
+        ``window`` (by default ``ClientConfig.max_concurrency``) pages are requested ahead of the consumer, so
+        memory stays bounded however large the report is.  Rows are yielded as soon as their page and every page
+        before it is in.
+        """
+
+        def page(start: int) -> dict:
+            params = {**q_params, "start": start, "limit": page_size}
+            return self.client.get(endpoint=Endpoint.API_STATS, resource=resource, query_params=params).json()
+
+        first = page(0)
+        yield from first.get("data", [])
+
+        starts = iter(range(page_size, first.get("total", 0), page_size))
+        window = window or self.client.config.max_concurrency
+        with worker_pool(window) as pool:
+            pending = deque(pool.submit(page, start) for start in islice(starts, window))
+            while pending:
+                rows = pending.popleft().result().get("data", [])
+                for start in islice(starts, 1):
+                    pending.append(pool.submit(page, start))
+                yield from rows
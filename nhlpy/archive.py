@@ -0,0 +1,160 @@
+"""Compressed, resumable store of per game payloads, filled by ``GameCenter.download_games``.
+
+    archive = GameArchive("data/20232024.sqlite")
+    client.game_center.download_games(client.helpers.game_ids_by_season("20232024"), archive, progress=print)
+    boxscore = archive.load(2023020204, "boxscore")
+
+A game is checkpointed once every requested payload of it is stored and it is final, so rerunning the same
+download after a crash, a ctrl-c or failed games only fetches what is missing.  Games that weren't final yet (not
+played, or still live) are stored but fetched again on the next run.
+"""
+
+import json
+import time
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from nhlpy.sqlite_store import SQLiteStore, is_final_game_payload
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    game_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (game_id, kind)
+);
+"""
+
+
+class GameArchive(SQLiteStore):
+    """Per game payloads (``boxscore``, ``play-by-play``, ...) stored as zlib compressed JSON in a SQLite file.
+
+    Bodies are kept exactly as the API sent them.  Like ``DiskCache`` the file runs in WAL mode and each thread
+    gets its own connection, so a reader can query it while a download is writing.
+    """
+
+    _schema = _SCHEMA
+
+    def __init__(self, path: str, compress_level: int = 6) -> None:
+        """
+        :param path: str.  SQLite file to use, created if missing.
+        :param compress_level: int, Defaults to 6.  zlib level for stored bodies.
+        """
+        self.compress_level = compress_level
+        super().__init__(path)
+
+    def put(self, game_id, payloads: Dict[str, bytes]) -> bool:
+        """Stores every payload of one game in a single transaction, the checkpoint of that game.  Returns whether
+        the game is final, i.e. won't be fetched again."""
+        final = any(is_final_game_payload(body) for body in payloads.values())
+        now = time.time()
+        rows = []
+        for kind, body in payloads.items():
+            compressed = zlib.compress(body, self.compress_level)
+            rows.append((int(game_id), kind, compressed, len(compressed), int(final), now))
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO payloads (game_id, kind, body, size, final, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return final
+
+    def get(self, game_id, kind: str) -> Optional[bytes]:
+        """The stored body of ``kind`` for the game, None when there is none."""
+        row = (
+            self._connection()
+            .execute("SELECT body FROM payloads WHERE game_id = ? AND kind = ?", (int(game_id), kind))
+            .fetchone()
+        )
+        return zlib.decompress(row[0]) if row is not None else None
+
+    def load(self, game_id, kind: str, decoder: Callable[[bytes], object] = json.loads):
+        """The stored payload, decoded.
+
+        Raises:
+            KeyError: When the game's ``kind`` payload was never stored.
+        """
+        body = self.get(game_id, kind)
+        if body is None:
+            raise KeyError((game_id, kind))
+        return decoder(body)
+
+    def completed(self, kinds: Iterable[str]) -> Set[int]:
+        """Ids of the final games that have every one of ``kinds`` stored."""
+        kinds = list(kinds)
+        placeholders = ", ".join("?" * len(kinds))
+        rows = self._connection().execute(
+            f"SELECT game_id FROM payloads WHERE final AND kind IN ({placeholders}) "
+            f"GROUP BY game_id HAVING COUNT(*) = ?",
+            (*kinds, len(kinds)),
+        )
+        return {game_id for (game_id,) in rows}
+
+    def items(self, kind: str) -> Iterator[Tuple[int, bytes]]:
+        """``(game_id, body)`` of every stored ``kind`` payload, in game id order."""
+        rows = self._connection().execute("SELECT game_id, body FROM payloads WHERE kind = ? ORDER BY game_id", (kind,))
+        for game_id, body in rows:
+            yield game_id, zlib.decompress(body)
+
+    def game_ids(self) -> Set[int]:
+        return {game_id for (game_id,) in self._connection().execute("SELECT DISTINCT game_id FROM payloads")}
+
+    def __contains__(self, game_id) -> bool:
+        query = "SELECT 1 FROM payloads WHERE game_id = ? LIMIT 1"
+        return self._connection().execute(query, (int(game_id),)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(DISTINCT game_id) FROM payloads").fetchone()[0]
+
+    @property
+    def size_bytes(self) -> int:
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM payloads").fetchone()[0]
+
+
+class DownloadProgress:
+    """Where a ``GameCenter.download_games`` run stands.  Handed to the ``progress`` callback after each game and
+    returned at the end; ``str()`` gives a one line status."""
+
+    def __init__(self, total: int, skipped: int) -> None:
+        self.total = total
+        self.skipped = skipped
+        self.downloaded = 0
+        # Stored, but not final yet, so fetched again next run.
+        self.not_final = 0
+        self.bytes = 0
+        self.failed: Dict[str, BaseException] = {}
+        self.started = time.monotonic()
+        self.elapsed = 0.0
+
+    @property
+    def done(self) -> int:
+        """Games finished this run or skipped as already checkpointed, failures included."""
+        return self.skipped + self.downloaded + len(self.failed)
+
+    @property
+    def games_per_second(self) -> float:
+        return (self.downloaded + len(self.failed)) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left at the current rate, None until there is a rate."""
+        rate = self.games_per_second
+        return (self.total - self.done) / rate if rate else None
+
+    def _tick(self) -> None:
+        self.elapsed = time.monotonic() - self.started
+
+    def __str__(self) -> str:
+        eta = f", eta {self.eta:.0f}s" if self.eta is not None else ""
+        return (
+            f"{self.done}/{self.total} games ({self.skipped} skipped, {len(self.failed)} failed), "
+            f"{self.games_per_second:.1f} games/s, {self.bytes_per_second / 1024 / 1024:.2f} MB/s{eta}"
+        )
@@ -0,0 +1,236 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import _SubApi
+
+if TYPE_CHECKING:
+    import httpx
+
+    from nhlpy.http_client import AsyncHttpClient, Endpoint
+    from nhlpy.metrics import MetricsCollector
+
+
+class _LoopHttpClient:
+    """Blocking ``HttpClient`` look-alike handed to the sync API classes while they run on a worker thread.
+
+    Each ``get`` is scheduled on the event loop's ``AsyncHttpClient`` and the worker waits for the result,
+    so every request goes through the shared async connection pool.
+    """
+
+    def __init__(self, http_client: "AsyncHttpClient", loop: asyncio.AbstractEventLoop) -> None:
+        self._http_client = http_client
+        self._loop = loop
+
+    @property
+    def config(self):
+        return self._http_client.config
+
+    def get(
+        self, endpoint: "Endpoint", resource: str, query_params: dict = None, revalidate: bool = False
+    ) -> "httpx.Response":
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            raise RuntimeError("Blocking NHL API call made on the event loop thread, this would deadlock.")
+
+        coro = self._http_client.get(
+            endpoint=endpoint, resource=resource, query_params=query_params, revalidate=revalidate
+        )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+class _AsyncApi:
+    """Base for the generated async sub APIs.  See ``_async_api``."""
+
+    _api_cls = None
+
+    def __init__(self, http_client: "AsyncHttpClient", executor: ThreadPoolExecutor) -> None:
+        self._http_client = http_client
+        self._executor = executor
+
+    def _bind(self, loop: asyncio.AbstractEventLoop):
+        return self._api_cls(http_client=_LoopHttpClient(self._http_client, loop))
+
+
+def _coroutine_method(name: str, func):
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        bound = getattr(self._bind(loop), name)
+        # Run in the caller's context, so context managers like nhlpy.decoding.raw_responses() apply.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, functools.partial(context.run, bound, *args, **kwargs))
+
+    return method
+
+
+def _native_method(name: str, func, native):
+    if inspect.isasyncgenfunction(native):
+
+        @functools.wraps(func)
+        async def generator_method(self, *args, **kwargs):
+            generator = native(self._api_cls(http_client=self._http_client), *args, **kwargs)
+            try:
+                async for item in generator:
+                    yield item
+            finally:
+                await generator.aclose()
+
+        return generator_method
+
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        return await native(self._api_cls(http_client=self._http_client), *args, **kwargs)
+
+    return method
+
+
+def _async_generator_method(name: str, func):
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        generator = getattr(self._bind(loop), name)(*args, **kwargs)
+        context = contextvars.copy_context()
+        exhausted = object()
+        step = None
+        try:
+            while True:
+                step = self._executor.submit(context.run, next, generator, exhausted)
+                item = await asyncio.wrap_future(step)
+                if item is exhausted:
+                    return
+                yield item
+        finally:
+            # Cancelling the await above doesn't stop a ``next()`` already running on its worker.  Let it return
+            # first, closing a generator that is still executing raises ValueError and leaves it running.
+            if step is not None and not step.done():
+                await asyncio.wait([asyncio.wrap_future(step)])
+            await loop.run_in_executor(self._executor, generator.close)
+
+    return method
+
+
+@functools.lru_cache(maxsize=None)
+def _async_api(api_cls):
+    """Generates the async mirror of a sync API class.
+
+    Every public method becomes a coroutine (generator methods become async generators).  The sync method
+    body runs on the client's bounded executor while its HTTP calls are awaited on the event loop, so the
+    sync class stays the single definition of each endpoint.
+
+    A method that shouldn't hold a worker thread, like a long running poller, can have a native version named
+    ``_async_<name>`` on the sync class.  It is called on an instance built over the ``AsyncHttpClient`` instead.
+    """
+    namespace = {"_api_cls": api_cls, "__doc__": api_cls.__doc__}
+    for name, func in inspect.getmembers(api_cls, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        native = getattr(api_cls, f"_async_{name}", None)
+        if native is not None:
+            namespace[name] = _native_method(name, func, native)
+        elif inspect.isgeneratorfunction(func):
+            namespace[name] = _async_generator_method(name, func)
+        else:
+            namespace[name] = _coroutine_method(name, func)
+    return type(f"Async{api_cls.__name__}", (_AsyncApi,), namespace)
+
+
+class AsyncNHLClient:
+    """
+    asyncio version of the NHLClient.  Exposes the same sub modules and methods, as coroutines.
+
+        async with AsyncNHLClient() as client:
+            boxscores = await asyncio.gather(*(client.game_center.boxscore(game_id) for game_id in game_ids))
+
+    At most ``max_concurrency`` calls run at once, the rest wait their turn.
+    """
+
+    def __init__(
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        max_concurrency: int = 10,
+        config: Optional[ClientConfig] = None,
+    ) -> None:
+        """
+        :param follow_redirects: bool.  Some of these endpoints use redirects (ew).
+        :param debug: bool, Defaults to False.  Set to True for extra logging.
+        :param timeout: int, Defaults to 10 seconds.
+        :param ssl_verify: bool, Defaults to True.  Set to false if you want to ignore SSL verification.
+        :param max_concurrency: int, Defaults to 10.  How many calls may be in flight at once.
+        :param config: ClientConfig, optional.  Full configuration.  When supplied the other keyword arguments
+        are ignored.
+        """
+        if config is None:
+            config = ClientConfig(
+                debug=debug,
+                timeout=timeout,
+                ssl_verify=ssl_verify,
+                follow_redirects=follow_redirects,
+                max_concurrency=max_concurrency,
+            )
+        self._config = config
+        self._executor = ThreadPoolExecutor(max_workers=self._config.max_concurrency, thread_name_prefix="nhlpy")
+        self._http: Optional["AsyncHttpClient"] = None
+        self._http_lock = threading.Lock()
+
+    teams = _SubApi("nhlpy.api.teams", "Teams")
+    standings = _SubApi("nhlpy.api.standings", "Standings")
+    schedule = _SubApi("nhlpy.api.schedule", "Schedule")
+    game_center = _SubApi("nhlpy.api.game_center", "GameCenter")
+    stats = _SubApi("nhlpy.api.stats", "Stats")
+    misc = _SubApi("nhlpy.api.misc", "Misc")
+    helpers = _SubApi("nhlpy.api.helpers", "Helpers")
+    players = _SubApi("nhlpy.api.players", "Players")
+    edge = _SubApi("nhlpy.api.edge", "Edge")
+
+    @property
+    def _http_client(self) -> "AsyncHttpClient":
+        """The pooled HTTP client, created with the first sub module."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    from nhlpy.http_client import AsyncHttpClient
+
+                    self._http = AsyncHttpClient(self._config)
+        return self._http
+
+    def _build_api(self, api_cls):
+        return _async_api(api_cls)(self._http_client, self._executor)
+
+    @property
+    def config(self) -> ClientConfig:
+        """The configuration this client was built with."""
+        return self._config
+
+    @property
+    def request_stats(self) -> dict:
+        """Request counters (requests, retries, ...) for this client.  See ``HttpClient.stats``."""
+        return self._http.stats if self._http is not None else {}
+
+    @property
+    def metrics(self) -> Optional["MetricsCollector"]:
+        """Per endpoint and resource metrics, when enabled with ``ClientConfig(metrics=True)``.  See nhlpy.metrics."""
+        return self._config.metrics
+
+    async def aclose(self) -> None:
+        """Wait for in flight calls, then close the underlying HTTP connection pool."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncNHLClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
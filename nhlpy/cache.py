@@ -0,0 +1,194 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+import httpx
+
+from nhlpy.decoding import _raw
+from nhlpy.responses import JsonResponse
+
+if TYPE_CHECKING:
+    from nhlpy.http_client import Endpoint
+
+# (resource regex, ttl seconds), first match wins.  Matched against the resource, e.g. "en/franchise".
+DEFAULT_TTL_RULES: Tuple[Tuple[str, float], ...] = (
+    # Reference data, changes a handful of times a season.
+    (r"^(stats/rest/)?en/(glossary|country|franchise|config|season|draft)\b", 24 * 60 * 60),
+    (r"^standings-season$", 24 * 60 * 60),
+    # Live data.
+    (r"^score/now$", 10),
+    (r"(^|/)now$", 30),
+)
+DEFAULT_TTL = 60.0
+
+# Rough per entry bookkeeping cost (key, headers, response object) counted towards max_bytes.
+_ENTRY_OVERHEAD = 512
+
+_UNPARSED = object()
+
+
+def cache_key(endpoint: "Endpoint", resource: str, query_params: Optional[dict] = None) -> str:
+    """Cache key for a request, query params are sorted so their order doesn't matter."""
+    if not query_params:
+        return f"{endpoint.name}:{resource}"
+    return f"{endpoint.name}:{resource}?{urlencode(sorted((str(k), str(v)) for k, v in query_params.items()))}"
+
+
+class CachedResponse(JsonResponse):
+    """A response replayed from the cache.  ``.json()`` decodes the body once and returns that same object on
+    every later call, so callers must treat it as read only."""
+
+    _parsed = _UNPARSED
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, decoder=None) -> "CachedResponse":
+        if isinstance(response, CachedResponse):
+            return response
+        return super().from_response(response, decoder)
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._parsed is not _UNPARSED
+
+    def json(self, **kwargs):
+        if kwargs or _raw.get():
+            return super().json(**kwargs)
+        if self._parsed is _UNPARSED:
+            self._parsed = self.decoder(self.content)
+        return self._parsed
+
+
+class CacheEntry:
+    __slots__ = ("response", "size", "expires_at", "etag", "last_modified")
+
+    def __init__(self, response: CachedResponse, size: int, expires_at: float) -> None:
+        self.response = response
+        self.size = size
+        self.expires_at = expires_at
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class ResponseCache:
+    """In memory LRU cache of successful responses, bounded by entry count and total body bytes.
+
+    Entries expire after a TTL picked per resource from ``ttl_rules``.  Thread safe, one instance can be shared by
+    sync and async clients.  Responses are handed out as ``CachedResponse``, whose parsed JSON is shared between
+    callers.
+
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` header are kept (still subject to LRU eviction) so
+    the client can revalidate them with a conditional request and, on a 304, ``refresh`` them instead of
+    downloading and parsing the payload again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_rules: Optional[Sequence[Tuple[str, float]]] = None,
+        default_ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_entries: int, Defaults to 1024.  Least recently used entries are evicted past this.
+        :param max_bytes: int, Defaults to 64MB.  Least recently used entries are evicted past this many bytes.
+        :param ttl_rules: list of (regex, seconds), optional.  Checked before ``DEFAULT_TTL_RULES``.  A ttl of 0
+        disables caching for matching resources.
+        :param default_ttl: float, Defaults to 60.  TTL for resources no rule matches.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._rules = [(re.compile(pattern), ttl) for pattern, ttl in (*(ttl_rules or ()), *DEFAULT_TTL_RULES)]
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    key = staticmethod(cache_key)
+
+    def ttl_for(self, resource: str) -> float:
+        for pattern, ttl in self._rules:
+            if pattern.search(resource):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        """The cached response if it is still fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                if not entry.revalidatable:
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def conditional_headers(self, key: Hashable) -> Optional[Dict[str, str]]:
+        """``If-None-Match`` / ``If-Modified-Since`` headers to revalidate an entry, None if there's none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.revalidatable:
+                return None
+            headers = {}
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            return headers
+
+    def refresh(self, key: Hashable, resource: str, not_modified: httpx.Response) -> Optional[CachedResponse]:
+        """The server answered 304 for ``key``.  Restarts the entry's TTL and returns the cached response, or None
+        if the entry was evicted in the meantime."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = self._clock() + self.ttl_for(resource)
+            entry.etag = not_modified.headers.get("ETag", entry.etag)
+            entry.last_modified = not_modified.headers.get("Last-Modified", entry.last_modified)
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def set(self, key: Hashable, resource: str, response: httpx.Response) -> httpx.Response:
+        """Caches the response.  Returns the ``CachedResponse`` now stored, or ``response`` when it isn't cached."""
+        ttl = self.ttl_for(resource)
+        if ttl <= 0:
+            return response
+        size = len(response.content) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return response
+        cached = CachedResponse.from_response(response)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(cached, size, self._clock() + ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return cached
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
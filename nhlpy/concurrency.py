@@ -0,0 +1,41 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@contextmanager
+def worker_pool(max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """Thread pool for fanning requests out, usually sized by ``ClientConfig.max_concurrency``.
+
+    On exit it waits for the calls already running but cancels queued ones, so a consumer that stops early (an
+    error, a generator closed half way) doesn't pay for requests nobody will read.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nhlpy")
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def as_completed_bounded(
+    pool: ThreadPoolExecutor, fn: Callable[[T], object], items: Iterable[T], window: int
+) -> Iterator[Tuple[T, Future]]:
+    """Runs ``fn(item)`` for each of ``items`` on ``pool``, with at most ``window`` calls submitted at once, and
+    yields ``(item, future)`` as each one completes.
+
+    Unlike ``concurrent.futures.as_completed`` over every item, finished results aren't held until the whole
+    batch is done: a result is only referenced until the consumer moves on, so at most about ``2 * window``
+    results are alive at once, however many items there are.
+    """
+    items = iter(items)
+    pending = {pool.submit(fn, item): item for item in islice(items, window)}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            for following in islice(items, 1):
+                pending[pool.submit(fn, following)] = following
+            yield item, future
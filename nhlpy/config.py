@@ -1,12 +1,149 @@
+from typing import TYPE_CHECKING, Optional
+
+from nhlpy.decoding import JsonDecoder, get_decoder
+from nhlpy.metrics import Hooks, MetricsCollector
+from nhlpy.rate_limiter import RateLimiter
+from nhlpy.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from nhlpy.cache import ResponseCache
+    from nhlpy.disk_cache import DiskCache
+
+
 class ClientConfig:
     def __init__(
-        self, debug: bool = False, timeout: int = 10, ssl_verify: bool = True, follow_redirects: bool = True
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_connections_per_host: Optional[int] = None,
+        transport=None,
+        async_transport=None,
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = 10.0,
+        rate_limit_burst: int = 10,
+        host_rate_limits: Optional[dict] = None,
+        max_retries: int = 3,
+        retry_backoff_factor: float = 0.5,
+        retry_backoff_max: float = 30.0,
+        cache=False,
+        cache_max_entries: int = 1024,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_ttls: Optional[list] = None,
+        disk_cache=None,
+        disk_cache_max_bytes: int = 512 * 1024 * 1024,
+        coalesce_requests: bool = True,
+        json_decoder="auto",
+        event_hooks: Optional[dict] = None,
+        metrics=False,
     ) -> None:
+        """
+        :param max_connections: int, Defaults to 100.  Upper bound on open connections in the shared pool.
+        :param max_keepalive_connections: int, Defaults to 20.  Idle connections kept around for reuse.
+        :param keepalive_expiry: float, Defaults to 5 seconds.  How long an idle connection stays in the pool.
+        :param max_connections_per_host: int, optional.  When set, each NHL API host (api-web.nhle.com,
+        api.nhle.com) gets its own pool capped at this many connections.
+        :param transport: httpx transport, optional.  Swaps out the network layer entirely (mock/local
+        transports).  When supplied the pool limits above are the transport's responsibility.
+        :param async_transport: httpx async transport, optional.  Same as ``transport`` for the AsyncNHLClient.
+        :param max_concurrency: int, Defaults to 10.  Upper bound on calls the AsyncNHLClient runs at once.
+        :param rate_limit: float, Defaults to 10.  Requests per second allowed against each NHL API host, shared by
+        every thread and task using this config.  None disables rate limiting.
+        :param rate_limit_burst: int, Defaults to 10.  Requests allowed back to back before ``rate_limit`` applies.
+        :param host_rate_limits: dict, optional.  Per host ``(rate, burst)`` overrides keyed by ``Endpoint`` or
+        host name, e.g. ``{Endpoint.API_STATS: (2, 5)}``.
+        :param max_retries: int, Defaults to 3.  Retries for GETs failing with 429, 5xx or a connection error.
+        0 disables retrying.
+        :param retry_backoff_factor: float, Defaults to 0.5.  Base of the jittered exponential backoff, in seconds.
+        A Retry-After header from the server takes precedence.
+        :param retry_backoff_max: float, Defaults to 30.  Cap on a single backoff delay, in seconds.
+        :param cache: bool or ResponseCache, Defaults to False.  True keeps successful responses in an in memory
+        LRU cache so repeated lookups skip the network.  Pass a ResponseCache to share one between configs.
+        :param cache_max_entries: int, Defaults to 1024.  Entry cap for the in memory cache.
+        :param cache_max_bytes: int, Defaults to 64MB.  Body size cap for the in memory cache.
+        :param cache_ttls: list of (regex, seconds), optional.  Per resource TTLs checked before the built in ones,
+        e.g. ``[(r"^club-schedule-season/", 3600)]``.  See nhlpy.cache.DEFAULT_TTL_RULES.
+        :param disk_cache: str or DiskCache, optional.  Path of a SQLite file persisting responses that can never
+        change (finished games, past seasons) across restarts.  Safe to share between worker processes.
+        :param disk_cache_max_bytes: int, Defaults to 512MB.  Cap on compressed bodies kept in the disk cache.
+        :param coalesce_requests: bool, Defaults to True.  Identical GETs issued while one is already in flight
+        wait for it and share its response instead of going to the network again.
+        :param json_decoder: str or callable, Defaults to "auto".  Decoder behind ``response.json()``: "auto" uses
+        orjson or msgspec when installed and the stdlib json otherwise, "orjson" / "msgspec" / "json" pick one, or
+        pass any ``bytes -> object`` callable.  See nhlpy.decoding.
+        :param event_hooks: dict, optional.  Callables per request event, e.g. ``{"on_retry": [log_retry]}``.  Events
+        are before_request, after_response, on_retry, on_error and on_cache_hit, see nhlpy.metrics.
+        :param metrics: bool or MetricsCollector, Defaults to False.  True aggregates count, latency percentiles,
+        bytes, decode time and errors per endpoint and resource into ``config.metrics``, exportable with
+        ``to_dict()`` / ``to_prometheus()``.  Pass a MetricsCollector to share one between configs.
+        """
         self.debug = debug
         self.timeout = timeout
         self.ssl_verify = ssl_verify
         self.follow_redirects = follow_redirects
 
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.max_connections_per_host = max_connections_per_host
+        self.transport = transport
+        self.async_transport = async_transport
+        self.max_concurrency = max_concurrency
+
+        # Built once here so every client created from this config draws from the same buckets.
+        self.rate_limiter: Optional[RateLimiter] = None
+        if rate_limit or host_rate_limits:
+            self.rate_limiter = RateLimiter(rate=rate_limit, burst=rate_limit_burst, host_limits=host_rate_limits)
+
+        self.retry_policy = RetryPolicy(
+            max_retries=max_retries, backoff_factor=retry_backoff_factor, backoff_max=retry_backoff_max
+        )
+
+        # The caches import httpx (and sqlite3), only pulled in when enabled.  Compared to None/False rather than
+        # tested for truth, an empty cache instance is falsy.
+        self.cache: Optional["ResponseCache"] = None
+        if cache is not None and cache is not False:
+            from nhlpy.cache import ResponseCache
+
+            if isinstance(cache, ResponseCache):
+                self.cache = cache
+            elif cache:
+                self.cache = ResponseCache(
+                    max_entries=cache_max_entries, max_bytes=cache_max_bytes, ttl_rules=cache_ttls
+                )
+
+        self.disk_cache: Optional["DiskCache"] = None
+        if disk_cache is not None and disk_cache is not False:
+            from nhlpy.disk_cache import DiskCache
+
+            if isinstance(disk_cache, DiskCache):
+                self.disk_cache = disk_cache
+            elif disk_cache:
+                self.disk_cache = DiskCache(disk_cache, max_bytes=disk_cache_max_bytes)
+
+        self.coalesce_requests = coalesce_requests
+        # "auto" is resolved on first use, importing orjson / msgspec costs more than the rest of the client set up.
+        # A decoder asked for by name is resolved now, so a missing one fails here.
+        self._json_decoder_setting = json_decoder
+        self._json_decoder = None if json_decoder is None or json_decoder == "auto" else get_decoder(json_decoder)
+
+        self.hooks = Hooks(event_hooks)
+        self.metrics: Optional[MetricsCollector] = None
+        if metrics:
+            self.metrics = metrics if isinstance(metrics, MetricsCollector) else MetricsCollector()
+            self.metrics.register(self.hooks)
+
         self.api_web_base_url = "https://api-web.nhle.com"
         self.api_base_url = "https://api.nhle.com"
         self.api_web_api_ver = "/v1/"
+
+    @property
+    def json_decoder(self) -> JsonDecoder:
+        """The ``bytes -> object`` function behind ``response.json()``."""
+        if self._json_decoder is None:
+            self._json_decoder = get_decoder(self._json_decoder_setting)
+        return self._json_decoder
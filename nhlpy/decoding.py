@@ -0,0 +1,72 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Union
+
+JsonDecoder = Callable[[bytes], Any]
+
+# Headers describing the wire encoding of the body.  Copied responses hold the decoded body, so these are dropped.
+WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+_raw = ContextVar("nhlpy_raw_responses", default=False)
+
+
+def _orjson() -> JsonDecoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> JsonDecoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+_DECODERS = {"orjson": _orjson, "msgspec": _msgspec, "json": lambda: json.loads}
+
+
+def get_decoder(decoder: Union[str, JsonDecoder, None] = "auto") -> JsonDecoder:
+    """Resolves a ``ClientConfig(json_decoder=...)`` setting to a ``bytes -> object`` function.
+
+    ``"auto"`` (or None) picks orjson, then msgspec, whichever is installed, falling back to the stdlib ``json``.
+    ``"orjson"``, ``"msgspec"`` and ``"json"`` ask for one explicitly, any other callable is used as is.
+
+    Raises:
+        ImportError: The requested decoder isn't installed.
+        ValueError: Unknown decoder name.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None or decoder == "auto":
+        for name in ("orjson", "msgspec"):
+            try:
+                return _DECODERS[name]()
+            except ImportError:
+                continue
+        return json.loads
+    if decoder not in _DECODERS:
+        raise ValueError(f"Unknown json_decoder {decoder!r}, expected one of 'auto', {', '.join(map(repr, _DECODERS))}")
+    try:
+        return _DECODERS[decoder]()
+    except ImportError as e:
+        raise ImportError(f"json_decoder={decoder!r} needs {decoder}, `pip install {decoder}`.") from e
+
+
+@contextmanager
+def raw_responses() -> Iterator[None]:
+    """Within the block, API methods that hand back a payload untouched return its undecoded bytes instead.
+
+    For callers that persist payloads as they come, skipping the JSON decode entirely:
+
+        with raw_responses():
+            body = client.game_center.play_by_play("2023020204")  # bytes
+
+    Applies to the current thread or task.  Methods that reshape the payload (``Teams.teams``, the helpers, ...)
+    need the decoded JSON and are not meant to be called in raw mode.
+    """
+    token = _raw.set(True)
+    try:
+        yield
+    finally:
+        _raw.reset(token)
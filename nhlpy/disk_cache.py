@@ -0,0 +1,188 @@
+import json
+import re
+import time
+import zlib
+from datetime import date
+from typing import Callable, Optional, Sequence, Tuple
+
+import httpx
+
+from nhlpy.decoding import WIRE_HEADERS
+from nhlpy.sqlite_store import SQLiteStore, is_final_game_payload
+
+_SEASON = re.compile(r"/(\d{8})(/|$)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    immutable INTEGER NOT NULL,
+    expires_at REAL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def is_finished_game(resource: str, response: httpx.Response) -> bool:
+    """Play-by-play and boxscore payloads of games whose ``gameState`` is OFF/FINAL never change again."""
+    return is_final_game_payload(response.content)
+
+
+def is_past_season(resource: str, response: httpx.Response, today: Optional[date] = None) -> bool:
+    """True when the resource is scoped to a season (YYYYYYYY path segment) that ended before today.
+
+    A season is treated as over once July 1st of its end year has passed, after the playoffs.
+    """
+    match = _SEASON.search(resource)
+    if not match:
+        return False
+    end_year = int(match.group(1)[4:])
+    today = today or date.today()
+    return (today.year, today.month) >= (end_year, 7)
+
+
+def _request_url(response: httpx.Response) -> str:
+    try:
+        return str(response.request.url)
+    except RuntimeError:
+        return ""
+
+
+# (resource regex, predicate(resource, response)), a response is immutable when a matching rule's predicate holds.
+DEFAULT_IMMUTABLE_RULES: Tuple[Tuple[str, Callable[[str, httpx.Response], bool]], ...] = (
+    (r"^gamecenter/\d+/(play-by-play|boxscore)$", is_finished_game),
+    (r"^roster/[A-Z]{3}/\d{8}$", is_past_season),
+    (r"^club-schedule-season/[A-Z]{3}/\d{8}$", is_past_season),
+    (r"^player/\d+/game-log/\d{8}/\d$", is_past_season),
+)
+
+
+class DiskCache(SQLiteStore):
+    """Persistent, compressed response cache backed by SQLite, for historical data that never changes.
+
+    By default only immutable responses are stored: finished games' play-by-play and boxscores and past seasons'
+    rosters, schedules and game logs (see ``DEFAULT_IMMUTABLE_RULES``).  Set ``ttl`` to also keep everything else
+    for that many seconds.
+
+    Several threads and worker processes on the same host can share one cache file.  SQLite runs in WAL mode so
+    readers never block the writer, and each thread gets its own connection.  When the stored bodies grow past
+    ``max_bytes`` the least recently read entries are evicted.
+    """
+
+    _schema = _SCHEMA
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: float = 0,
+        immutable_rules: Optional[Sequence[Tuple[str, Callable[[str, httpx.Response], bool]]]] = None,
+        compress_level: int = 6,
+    ) -> None:
+        """
+        :param path: str.  SQLite file to use, created if missing.
+        :param max_bytes: int, Defaults to 512MB.  Cap on the compressed bodies stored.
+        :param ttl: float, Defaults to 0.  Seconds to keep responses that aren't immutable, 0 skips them.
+        :param immutable_rules: list of (regex, predicate), optional.  Replaces ``DEFAULT_IMMUTABLE_RULES``.
+        :param compress_level: int, Defaults to 6.  zlib level for stored bodies.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compress_level = compress_level
+        rules = DEFAULT_IMMUTABLE_RULES if immutable_rules is None else immutable_rules
+        self._rules = [(re.compile(pattern), predicate) for pattern, predicate in rules]
+        self._writes_since_evict = 0
+        super().__init__(path)
+
+    def is_immutable(self, resource: str, response: httpx.Response) -> bool:
+        path = resource.split("?", 1)[0]
+        return any(pattern.search(path) and predicate(path, response) for pattern, predicate in self._rules)
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT url, status, headers, body, expires_at, accessed_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, body, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        # Access times only steer eviction, refreshing them at most once a minute keeps reads cheap.
+        if now - accessed_at > 60:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return httpx.Response(
+            status,
+            headers=json.loads(headers),
+            content=zlib.decompress(body),
+            request=httpx.Request("GET", url) if url else None,
+        )
+
+    def set(self, key: str, resource: str, response: httpx.Response) -> None:
+        immutable = self.is_immutable(resource, response)
+        if not immutable and self.ttl <= 0:
+            return
+        body = zlib.compress(response.content, self.compress_level)
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in WIRE_HEADERS]
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, url, status, headers, body, size, immutable, expires_at, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                _request_url(response),
+                response.status_code,
+                json.dumps(headers),
+                body,
+                len(body),
+                int(immutable),
+                None if immutable else now + self.ttl,
+                now,
+                now,
+            ),
+        )
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= 50:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drops expired entries, then least recently read ones until under ``max_bytes``.  Returns rows deleted."""
+        self._writes_since_evict = 0
+        conn = self._connection()
+        deleted = conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        removed = deleted.rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return removed
+
+        target = total - int(self.max_bytes * 0.9)
+        with self._transaction():
+            freed = 0
+            keys = []
+            for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                keys.append((key,))
+                freed += size
+                if freed >= target:
+                    break
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+        return removed + len(keys)
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    @property
+    def size_bytes(self) -> int:
+        return self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
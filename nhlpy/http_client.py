@@ -1,9 +1,19 @@
+import asyncio
+import threading
+import time
+from collections import Counter
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
 
 import httpx
 import logging
 
+from nhlpy.cache import cache_key
+from nhlpy.metrics import RequestEvent
+from nhlpy.responses import JsonResponse
+from nhlpy.retry import parse_retry_after
+
 
 class Endpoint(Enum):
     API_WEB_V1 = "https://api-web.nhle.com/v1/"
@@ -66,9 +76,24 @@ class UnauthorizedException(NHLApiException):
         super().__init__(message, status_code, NHLApiErrorCode.UNAUTHORIZED)
 
 
-class HttpClient:
+def _endpoint_origins() -> List[str]:
+    """Unique scheme://host origins across all endpoints, API_CORE and API_STATS share one."""
+    origins = []
+    for endpoint in Endpoint:
+        parts = urlsplit(endpoint.value)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin not in origins:
+            origins.append(origin)
+    return origins
+
+
+class _BaseHttpClient:
+    """Config, logging and response handling shared by the sync and async http clients."""
+
     def __init__(self, config) -> None:
         self._config = config
+        self._stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
         self._logger = logging.getLogger(__name__)
         if self._config.debug:
             self._logger.setLevel(logging.DEBUG)
@@ -80,6 +105,166 @@ class HttpClient:
         else:
             self._logger.setLevel(logging.WARNING)
 
+    @property
+    def config(self):
+        return self._config
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Counters for this client: ``requests`` sent, ``retries`` (also broken down as ``retries_<status>``
+        and ``retries_transport_error``), ``retry_wait_seconds`` spent backing off, cache hits and misses, and
+        for revalidated responses ``not_modified`` (304s), ``bytes_saved`` (body bytes not downloaded again) and
+        ``parses_saved`` (responses handed out with their JSON already decoded), and ``coalesced``, calls that
+        shared the response of an identical request already in flight."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _emit(self, name: str, endpoint: Endpoint, resource: str, query_params: Optional[dict], **fields) -> None:
+        """Runs the config's hooks for event ``name``, see nhlpy.metrics."""
+        if self._config.hooks:
+            self._config.hooks.emit(RequestEvent(name, endpoint, resource, query_params, **fields))
+
+    def _retry_delay(
+        self,
+        endpoint: Endpoint,
+        resource: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+        query_params: Optional[dict] = None,
+    ) -> Optional[float]:
+        """Seconds to wait before retrying, or None when the failure should surface to the caller.
+
+        A 429 also penalizes the shared rate limiter, slowing every request to that host, not just this one.
+        """
+        policy = self._config.retry_policy
+        status_code = response.status_code if response is not None else None
+        if policy is None or not policy.should_retry(attempt, status_code):
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        delay = policy.delay(attempt, retry_after)
+        if status_code == 429 and self._config.rate_limiter is not None:
+            self._config.rate_limiter.penalize(endpoint, delay)
+
+        self._count("retries")
+        self._count(f"retries_{status_code}" if status_code else "retries_transport_error")
+        self._count("retry_wait_seconds", delay)
+        self._emit(
+            "on_retry", endpoint, resource, query_params, attempt=attempt, response=response, error=error, delay=delay
+        )
+        self._logger.info(f"Retrying GET {resource} in {delay:.2f}s (retry {attempt + 1}): {status_code or error!r}")
+        return delay
+
+    def _cache_key(self, endpoint: Endpoint, resource: str, query_params: Optional[dict]) -> Optional[str]:
+        if self._config.cache is None and self._config.disk_cache is None:
+            return None
+        return cache_key(endpoint, resource, query_params)
+
+    def _flight_key(self, endpoint: Endpoint, resource: str, query_params: Optional[dict]) -> Optional[str]:
+        """Identifies identical GETs for coalescing, None when coalescing is off."""
+        if not self._config.coalesce_requests:
+            return None
+        return cache_key(endpoint, resource, query_params)
+
+    def _cache_lookup(self, endpoint: Endpoint, key: Optional[str], resource: str) -> Optional[httpx.Response]:
+        """Memory cache first, then the disk cache.  Disk hits are promoted into memory."""
+        if key is None:
+            return None
+        memory, disk = self._config.cache, self._config.disk_cache
+        if memory is not None:
+            cached = memory.get(key)
+            if cached is not None:
+                self._count("cache_hits")
+                if cached.is_parsed:
+                    self._count("parses_saved")
+                return cached
+        if disk is not None:
+            cached = disk.get(key)
+            if cached is not None:
+                self._count("disk_cache_hits")
+                cached = self._decoded(cached, endpoint, resource)
+                if memory is not None:
+                    cached = memory.set(key, resource, cached)
+                return cached
+        self._count("cache_misses")
+        return None
+
+    def _decoded(
+        self, response: httpx.Response, endpoint: Optional[Endpoint] = None, resource: Optional[str] = None
+    ) -> httpx.Response:
+        """The response to hand out, with ``.json()`` going through the configured decoder, timed when collecting
+        metrics."""
+        if isinstance(response, JsonResponse) or not isinstance(response, httpx.Response):
+            return response
+        decoder = self._config.json_decoder
+        if self._config.metrics is not None and endpoint is not None:
+            decoder = self._config.metrics.timed(decoder, endpoint, resource)
+        return JsonResponse.from_response(response, decoder)
+
+    def _cache_store(self, key: Optional[str], resource: str, response: httpx.Response) -> httpx.Response:
+        """Stores a fresh response and returns the one to hand to the caller."""
+        if key is None:
+            return response
+        if self._config.disk_cache is not None:
+            self._config.disk_cache.set(key, resource, response)
+        if self._config.cache is not None:
+            response = self._config.cache.set(key, resource, response)
+        return response
+
+    def _conditional_headers(self, key: Optional[str]) -> Optional[Dict[str, str]]:
+        """Validators of the memory cache entry (expired, or being revalidated), sent so the server can answer 304
+        Not Modified."""
+        if key is None or self._config.cache is None:
+            return None
+        return self._config.cache.conditional_headers(key)
+
+    def _revalidated(self, key: str, resource: str, response: httpx.Response) -> Optional[httpx.Response]:
+        """The server answered 304, the cached copy is still current.  None if it was evicted meanwhile."""
+        cached = self._config.cache.refresh(key, resource, response)
+        if cached is None:
+            return None
+        self._count("not_modified")
+        self._count("bytes_saved", len(cached.content))
+        if cached.is_parsed:
+            self._count("parses_saved")
+        return cached
+
+    def _on_success(self, endpoint: Endpoint) -> None:
+        if self._config.rate_limiter is not None:
+            self._config.rate_limiter.recover(endpoint)
+
+    def _limits(self, max_connections: Optional[int] = None) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections or self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
+
+    def _client_kwargs(self, transport, transport_cls) -> dict:
+        """httpx client arguments from config.  ``transport_cls`` is the sync or async HTTP transport class."""
+        client_kwargs = {
+            "verify": self._config.ssl_verify,
+            "timeout": self._config.timeout,
+            "follow_redirects": self._config.follow_redirects,
+            "limits": self._limits(),
+        }
+        if transport is not None:
+            client_kwargs["transport"] = transport
+        elif self._config.max_connections_per_host:
+            # One pool per NHL host so a slow api.nhle.com crawl can't starve api-web.nhle.com calls.
+            client_kwargs["mounts"] = {
+                origin: transport_cls(
+                    verify=self._config.ssl_verify, limits=self._limits(self._config.max_connections_per_host)
+                )
+                for origin in _endpoint_origins()
+            }
+        return client_kwargs
+
     def _handle_response(self, response: httpx.Response, url: str) -> None:
         """Handle different HTTP status codes and raise appropriate exceptions"""
 
@@ -111,12 +296,69 @@ class HttpClient:
         else:
             raise NHLApiException(f"Unexpected error: {error_message}", response.status_code)
 
-    def get(self, endpoint: Endpoint, resource: str, query_params: dict = None) -> httpx.Response:
+
+class _Flight:
+    """A GET in flight, the response (or error) its waiters get once it lands."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class HttpClient(_BaseHttpClient):
+    """Thin wrapper around a long lived ``httpx.Client``.
+
+    The underlying connection pool is created on the first request and shared by every sub API on the
+    ``NHLClient``, so consecutive calls reuse open TCP/TLS connections instead of handshaking each time.
+    Call ``close()`` (or use the client as a context manager) to release the pool.
+    """
+
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+
+    def _build_client(self) -> httpx.Client:
+        """Builds the pooled httpx client from config."""
+        return httpx.Client(**self._client_kwargs(self._config.transport, httpx.HTTPTransport))
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared, pooled ``httpx.Client``.  Created lazily, and recreated if used after ``close()``."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def close(self) -> None:
+        """Close the connection pool.  Safe to call more than once."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(
+        self, endpoint: Endpoint, resource: str, query_params: dict = None, revalidate: bool = False
+    ) -> httpx.Response:
         """
         Private method to make a get request to the NHL API.  This wraps the lib httpx functionality.
         :param query_params:
         :param endpoint:
         :param resource:
+        :param revalidate: Skip a fresh cache hit and check with the server instead, with a conditional request
+            when the cached copy has an ETag / Last-Modified.  Used by pollers that must not miss an update.
         :return: httpx.Response
         :raises:
             ResourceNotFoundException: When the resource is not found
@@ -129,13 +371,234 @@ class HttpClient:
             url=f"{self._config.api_web_base_url}{self._config.api_web_api_ver}{resource}"
             )
         """
-        with httpx.Client(
-            verify=self._config.ssl_verify, timeout=self._config.timeout, follow_redirects=self._config.follow_redirects
-        ) as client:
-            full_url = f"{endpoint.value}{resource}"
+        key = self._cache_key(endpoint, resource, query_params)
+        if not revalidate:
+            cached = self._cache_lookup(endpoint, key, resource)
+            if cached is not None:
+                self._emit("on_cache_hit", endpoint, resource, query_params, response=cached)
+                return cached
+
+        flight_key = self._flight_key(endpoint, resource, query_params)
+        if flight_key is None:
+            return self._fetch(endpoint, resource, query_params, key)
+
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            self._count("coalesced")
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = self._fetch(endpoint, resource, query_params, key)
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[flight_key]
+            flight.done.set()
+
+    def _fetch(
+        self, endpoint: Endpoint, resource: str, query_params: Optional[dict], key: Optional[str]
+    ) -> httpx.Response:
+        """The network half of ``get``: a (conditional) GET, error handling and storing the response."""
+        try:
+            conditional = self._conditional_headers(key)
+            r = self._send(endpoint, resource, query_params, conditional)
+            if r.status_code == 304 and conditional:
+                revalidated = self._revalidated(key, resource, r)
+                if revalidated is not None:
+                    self._on_success(endpoint)
+                    return revalidated
+                r = self._send(endpoint, resource, query_params)
+            self._handle_response(r, resource)
+        except Exception as e:
+            self._emit("on_error", endpoint, resource, query_params, error=e)
+            raise
+        self._on_success(endpoint)
+        return self._cache_store(key, resource, self._decoded(r, endpoint, resource))
+
+    def _send(
+        self, endpoint: Endpoint, resource: str, query_params: Optional[dict], headers: Optional[dict] = None
+    ) -> httpx.Response:
+        """Sends the GET, pacing it through the rate limiter and retrying per the retry policy."""
+        full_url = f"{endpoint.value}{resource}"
+        request_kwargs = {"headers": headers} if headers else {}
+        attempt = 0
+        while True:
+            if self._config.rate_limiter is not None:
+                self._config.rate_limiter.acquire(endpoint)
             if self._config.debug:
                 self._logger.debug(f"GET: {full_url}")
-            r: httpx.Response = client.get(url=full_url, params=query_params)
+            self._count("requests")
+            self._emit("before_request", endpoint, resource, query_params, attempt=attempt)
+            start = time.perf_counter()
+            try:
+                r: httpx.Response = self.client.get(url=full_url, params=query_params, **request_kwargs)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(endpoint, resource, attempt, error=e, query_params=query_params)
+                if delay is None:
+                    raise
+            else:
+                elapsed = time.perf_counter() - start
+                self._emit(
+                    "after_response", endpoint, resource, query_params, attempt=attempt, response=r, elapsed=elapsed
+                )
+                delay = self._retry_delay(endpoint, resource, attempt, response=r, query_params=query_params)
+                if delay is None:
+                    break
+            time.sleep(delay)
+            attempt += 1
+        return r
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """asyncio counterpart of ``HttpClient``, backed by a long lived ``httpx.AsyncClient``.
+
+    The pool is bound to the event loop it is first used on.
+    """
 
-        self._handle_response(r, resource)
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._flights: Dict[str, asyncio.Future] = {}
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Builds the pooled httpx async client from config."""
+        return httpx.AsyncClient(**self._client_kwargs(self._config.async_transport, httpx.AsyncHTTPTransport))
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared, pooled ``httpx.AsyncClient``.  Created lazily, and recreated if used after ``aclose()``."""
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the connection pool.  Safe to call more than once."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def get(
+        self, endpoint: Endpoint, resource: str, query_params: dict = None, revalidate: bool = False
+    ) -> httpx.Response:
+        """Async version of ``HttpClient.get``, raises the same exceptions.
+
+        :param endpoint:
+        :param resource:
+        :param query_params:
+        :param revalidate: See ``HttpClient.get``.
+        :return: httpx.Response
+        """
+        key = self._cache_key(endpoint, resource, query_params)
+        if not revalidate:
+            cached = await self._off_loop(self._cache_lookup, endpoint, key, resource)
+            if cached is not None:
+                self._emit("on_cache_hit", endpoint, resource, query_params, response=cached)
+                return cached
+
+        flight_key = self._flight_key(endpoint, resource, query_params)
+        if flight_key is None:
+            return await self._fetch(endpoint, resource, query_params, key)
+
+        while flight_key in self._flights:
+            flight = self._flights[flight_key]
+            try:
+                response = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    # The task leading the request was cancelled, not this one: take over.
+                    continue
+                raise
+            self._count("coalesced")
+            return response
+
+        flight = self._flights[flight_key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await self._fetch(endpoint, resource, query_params, key)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark it retrieved, nobody may be waiting.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(response)
+            return response
+        finally:
+            del self._flights[flight_key]
+
+    async def _fetch(
+        self, endpoint: Endpoint, resource: str, query_params: Optional[dict], key: Optional[str]
+    ) -> httpx.Response:
+        """The network half of ``get``, see ``HttpClient._fetch``."""
+        try:
+            conditional = self._conditional_headers(key)
+            r = await self._send(endpoint, resource, query_params, conditional)
+            if r.status_code == 304 and conditional:
+                revalidated = self._revalidated(key, resource, r)
+                if revalidated is not None:
+                    self._on_success(endpoint)
+                    return revalidated
+                r = await self._send(endpoint, resource, query_params)
+            self._handle_response(r, resource)
+        except Exception as e:
+            self._emit("on_error", endpoint, resource, query_params, error=e)
+            raise
+        self._on_success(endpoint)
+        return await self._off_loop(self._cache_store, key, resource, self._decoded(r, endpoint, resource))
+
+    async def _off_loop(self, func, *args):
+        """Runs cache I/O on a worker thread when a disk cache is involved, inline otherwise."""
+        if self._config.disk_cache is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _send(
+        self, endpoint: Endpoint, resource: str, query_params: Optional[dict], headers: Optional[dict] = None
+    ) -> httpx.Response:
+        """Sends the GET, pacing it through the rate limiter and retrying per the retry policy."""
+        full_url = f"{endpoint.value}{resource}"
+        request_kwargs = {"headers": headers} if headers else {}
+        attempt = 0
+        while True:
+            if self._config.rate_limiter is not None:
+                await self._config.rate_limiter.acquire_async(endpoint)
+            if self._config.debug:
+                self._logger.debug(f"GET: {full_url}")
+            self._count("requests")
+            self._emit("before_request", endpoint, resource, query_params, attempt=attempt)
+            start = time.perf_counter()
+            try:
+                r: httpx.Response = await self.client.get(url=full_url, params=query_params, **request_kwargs)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(endpoint, resource, attempt, error=e, query_params=query_params)
+                if delay is None:
+                    raise
+            else:
+                elapsed = time.perf_counter() - start
+                self._emit(
+                    "after_response", endpoint, resource, query_params, attempt=attempt, response=r, elapsed=elapsed
+                )
+                delay = self._retry_delay(endpoint, resource, attempt, response=r, query_params=query_params)
+                if delay is None:
+                    break
+            await asyncio.sleep(delay)
+            attempt += 1
         return r
@@ -0,0 +1,309 @@
+"""Per request instrumentation: event hooks and a metrics collector aggregating them per endpoint and resource.
+
+Hooks are plain callables taking a ``RequestEvent``, registered per event name on the config:
+
+    def slow(event):
+        if event.elapsed > 1:
+            print(f"{event.template} took {event.elapsed:.1f}s")
+
+    config = ClientConfig(event_hooks={"after_response": [slow]}, metrics=True)
+    with NHLClient(config=config) as client:
+        client.game_center.boxscore("2023020001")
+    config.metrics.to_dict()        # {"API_WEB_V1": {"gamecenter/{id}/boxscore": {"requests": 1, ...}}}
+    config.metrics.to_prometheus()  # text exposition format
+
+Events, all fired on the thread (or event loop) making the call, so hooks must be quick and must not block:
+
+- ``before_request``: an attempt is about to be sent (``attempt`` counts from 0).
+- ``after_response``: an attempt got a response, any status, with its ``elapsed`` wall time.
+- ``on_retry``: a failed attempt (``response`` or ``error``) will be retried in ``delay`` seconds.
+- ``on_error``: the call failed, ``error`` is the exception the caller gets.
+- ``on_cache_hit``: the call was answered by the memory or disk cache.
+
+An exception raised by a hook propagates to the caller, as with httpx event hooks.
+"""
+
+import bisect
+import math
+import re
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
+
+EVENTS = ("before_request", "after_response", "on_retry", "on_error", "on_cache_hit")
+
+# Seconds.  Covers a cache-warm api-web call up to a stats report behind a slow connection.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_SEGMENTS = [
+    (re.compile(r"^\d{4}-\d{2}-\d{2}$"), "{date}"),
+    (re.compile(r"^\d{8}$"), "{season}"),
+    (re.compile(r"^\d+$"), "{id}"),
+    (re.compile(r"^[A-Z]{3}$"), "{team}"),
+]
+
+
+@lru_cache(maxsize=4096)
+def resource_template(resource: str) -> str:
+    """``resource`` with its ids, seasons, dates and team abbreviations replaced by placeholders, so requests for
+    different games aggregate together: ``gamecenter/2023020001/boxscore`` -> ``gamecenter/{id}/boxscore``."""
+    segments = resource.split("?", 1)[0].split("/")
+    for i, segment in enumerate(segments):
+        for pattern, placeholder in _SEGMENTS:
+            if pattern.match(segment):
+                segments[i] = placeholder
+                break
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """What a hook is told about a request.  Fields that don't apply to the event are None."""
+
+    __slots__ = ("name", "endpoint", "resource", "query_params", "attempt", "response", "error", "elapsed", "delay")
+
+    def __init__(
+        self,
+        name: str,
+        endpoint,
+        resource: str,
+        query_params: Optional[dict] = None,
+        attempt: Optional[int] = None,
+        response=None,
+        error: Optional[BaseException] = None,
+        elapsed: Optional[float] = None,
+        delay: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.endpoint = endpoint
+        self.resource = resource
+        self.query_params = query_params
+        self.attempt = attempt
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+        self.delay = delay
+
+    @property
+    def template(self) -> str:
+        return resource_template(self.resource)
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__[1:] if getattr(self, k) is not None)
+        return f"RequestEvent[{self.name}]({fields})"
+
+
+class Hooks:
+    """Event name -> callables, shared by every client created from a config."""
+
+    def __init__(self, hooks: Optional[Dict[str, Iterable[Callable[[RequestEvent], None]]]] = None) -> None:
+        self._hooks: Dict[str, List[Callable[[RequestEvent], None]]] = {name: [] for name in EVENTS}
+        for name, callables in (hooks or {}).items():
+            for hook in [callables] if callable(callables) else callables:
+                self.add(name, hook)
+
+    def add(self, name: str, hook: Callable[[RequestEvent], None]) -> None:
+        if name not in self._hooks:
+            raise ValueError(f"Unknown event {name!r}, expected one of {', '.join(EVENTS)}")
+        self._hooks[name].append(hook)
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
+
+    def emit(self, event: RequestEvent) -> None:
+        for hook in self._hooks[event.name]:
+            hook(event)
+
+
+class _Series:
+    """Everything recorded for one endpoint and resource template."""
+
+    __slots__ = (
+        "statuses",
+        "errors",
+        "retries",
+        "cache_hits",
+        "bytes",
+        "decodes",
+        "decode_seconds",
+        "latency_buckets",
+        "latency_sum",
+        "latencies",
+    )
+
+    def __init__(self, window: int) -> None:
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.decodes = 0
+        self.decode_seconds = 0.0
+        # Per bucket (not cumulative) counts, the last one is +Inf.
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latencies: deque = deque(maxlen=window)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    def to_dict(self) -> dict:
+        requests = sum(self.statuses.values())
+        return {
+            "requests": requests,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "decodes": self.decodes,
+            "decode_seconds": self.decode_seconds,
+            "latency": {
+                "count": requests,
+                "sum": self.latency_sum,
+                "p50": self.percentile(0.5),
+                "p95": self.percentile(0.95),
+                "p99": self.percentile(0.99),
+            },
+        }
+
+
+class MetricsCollector:
+    """Aggregates request events per ``Endpoint`` and resource template: responses by status, latency histogram
+    and p50/p95/p99, body bytes, JSON decode time, retries, cache hits and errors by exception class.
+
+    Percentiles are taken over the last ``window`` responses of each series; the histogram buckets, sums and
+    counts cover everything since the collector was created or ``reset()``.  Thread safe, one collector can be
+    shared by several configs.
+    """
+
+    def __init__(self, window: int = 2048) -> None:
+        self.window = window
+        self._series: Dict[tuple, _Series] = {}
+        self._lock = threading.Lock()
+
+    def register(self, hooks: Hooks) -> None:
+        """Subscribes the collector to the events it aggregates."""
+        hooks.add("after_response", self.after_response)
+        hooks.add("on_retry", self.on_retry)
+        hooks.add("on_error", self.on_error)
+        hooks.add("on_cache_hit", self.on_cache_hit)
+
+    def _get(self, endpoint, resource: str) -> _Series:
+        key = (getattr(endpoint, "name", str(endpoint)), resource_template(resource))
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(self.window)
+        return series
+
+    def after_response(self, event: RequestEvent) -> None:
+        size = len(event.response.content)
+        with self._lock:
+            series = self._get(event.endpoint, event.resource)
+            series.statuses[event.response.status_code] += 1
+            series.bytes += size
+            series.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+            series.latency_sum += event.elapsed
+            series.latencies.append(event.elapsed)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._get(event.endpoint, event.resource).retries += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._get(event.endpoint, event.resource).errors[type(event.error).__name__] += 1
+
+    def on_cache_hit(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._get(event.endpoint, event.resource).cache_hits += 1
+
+    def record_decode(self, endpoint, resource: str, seconds: float) -> None:
+        with self._lock:
+            series = self._get(endpoint, resource)
+            series.decodes += 1
+            series.decode_seconds += seconds
+
+    def timed(self, decoder: Callable[[bytes], object], endpoint, resource: str) -> Callable[[bytes], object]:
+        """``decoder`` recording its run time against ``endpoint`` and ``resource``."""
+
+        def decode(content: bytes):
+            start = time.perf_counter()
+            try:
+                return decoder(content)
+            finally:
+                self.record_decode(endpoint, resource, time.perf_counter() - start)
+
+        return decode
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, dict]]:
+        """``{endpoint name: {resource template: metrics}}``."""
+        result: Dict[str, Dict[str, dict]] = {}
+        with self._lock:
+            for (endpoint, template), series in sorted(self._series.items()):
+                result.setdefault(endpoint, {})[template] = series.to_dict()
+        return result
+
+    def to_prometheus(self, prefix: str = "nhlpy") -> str:
+        """The metrics in the Prometheus text exposition format, ready to serve from a ``/metrics`` handler."""
+        with self._lock:
+            series = sorted(self._series.items())
+            lines = []
+
+            def family(name: str, kind: str, help_text: str) -> None:
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+            family("requests_total", "counter", "HTTP responses received, by status.")
+            for key, s in series:
+                for status, count in sorted(s.statuses.items()):
+                    lines.append(f"{prefix}_requests_total{_labels(key, status=status)} {count}")
+            family("errors_total", "counter", "Calls that failed, by exception class.")
+            for key, s in series:
+                for error, count in sorted(s.errors.items()):
+                    lines.append(f"{prefix}_errors_total{_labels(key, error=error)} {count}")
+            for name, attr, help_text in (
+                ("retries_total", "retries", "Attempts retried after a 429, 5xx or connection error."),
+                ("cache_hits_total", "cache_hits", "Calls answered by the memory or disk cache."),
+                ("response_bytes_total", "bytes", "Response body bytes received."),
+                ("decodes_total", "decodes", "JSON bodies decoded."),
+                ("decode_seconds_total", "decode_seconds", "Time spent decoding JSON bodies."),
+            ):
+                family(name, "counter", help_text)
+                for key, s in series:
+                    lines.append(f"{prefix}_{name}{_labels(key)} {_number(getattr(s, attr))}")
+            family("request_duration_seconds", "histogram", "Wall time of each HTTP attempt.")
+            for key, s in series:
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (math.inf,), s.latency_buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else _number(bound)
+                    lines.append(f"{prefix}_request_duration_seconds_bucket{_labels(key, le=le)} {cumulative}")
+                lines.append(f"{prefix}_request_duration_seconds_sum{_labels(key)} {_number(s.latency_sum)}")
+                lines.append(f"{prefix}_request_duration_seconds_count{_labels(key)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: tuple, **extra) -> str:
+    labels = {"endpoint": key[0], "resource": key[1], **extra}
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
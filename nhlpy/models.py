@@ -0,0 +1,370 @@
+"""Typed, slotted models for the main payloads.
+
+Optional: every API method still returns plain dicts.  Convert with the module functions (``plays``, ``shifts``,
+``roster_players``, ``game_log``, ``stats_rows``) or ``Model.from_dict`` / ``Model.many``.  The functions also take
+the raw body bytes from ``nhlpy.decoding.raw_responses()``, decoded with the fastest installed decoder.
+
+Each model keeps its fields in ``__slots__`` (a fraction of the memory of the source dict) and exposes them as
+snake_case attributes.  Nested objects (a play's ``details``, a team's ``division``) stay as they came until first
+accessed, then are converted once.  Payload keys a model doesn't know about are kept in ``extra``.
+
+    from nhlpy import models
+
+    for play in models.plays(client.game_center.play_by_play("2023020204")):
+        if play.type_desc_key == "goal":
+            print(play.period, play.time_in_period, play.details.scoring_player_id)
+"""
+
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from nhlpy.decoding import JsonDecoder, get_decoder
+
+M = TypeVar("M", bound="Model")
+Payload = Union[bytes, bytearray, memoryview, str, dict, list]
+
+_CAMEL = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+def snake_case(key: str) -> str:
+    """``pointsPerGame`` -> ``points_per_game``."""
+    return _CAMEL.sub("_", key).lower()
+
+
+def _default(value: Any) -> Any:
+    """Localized strings come as ``{"default": "Connor", "fr": ...}``, keep the default."""
+    return value.get("default") if isinstance(value, dict) else value
+
+
+def _intern(value: Any) -> Any:
+    """Categorical and clock strings ("hit", "N", "12:34") repeat across records, share one copy of each."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _field(key: str, convert: Optional[Callable[[Any], Any]] = None) -> Tuple[str, str, Optional[Callable]]:
+    return snake_case(key), key, convert
+
+
+def _slots(fields, lazy=()) -> Tuple[str, ...]:
+    return tuple(attr for attr, _, _ in fields) + tuple(f"_{attr}" for attr, _, _ in lazy) + ("extra",)
+
+
+class _Lazy:
+    """A nested object, converted with ``model`` on first access.  Until then the slot holds the raw payload."""
+
+    def __init__(self, model: Callable[[Any], Any]) -> None:
+        self.model = model
+        self.slot = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, (dict, list)):
+            value = self.model(value)
+            setattr(obj, self.slot, value)
+        return value
+
+
+def _lazy(key: str, model) -> Tuple[str, str, Any]:
+    return snake_case(key), key, model
+
+
+def _from_dict(cls, data: dict):
+    """Builds a ``cls`` from its payload dict, one ``setattr`` per precomputed (slot, key, converter) of ``_assign``."""
+    get = data.get
+    obj = object.__new__(cls)
+    for slot, key, convert in cls._assign:
+        value = get(key)
+        setattr(obj, slot, value if value is None or convert is None else convert(value))
+    keys = cls._keys
+    obj.extra = None if keys.issuperset(data) else {k: v for k, v in data.items() if k not in keys}
+    return obj
+
+
+class Model:
+    """Base of the payload models.  Subclasses list their ``_fields`` (attribute, payload key, converter) and
+    ``_lazy`` nested objects, and derive ``__slots__`` from them."""
+
+    __slots__ = ()
+    _fields: Tuple[Tuple[str, str, Optional[Callable]], ...] = ()
+    _lazy: Tuple[Tuple[str, str, Any], ...] = ()
+    _keys: frozenset = frozenset()
+    _assign: Tuple[Tuple[str, str, Optional[Callable]], ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(key for _, key, _ in cls._fields + cls._lazy)
+        # Lazy objects are stored raw in their underscored slot, converted by ``_Lazy`` on first access.
+        cls._assign = cls._fields + tuple((f"_{attr}", key, None) for attr, key, _ in cls._lazy)
+        if "from_dict" not in cls.__dict__:
+            cls.from_dict = classmethod(_from_dict)
+
+    @classmethod
+    def from_dict(cls: Type[M], data: dict) -> M:
+        """Builds the model from its payload dict.  Set to ``_from_dict`` on every subclass that doesn't define its
+        own."""
+        raise NotImplementedError(f"{cls.__name__} has no fields")
+
+    @classmethod
+    def many(cls: Type[M], items: Iterable[dict]) -> List[M]:
+        return [cls.from_dict(item) for item in items]
+
+    def to_dict(self) -> dict:
+        """Back to a dict keyed by attribute name, nested objects included."""
+        out = {attr: getattr(self, attr) for attr, _, _ in self._fields}
+        for attr, _, _ in self._lazy:
+            value = getattr(self, attr)
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, Model) else item for item in value]
+            out[attr] = value
+        if self.extra:
+            out["extra"] = self.extra
+        return out
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr, _, _ in self._fields[:4])
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+class NamedAbbr(Model):
+    _fields = (_field("abbr"), _field("name"))
+    __slots__ = _slots(_fields)
+
+
+class Team(Model):
+    """A team from ``Teams.teams()``."""
+
+    _fields = (
+        _field("name"),
+        _field("common_name"),
+        _field("abbr"),
+        _field("logo"),
+        _field("franchise_id"),
+    )
+    _lazy = (_lazy("conference", NamedAbbr.from_dict), _lazy("division", NamedAbbr.from_dict))
+    __slots__ = _slots(_fields, _lazy)
+    conference = _Lazy(NamedAbbr.from_dict)
+    division = _Lazy(NamedAbbr.from_dict)
+
+
+class RosterPlayer(Model):
+    """A player of ``Teams.team_roster()``."""
+
+    _fields = (
+        _field("id"),
+        _field("firstName", _default),
+        _field("lastName", _default),
+        _field("sweaterNumber"),
+        _field("positionCode", _intern),
+        _field("shootsCatches", _intern),
+        _field("heightInInches"),
+        _field("weightInPounds"),
+        _field("heightInCentimeters"),
+        _field("weightInKilograms"),
+        _field("birthDate"),
+        _field("birthCity", _default),
+        _field("birthStateProvince", _default),
+        _field("birthCountry", _intern),
+        _field("headshot"),
+    )
+    __slots__ = _slots(_fields)
+
+
+class GameLogEntry(Model):
+    """A game of ``Stats.player_game_log()``, skater or goalie."""
+
+    _fields = (
+        _field("gameId"),
+        _field("gameDate", _intern),
+        _field("teamAbbrev", _intern),
+        _field("opponentAbbrev", _intern),
+        _field("homeRoadFlag", _intern),
+        _field("commonName", _default),
+        _field("opponentCommonName", _default),
+        _field("goals"),
+        _field("assists"),
+        _field("points"),
+        _field("plusMinus"),
+        _field("powerPlayGoals"),
+        _field("powerPlayPoints"),
+        _field("shorthandedGoals"),
+        _field("shorthandedPoints"),
+        _field("gameWinningGoals"),
+        _field("otGoals"),
+        _field("shots"),
+        _field("shifts"),
+        _field("pim"),
+        _field("toi", _intern),
+        _field("gamesStarted"),
+        _field("decision", _intern),
+        _field("shotsAgainst"),
+        _field("goalsAgainst"),
+        _field("savePctg"),
+        _field("shutouts"),
+    )
+    __slots__ = _slots(_fields)
+
+
+class PeriodDescriptor(Model):
+    _fields = (_field("number"), _field("periodType", _intern), _field("maxRegulationPeriods"))
+    __slots__ = _slots(_fields)
+
+
+class PlayDetails(Model):
+    """``details`` of a play.  Which fields are set depends on the play's type."""
+
+    _fields = (
+        _field("eventOwnerTeamId"),
+        _field("xCoord"),
+        _field("yCoord"),
+        _field("zoneCode", _intern),
+        _field("shotType", _intern),
+        _field("shootingPlayerId"),
+        _field("scoringPlayerId"),
+        _field("assist1PlayerId"),
+        _field("assist2PlayerId"),
+        _field("goalieInNetId"),
+        _field("blockingPlayerId"),
+        _field("hittingPlayerId"),
+        _field("hitteePlayerId"),
+        _field("winningPlayerId"),
+        _field("losingPlayerId"),
+        _field("playerId"),
+        _field("committedByPlayerId"),
+        _field("drawnByPlayerId"),
+        _field("servedByPlayerId"),
+        _field("typeCode", _intern),
+        _field("descKey", _intern),
+        _field("duration", _intern),
+        _field("reason", _intern),
+        _field("awaySOG"),
+        _field("homeSOG"),
+        _field("awayScore"),
+        _field("homeScore"),
+    )
+    __slots__ = _slots(_fields)
+
+
+class Play(Model):
+    """A play of ``GameCenter.play_by_play()``."""
+
+    _fields = (
+        _field("eventId"),
+        _field("typeCode"),
+        _field("typeDescKey", _intern),
+        _field("timeInPeriod", _intern),
+        _field("timeRemaining", _intern),
+        _field("situationCode", _intern),
+        _field("homeTeamDefendingSide", _intern),
+        _field("sortOrder"),
+    )
+    _lazy = (_lazy("periodDescriptor", PeriodDescriptor.from_dict), _lazy("details", PlayDetails.from_dict))
+    __slots__ = _slots(_fields, _lazy)
+    period_descriptor = _Lazy(PeriodDescriptor.from_dict)
+    details = _Lazy(PlayDetails.from_dict)
+
+    @property
+    def period(self) -> Optional[int]:
+        return self.period_descriptor.number if self.period_descriptor is not None else None
+
+
+class Shift(Model):
+    """A row of ``GameCenter.shift_chart_data()``."""
+
+    _fields = (
+        _field("id"),
+        _field("gameId"),
+        _field("playerId"),
+        _field("firstName", _intern),
+        _field("lastName", _intern),
+        _field("teamId"),
+        _field("teamAbbrev", _intern),
+        _field("teamName", _intern),
+        _field("period"),
+        _field("shiftNumber"),
+        _field("startTime", _intern),
+        _field("endTime", _intern),
+        _field("duration", _intern),
+        _field("typeCode"),
+        _field("detailCode"),
+        _field("eventNumber"),
+        _field("eventDescription"),
+        _field("eventDetails"),
+        _field("hexValue", _intern),
+    )
+    __slots__ = _slots(_fields)
+
+
+class StatsRow(Model):
+    """A row of a stats report.  Reports have different columns, ``stats_rows`` builds one slotted subclass per set
+    of columns, with every column as a snake_case attribute."""
+
+    __slots__ = ()
+    _schemas: Dict[Tuple[str, ...], Type["StatsRow"]] = {}
+
+    @classmethod
+    def for_columns(cls, columns: Tuple[str, ...]) -> Type["StatsRow"]:
+        row_type = cls._schemas.get(columns)
+        if row_type is None:
+            fields = tuple(_field(column) for column in columns)
+            row_type = type("StatsRow", (StatsRow,), {"__slots__": _slots(fields), "_fields": fields})
+            cls._schemas[columns] = row_type
+        return row_type
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatsRow":
+        return cls.for_columns(tuple(data)).from_dict(data)
+
+
+def _decode(payload: Payload, decoder: Optional[JsonDecoder]) -> Any:
+    if isinstance(payload, (bytes, bytearray, memoryview, str)):
+        return (decoder or get_decoder())(payload)
+    return payload
+
+
+def plays(payload: Payload, decoder: Optional[JsonDecoder] = None) -> List[Play]:
+    """The plays of a play-by-play response (dict or body bytes)."""
+    return Play.many(_decode(payload, decoder).get("plays", []))
+
+
+def shifts(payload: Payload, decoder: Optional[JsonDecoder] = None) -> List[Shift]:
+    """The shifts of a shift chart response (dict or body bytes)."""
+    return Shift.many(_decode(payload, decoder).get("data", []))
+
+
+def roster_players(payload: Payload, decoder: Optional[JsonDecoder] = None) -> List[RosterPlayer]:
+    """Forwards, defensemen and goalies of a roster response (dict or body bytes)."""
+    data = _decode(payload, decoder)
+    return RosterPlayer.many(data.get("forwards", []) + data.get("defensemen", []) + data.get("goalies", []))
+
+
+def game_log(payload: Payload, decoder: Optional[JsonDecoder] = None) -> List[GameLogEntry]:
+    """Games of a game log (the ``player_game_log`` list, or the full response / body bytes)."""
+    data = _decode(payload, decoder)
+    return GameLogEntry.many(data.get("gameLog", []) if isinstance(data, dict) else data)
+
+
+def stats_rows(payload: Payload, decoder: Optional[JsonDecoder] = None) -> List[StatsRow]:
+    """Rows of a stats report (the list a ``Stats`` report method returns, or the response / body bytes)."""
+    data = _decode(payload, decoder)
+    rows = data.get("data", []) if isinstance(data, dict) else data
+    out: List[StatsRow] = []
+    row_type, columns = None, None
+    for row in rows:
+        if columns is None or len(row) != len(columns) or tuple(row) != columns:
+            columns = tuple(row)
+            row_type = StatsRow.for_columns(columns)
+        out.append(row_type.from_dict(row))
+    return out
@@ -1,7 +1,38 @@
-from nhlpy.api import teams, standings, schedule, game_center, stats, misc, helpers, players, edge
-from nhlpy.http_client import HttpClient
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
 from nhlpy.config import ClientConfig
 
+if TYPE_CHECKING:
+    from nhlpy.http_client import HttpClient
+    from nhlpy.metrics import MetricsCollector
+
+
+class _SubApi:
+    """A client's sub module (``client.teams``, ...), imported and built on first access.
+
+    ``import nhlpy`` and creating a client then stay cheap: the API modules, and httpx behind them, only load
+    once something is actually called.  The built instance is stored on the client, later lookups don't come
+    back here.
+    """
+
+    def __init__(self, module: str, cls_name: str) -> None:
+        self.module = module
+        self.cls_name = cls_name
+        self.name = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, client, owner=None) -> Any:
+        if client is None:
+            return self
+        # __import__ rather than importlib.import_module: only the former shows up in ``python -X importtime``.
+        api_cls = getattr(__import__(self.module, fromlist=[self.cls_name]), self.cls_name)
+        api = client._build_api(api_cls)
+        # setdefault: a racing thread may have built it first, every caller gets the same instance.
+        return client.__dict__.setdefault(self.name, api)
+
 
 class NHLClient:
     """
@@ -11,10 +42,20 @@ class NHLClient:
     such as:
         client = NHLClient()
         client = NHLClient(debug=True) # for a lil extra logging
+
+    The client holds a pooled HTTP connection shared by every sub module.  Close it when you are done,
+    or use it as a context manager:
+        with NHLClient() as client:
+            client.teams.teams()
     """
 
     def __init__(
-        self, debug: bool = False, timeout: int = 10, ssl_verify: bool = True, follow_redirects: bool = True
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        config: Optional[ClientConfig] = None,
     ) -> None:
         """
         :param follow_redirects: bool.  Some of these endpoints use redirects (ew).  This is the case when using
@@ -22,19 +63,61 @@ class NHLClient:
         :param debug: bool, Defaults to False.  Set to True for extra logging.
         :param timeout: int, Defaults to 10 seconds.
         :param ssl_verify: bool, Defaults to True.  Set to false if you want to ignore SSL verification.
+        :param config: ClientConfig, optional.  Full configuration (connection pool limits, etc).  When supplied
+        the other keyword arguments are ignored.
         """
-        # This config type setup isnt doing what I thought it would.  This will be reworked later on.
-        self._config = ClientConfig(
-            debug=debug, timeout=timeout, ssl_verify=ssl_verify, follow_redirects=follow_redirects
-        )
-        self._http_client = HttpClient(self._config)
-
-        self.teams = teams.Teams(http_client=self._http_client)
-        self.standings = standings.Standings(http_client=self._http_client)
-        self.schedule = schedule.Schedule(http_client=self._http_client)
-        self.game_center = game_center.GameCenter(http_client=self._http_client)
-        self.stats = stats.Stats(http_client=self._http_client)
-        self.misc = misc.Misc(http_client=self._http_client)
-        self.helpers = helpers.Helpers(http_client=self._http_client)
-        self.players = players.Players(http_client=self._http_client)
-        self.edge = edge.Edge(http_client=self._http_client)
+        if config is None:
+            config = ClientConfig(debug=debug, timeout=timeout, ssl_verify=ssl_verify, follow_redirects=follow_redirects)
+        self._config = config
+        self._http: Optional["HttpClient"] = None
+        self._http_lock = threading.Lock()
+
+    teams = _SubApi("nhlpy.api.teams", "Teams")
+    standings = _SubApi("nhlpy.api.standings", "Standings")
+    schedule = _SubApi("nhlpy.api.schedule", "Schedule")
+    game_center = _SubApi("nhlpy.api.game_center", "GameCenter")
+    stats = _SubApi("nhlpy.api.stats", "Stats")
+    misc = _SubApi("nhlpy.api.misc", "Misc")
+    helpers = _SubApi("nhlpy.api.helpers", "Helpers")
+    players = _SubApi("nhlpy.api.players", "Players")
+    edge = _SubApi("nhlpy.api.edge", "Edge")
+
+    @property
+    def _http_client(self) -> "HttpClient":
+        """The pooled HTTP client, created with the first sub module."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    from nhlpy.http_client import HttpClient
+
+                    self._http = HttpClient(self._config)
+        return self._http
+
+    def _build_api(self, api_cls):
+        return api_cls(http_client=self._http_client)
+
+    @property
+    def config(self) -> ClientConfig:
+        """The configuration this client was built with."""
+        return self._config
+
+    @property
+    def request_stats(self) -> dict:
+        """Request counters (requests, retries, ...) for this client.  See ``HttpClient.stats``."""
+        return self._http.stats if self._http is not None else {}
+
+    @property
+    def metrics(self) -> Optional["MetricsCollector"]:
+        """Per endpoint and resource metrics, when enabled with ``ClientConfig(metrics=True)``.  See nhlpy.metrics."""
+        return self._config.metrics
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        if self._http is not None:
+            self._http.close()
+
+    def __enter__(self) -> "NHLClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
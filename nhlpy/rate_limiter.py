@@ -0,0 +1,146 @@
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from nhlpy.http_client import Endpoint
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` requests per second with bursts of up to ``burst`` requests.
+
+    Callers reserve a token under a lock and then sleep outside of it until their slot comes up, so one bucket
+    can be shared by any mix of threads and asyncio tasks.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = rate
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._paused_until)
+            self._refill(start)
+            self._tokens -= 1
+            wait = start - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def penalize(self, pause: float) -> None:
+        """Server pushed back (429).  Hold every caller for ``pause`` seconds and halve the rate."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + pause)
+            # Nothing accrues while paused, callers come back to an empty bucket.
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = self._paused_until
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def recover(self) -> None:
+        """A request went through, creep the rate back up towards the configured maximum."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Suspends the calling task until a token is available."""
+        import asyncio  # already loaded by the caller's event loop, not imported at module level for sync users.
+
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _host(endpoint: Union["Endpoint", str]) -> str:
+    # An Endpoint, whose value is its base url.  Not imported here, http_client pulls in httpx.
+    if isinstance(endpoint, Enum):
+        return urlsplit(endpoint.value).netloc
+    return endpoint
+
+
+class RateLimiter:
+    """Client wide rate limiting, one ``TokenBucket`` per NHL API host.
+
+    API_CORE and API_STATS both live on api.nhle.com and therefore share a bucket.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        host_limits: Optional[Dict[Union["Endpoint", str], Tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param rate: float, optional.  Requests per second allowed against each host.  None means unlimited.
+        :param burst: int, Defaults to 1.  Requests allowed back to back before ``rate`` kicks in.
+        :param host_limits: dict, optional.  Per host overrides, ``{Endpoint.API_STATS: (rate, burst)}`` or
+        ``{"api.nhle.com": (rate, burst)}``.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._host_limits = {_host(k): v for k, v in (host_limits or {}).items()}
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint: Union["Endpoint", str]) -> Optional[TokenBucket]:
+        """The bucket for an endpoint's host, or None when that host is unlimited."""
+        host = _host(endpoint)
+        try:
+            return self._buckets[host]
+        except KeyError:
+            pass
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self._host_limits.get(host, (self._rate, self._burst))
+                self._buckets[host] = TokenBucket(rate, burst, clock=self._clock) if rate else None
+            return self._buckets[host]
+
+    def acquire(self, endpoint: Union["Endpoint", str]) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, endpoint: Union["Endpoint", str]) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def penalize(self, endpoint: Union["Endpoint", str], pause: float) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            bucket.penalize(pause)
+
+    def recover(self, endpoint: Union["Endpoint", str]) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            bucket.recover()
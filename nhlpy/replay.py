@@ -0,0 +1,257 @@
+"""Record / replay transports: run the client against responses saved on disk instead of the live NHL API.
+
+Record once, against the network (or any other httpx transport):
+
+    cassette = Cassette("cassettes/2023-2024")
+    with NHLClient(config=ClientConfig(transport=RecordingTransport(cassette))) as client:
+        client.helpers.game_ids_by_season("20232024")
+
+then replay offline as often as needed, optionally modelling the round trip and the server's rate limit:
+
+    transport = ReplayTransport(cassette, latency=0.05, rate_limit=(10, 10))
+    with NHLClient(config=ClientConfig(transport=transport)) as client:
+        client.helpers.game_ids_by_season("20232024")
+    print(transport.requests, transport.bytes_sent, transport.throttled)
+
+Both transports also work as ``ClientConfig(async_transport=...)``.  Every layer of ``HttpClient`` (caching,
+coalescing, retries, rate limiting, decoding) runs as it would against the real hosts.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import httpx
+
+from nhlpy.decoding import WIRE_HEADERS
+
+# Throttled and failed responses are transient, replaying them would only replay the outage.
+_NOT_RECORDED = frozenset({429, 500, 502, 503, 504})
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+class CassetteMissError(LookupError):
+    """A replayed request has no recorded response."""
+
+
+class Cassette:
+    """A directory of recorded responses, one gzipped JSON file per distinct GET.
+
+    Files are named after the host and path (readable in a directory listing), plus a hash of the sorted query
+    string, so the order query params were given in doesn't matter.  Writes are atomic, several threads or
+    processes may record into the same cassette.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def file_name(self, request: httpx.Request) -> str:
+        url = request.url
+        name = _UNSAFE.sub("_", f"{url.host}{url.path}").strip("_")
+        params = sorted(url.params.multi_items())
+        if params:
+            name += "-" + hashlib.sha1(json.dumps(params).encode()).hexdigest()[:12]
+        return f"{request.method.lower()}-{name}.json.gz"
+
+    def load(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """The recorded response for ``request``, None when there is none."""
+        try:
+            with gzip.open(os.path.join(self.path, self.file_name(request)), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        body = entry["body"]
+        content = base64.b64decode(body) if entry.get("base64") else body.encode("utf-8")
+        return httpx.Response(entry["status"], headers=entry["headers"], content=content, request=request)
+
+    def save(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Records a read response.  The body is stored decoded, wire encoding headers are dropped."""
+        entry = {
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": [(k, v) for k, v in response.headers.multi_items() if k.lower() not in WIRE_HEADERS],
+            "recorded_at": time.time(),
+        }
+        try:
+            entry["body"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry.update(body=base64.b64encode(response.content).decode("ascii"), base64=True)
+        path = os.path.join(self.path, self.file_name(request))
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def __len__(self) -> int:
+        return sum(1 for name in os.listdir(self.path) if name.endswith(".json.gz"))
+
+
+def _read_copy(request: httpx.Request, response: httpx.Response, content: bytes) -> httpx.Response:
+    headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in WIRE_HEADERS]
+    return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests through ``transport`` (the network by default) and saves every response to ``cassette``.
+
+    Throttled (429) and 5xx responses are passed through but not recorded.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.cassette = cassette
+        self._transport = transport
+        self._async_transport = async_transport
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if self._transport is None:
+                self._transport = httpx.HTTPTransport()
+        response = self._transport.handle_request(request)
+        try:
+            copy = _read_copy(request, response, response.read())
+        finally:
+            response.close()
+        if copy.status_code not in _NOT_RECORDED:
+            self.cassette.save(request, copy)
+        return copy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._async_transport is None:
+            self._async_transport = httpx.AsyncHTTPTransport()
+        response = await self._async_transport.handle_async_request(request)
+        try:
+            copy = _read_copy(request, response, await response.aread())
+        finally:
+            await response.aclose()
+        if copy.status_code not in _NOT_RECORDED:
+            self.cassette.save(request, copy)
+        return copy
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+
+class _ServerLimit:
+    """The server side of a rate limit: a request either gets a token right away or is turned down."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def take(self) -> Optional[float]:
+        """None when the request may go through, else the seconds until it would."""
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answers requests from a ``Cassette``, simulating the network and the server's rate limit.
+
+    Each response is held back ``latency`` seconds, plus its size over ``bandwidth`` (bytes per second) when
+    given.  With ``rate_limit=(rate, burst)`` a token bucket per host turns down requests beyond it with a 429
+    and a Retry-After header, like the NHL hosts do.  Recorded responses are read from disk once and then kept in
+    memory, so replaying measures the client rather than the disk.
+
+    ``requests``, ``bytes_sent`` and ``throttled`` count what was served.
+
+    Raises:
+        CassetteMissError: From the client call, for a request that was never recorded.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        rate_limit: Optional[Tuple[float, int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cassette = cassette
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.rate_limit = rate_limit
+        self._clock = clock
+        self.requests = 0
+        self.bytes_sent = 0
+        self.throttled = 0
+        self._limits: Dict[str, _ServerLimit] = {}
+        self._responses: Dict[str, Optional[Tuple[int, list, bytes]]] = {}
+        self._lock = threading.Lock()
+
+    def _recorded(self, request: httpx.Request) -> Tuple[int, list, bytes]:
+        name = self.cassette.file_name(request)
+        try:
+            recorded = self._responses[name]
+        except KeyError:
+            response = self.cassette.load(request)
+            recorded = (
+                None if response is None else (response.status_code, response.headers.multi_items(), response.content)
+            )
+            self._responses[name] = recorded
+        if recorded is None:
+            raise CassetteMissError(
+                f"No recorded response for GET {request.url} ({name} in {self.cassette.path}).  "
+                f"Record it first with RecordingTransport."
+            )
+        return recorded
+
+    def _respond(self, request: httpx.Request) -> Tuple[httpx.Response, float]:
+        """The response and how long to hold it back."""
+        with self._lock:
+            self.requests += 1
+            wait = None
+            if self.rate_limit is not None:
+                limit = self._limits.get(request.url.host)
+                if limit is None:
+                    limit = self._limits[request.url.host] = _ServerLimit(*self.rate_limit, clock=self._clock)
+                wait = limit.take()
+            if wait is not None:
+                self.throttled += 1
+            else:
+                status, headers, body = self._recorded(request)
+                self.bytes_sent += len(body)
+        if wait is not None:
+            # Retry-After only carries whole seconds.
+            return httpx.Response(429, headers={"Retry-After": str(math.ceil(wait))}, request=request), self.latency
+        delay = self.latency + (len(body) / self.bandwidth if self.bandwidth else 0.0)
+        return httpx.Response(status, headers=headers, content=body, request=request), delay
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._respond(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._respond(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
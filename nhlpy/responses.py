@@ -0,0 +1,34 @@
+import json
+from typing import Optional
+
+import httpx
+
+from nhlpy.decoding import WIRE_HEADERS, JsonDecoder, _raw
+
+
+class JsonResponse(httpx.Response):
+    """The response the http clients hand out.  ``.json()`` uses the decoder from the client's config, or returns
+    the body bytes under ``raw_responses()``."""
+
+    decoder: JsonDecoder = staticmethod(json.loads)
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, decoder: Optional[JsonDecoder] = None) -> "JsonResponse":
+        try:
+            request = response.request
+        except RuntimeError:
+            request = None
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in WIRE_HEADERS]
+        copy = cls(response.status_code, headers=headers, content=response.content, request=request)
+        if decoder is not None:
+            copy.decoder = decoder
+        elif isinstance(response, JsonResponse):
+            copy.decoder = response.decoder
+        return copy
+
+    def json(self, **kwargs):
+        if _raw.get():
+            return self.content
+        if kwargs:
+            return super().json(**kwargs)
+        return self.decoder(self.content)
@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, which is either a number of seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime  # pulls in socket and the email package, rarely needed.
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Only idempotent methods are retried.  Delays use exponential backoff with full jitter,
+    ``uniform(0, min(backoff_max, backoff_factor * 2 ** attempt))``, unless the server sent a Retry-After header,
+    which is honored as is (capped at ``retry_after_max``).
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_after_max: float = 120.0,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_after_max = retry_after_max
+
+    def should_retry(self, attempt: int, status_code: Optional[int] = None, method: str = "GET") -> bool:
+        """
+        :param attempt: Retries already made for this request, 0 after the first failure.
+        :param status_code: Response status, None when the request failed at the transport level.
+        :param method: HTTP method of the request.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.IDEMPOTENT_METHODS:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2**attempt))
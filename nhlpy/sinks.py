@@ -0,0 +1,243 @@
+"""Row sinks: write dict rows to NDJSON, CSV or Parquet as they arrive, instead of collecting them in a list first.
+
+    with open_sink("players.csv.gz") as sink:
+        sink.write_all(client.helpers.iter_all_players("20232024"))
+
+Text sinks flush at least every ``flush_interval`` seconds, so rows show up on disk while a crawl is still running;
+a path ending in ``.gz`` is gzip compressed.  The Parquet sink needs pyarrow and writes a row group every
+``batch_size`` rows.
+"""
+
+import csv
+import gzip
+import json
+import logging
+import os
+import time
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from nhlpy.tables.columnar import _require
+
+logger = logging.getLogger(__name__)
+
+PathOrFile = Union[str, os.PathLike, IO[str]]
+
+
+class Sink:
+    """Base of the row writers.  Use as a context manager, or call ``close()`` when done."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+
+    def write(self, row: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def write_all(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Writes every row of ``rows``, consuming it lazily.  Returns how many were written."""
+        count = 0
+        for row in rows:
+            self.write(row)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _TextSink(Sink):
+    """A sink over a text file: opened from a path (gzipped for ``.gz``) or a file object the caller owns."""
+
+    def __init__(self, target: PathOrFile, flush_interval: float = 1.0) -> None:
+        super().__init__()
+        self.flush_interval = flush_interval
+        self._owned = not hasattr(target, "write")
+        if self._owned:
+            path = os.fspath(target)
+            opener = gzip.open if path.endswith(".gz") else open
+            self._file = opener(path, "wt", encoding="utf-8", newline="")
+        else:
+            self._file = target
+        self._flushed = time.monotonic()
+
+    def _wrote(self) -> None:
+        self.rows += 1
+        now = time.monotonic()
+        if now - self._flushed >= self.flush_interval:
+            self._file.flush()
+            self._flushed = now
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class NdjsonSink(_TextSink):
+    """One JSON object per line."""
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        self._file.write("\n")
+        self._wrote()
+
+
+class CsvSink(_TextSink):
+    """Comma separated values with a header row.  Nested values (lists, dicts) are written as JSON.
+
+    The columns are ``fieldnames`` when given, otherwise every key seen in the first ``sample_rows`` rows, in
+    order of appearance; those rows are held back until then.  Keys first showing up later are dropped, with a
+    warning.
+    """
+
+    def __init__(
+        self,
+        target: PathOrFile,
+        fieldnames: Optional[Sequence[str]] = None,
+        sample_rows: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(target, flush_interval)
+        self.fieldnames: Optional[List[str]] = list(fieldnames) if fieldnames is not None else None
+        self.sample_rows = sample_rows
+        self._sample: List[Dict[str, Any]] = []
+        self._writer: Optional[csv.DictWriter] = None
+        self._dropped: set = set()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._sample.append(row)
+            if self.fieldnames is None and len(self._sample) < self.sample_rows:
+                return
+            self._start()
+            return
+        self._write(row)
+
+    def _start(self) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(dict.fromkeys(key for row in self._sample for key in row))
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+        sample, self._sample = self._sample, []
+        for row in sample:
+            self._write(row)
+
+    def _write(self, row: Dict[str, Any]) -> None:
+        extra = row.keys() - self._writer.fieldnames
+        if extra and not extra <= self._dropped:
+            logger.warning(f"CsvSink: dropping columns missing from the header: {sorted(extra - self._dropped)}")
+            self._dropped |= extra
+        self._writer.writerow(
+            {key: json.dumps(value) if isinstance(value, (dict, list)) else value for key, value in row.items()}
+        )
+        self._wrote()
+
+    def close(self) -> None:
+        if self._writer is None and (self._sample or self.fieldnames is not None):
+            self._start()
+        super().close()
+
+
+class ParquetSink(Sink):
+    """Apache Parquet, through pyarrow.  Rows are buffered and written a row group of ``batch_size`` at a time.
+
+    The schema is ``schema`` when given, otherwise inferred from the first batch, with all-null columns typed as
+    strings.  A Parquet file has one schema, so later rows are converted to it: missing keys become nulls, and keys
+    or nested struct fields not in the schema are dropped, with a warning.  Pass ``schema`` (or a first batch
+    holding every field) when rows vary.  Without rows or a ``schema`` no file is written.
+
+    Raises:
+        ImportError: When pyarrow isn't installed.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], batch_size: int = 10_000, schema=None, **writer_options) -> None:
+        super().__init__()
+        self._pa = _require("pyarrow")
+        import pyarrow.parquet
+
+        self._pq = pyarrow.parquet
+        self.path = os.fspath(path)
+        self.batch_size = batch_size
+        self.schema = schema
+        self._writer_options = writer_options
+        self._writer = None
+        self._batch: List[Dict[str, Any]] = []
+        self._dropped: set = set()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._batch.append(row)
+        self.rows += 1
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        pa = self._pa
+        if self.schema is None:
+            # Table.from_pylist infers the columns from the first row only.
+            keys = dict.fromkeys(key for row in self._batch for key in row)
+            inferred = pa.Table.from_pydict({key: [row.get(key) for row in self._batch] for key in keys}).schema
+            self.schema = pa.schema(
+                [field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in inferred]
+            )
+        dropped: set = set()
+        for row in self._batch:
+            self._missing_fields(row, self.schema, "", dropped)
+        if dropped - self._dropped:
+            logger.warning(f"ParquetSink: dropping fields missing from the schema: {sorted(dropped - self._dropped)}")
+            self._dropped |= dropped
+        table = pa.Table.from_pylist(self._batch, schema=self.schema)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, self.schema, **self._writer_options)
+        self._writer.write_table(table)
+        self._batch = []
+
+    def _missing_fields(self, row: Dict[str, Any], fields, prefix: str, missing: set) -> None:
+        """Collects the dotted paths of the keys of ``row`` that ``fields`` (the schema or a struct type) lack,
+        looking into nested dicts and lists of dicts."""
+        types = self._pa.types
+        by_name = {field.name: field for field in fields}
+        for key, value in row.items():
+            field = by_name.get(key)
+            if field is None:
+                missing.add(prefix + key)
+                continue
+            field_type, items = field.type, [value]
+            if isinstance(value, list) and (types.is_list(field_type) or types.is_large_list(field_type)):
+                field_type, items = field_type.value_type, value
+            if types.is_struct(field_type):
+                for item in items:
+                    if isinstance(item, dict):
+                        self._missing_fields(item, field_type, f"{prefix}{key}.", missing)
+
+    def close(self) -> None:
+        if self._batch or (self._writer is None and self.schema is not None):
+            self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+_SINKS = {".ndjson": NdjsonSink, ".jsonl": NdjsonSink, ".csv": CsvSink, ".parquet": ParquetSink}
+
+
+def open_sink(path: Union[str, os.PathLike], **options) -> Sink:
+    """The sink for ``path``'s extension: ``.ndjson`` / ``.jsonl``, ``.csv`` (each optionally ``.gz``) or
+    ``.parquet``.  ``options`` go to the sink's constructor."""
+    name = os.fspath(path)
+    stem = name[:-3] if name.endswith(".gz") else name
+    extension = os.path.splitext(stem)[1].lower()
+    if extension not in _SINKS or (extension == ".parquet" and stem != name):
+        raise ValueError(f"No sink for {name}, expected one of: {', '.join(_SINKS)} (text formats may end in .gz)")
+    return _SINKS[extension](path, **options)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], path: Union[str, os.PathLike], **options) -> int:
+    """Streams ``rows`` into a new file at ``path``, see ``open_sink``.  Returns how many rows were written."""
+    with open_sink(path, **options) as sink:
+        return sink.write_all(rows)
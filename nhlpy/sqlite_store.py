@@ -0,0 +1,65 @@
+"""Shared plumbing of the SQLite backed stores: ``DiskCache``, ``GameArchive`` and ``Warehouse``."""
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+# Matches the raw body of a game payload whose ``gameState`` is OFF/FINAL, without decoding the JSON.
+_FINAL_GAME_STATE = re.compile(rb'"gameState"\s*:\s*"(OFF|FINAL)"')
+
+
+def is_final_game_payload(body: bytes) -> bool:
+    """Whether a play-by-play / boxscore / landing body is of a finished game, which never changes again."""
+    return _FINAL_GAME_STATE.search(body) is not None
+
+
+class SQLiteStore:
+    """A SQLite file shared by threads (and processes): each thread gets its own connection and the file runs in
+    WAL mode, so readers never block the writer.  Subclasses set ``_schema``, applied when the store is opened."""
+
+    _schema = ""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(self._schema)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """This thread's connection inside ``BEGIN IMMEDIATE`` / ``COMMIT``, rolled back on any error."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        """Closes this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,14 @@
+from nhlpy.tables.columnar import Column, ColumnarTable
+from nhlpy.tables.events import EVENT_TYPES, NO_COORD, SHOT_EVENTS, EventTable
+from nhlpy.tables.shifts import ShiftIndex, game_seconds
+
+__all__ = [
+    "Column",
+    "ColumnarTable",
+    "EVENT_TYPES",
+    "EventTable",
+    "NO_COORD",
+    "SHOT_EVENTS",
+    "ShiftIndex",
+    "game_seconds",
+]
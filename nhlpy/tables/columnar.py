@@ -0,0 +1,252 @@
+import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_INT16_MAX = 2**15 - 1
+
+# Column kinds.  "null" until the first non null value shows up.
+NULL, BOOL, INT, FLOAT, CATEGORY, OBJECT = "null", "bool", "int", "float", "category", "object"
+
+
+def _require(module: str):
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(f"{module} is required for this export, `pip install {module}`.") from e
+
+
+class Column:
+    """One typed column of a ``ColumnarTable``.
+
+    Values live in a flat ``array.array``: int32 (widened to int64 when needed), float32, int8 for booleans, or
+    int16/int32 codes into ``categories`` for strings.  Anything else (nested objects, mixed types) falls back to
+    a plain list.  Nulls are tracked in an Arrow style validity bitmap, allocated on the first null.
+    """
+
+    __slots__ = ("name", "kind", "values", "categories", "_index", "_validity", "_length")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.kind = NULL
+        self.values: Any = None
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._validity: Optional[bytearray] = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def null_count(self) -> int:
+        if self._validity is None:
+            return 0
+        return self._length - sum(bin(byte).count("1") for byte in self._validity)
+
+    @property
+    def validity(self) -> Optional[bytearray]:
+        """LSB ordered validity bitmap (bit set = value present), None when the column has no nulls."""
+        return self._validity
+
+    def is_valid(self, i: int) -> bool:
+        return self._validity is None or bool(self._validity[i >> 3] & (1 << (i & 7)))
+
+    def _mark(self, valid: bool) -> None:
+        i = self._length
+        if self._validity is None:
+            if valid:
+                return
+            self._validity = bytearray(b"\xff" * (i >> 3))
+            if i & 7:
+                self._validity.append((1 << (i & 7)) - 1)
+        if not i & 7:
+            self._validity.append(0)
+        if valid:
+            self._validity[i >> 3] |= 1 << (i & 7)
+
+    def _start(self, kind: str, typecode: Optional[str]) -> None:
+        """First non null value: allocate storage, back filling the nulls seen so far."""
+        self.kind = kind
+        self.values = [None] * self._length if typecode is None else array.array(typecode, [0]) * self._length
+
+    def _to_object(self) -> None:
+        self.values = [self.get(i) for i in range(self._length)]
+        self.kind = OBJECT
+        self.categories, self._index = [], {}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            if self.kind != NULL:
+                self.values.append(None if self.kind == OBJECT else 0)
+            self._mark(False)
+            self._length += 1
+            return
+
+        if self.kind == NULL:
+            if isinstance(value, bool):
+                self._start(BOOL, "b")
+            elif isinstance(value, int):
+                self._start(INT, "i")
+            elif isinstance(value, float):
+                self._start(FLOAT, "f")
+            elif isinstance(value, str):
+                self._start(CATEGORY, "h")
+            else:
+                self._start(OBJECT, None)
+
+        kind = self.kind
+        if kind == INT and isinstance(value, int) and not isinstance(value, bool):
+            if not _INT32_MIN <= value <= _INT32_MAX and self.values.typecode == "i":
+                self.values = array.array("q", self.values)
+        elif kind == FLOAT and isinstance(value, (int, float)) and not isinstance(value, bool):
+            pass
+        elif kind == INT and isinstance(value, float):
+            self.values = array.array("f", self.values)
+            self.kind = FLOAT
+        elif kind == BOOL and isinstance(value, bool):
+            pass
+        elif kind == CATEGORY and isinstance(value, str):
+            code = self._index.get(value)
+            if code is None:
+                code = self._index[value] = len(self.categories)
+                self.categories.append(value)
+                if code > _INT16_MAX and self.values.typecode == "h":
+                    self.values = array.array("i", self.values)
+            value = code
+        elif kind != OBJECT:
+            self._to_object()
+
+        self.values.append(value)
+        self._mark(True)
+        self._length += 1
+
+    def get(self, i: int) -> Any:
+        """The Python value at row ``i``."""
+        if not self.is_valid(i):
+            return None
+        value = self.values[i]
+        if self.kind == CATEGORY:
+            return self.categories[value]
+        if self.kind == BOOL:
+            return bool(value)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.get(i) for i in range(self._length))
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def to_numpy(self):
+        """NumPy view of the column.  Numeric columns share the column's memory, category columns are decoded
+        into a new array of strings.  Columns with nulls come back as masked arrays."""
+        np = _require("numpy")
+        if self.kind == NULL:
+            return np.ma.masked_all(self._length, dtype=float)
+        if self.kind == OBJECT:
+            data = np.empty(self._length, dtype=object)
+            data[:] = self.values
+        elif self.kind == CATEGORY:
+            data = np.asarray(self.categories, dtype=object)[np.frombuffer(self.values, dtype=self._numpy_dtype(np))]
+        else:
+            data = np.frombuffer(self.values, dtype=self._numpy_dtype(np))
+            if self.kind == BOOL:
+                data = data.view(np.bool_)
+        if self._validity is None:
+            return data
+        valid = np.unpackbits(np.frombuffer(self._validity, dtype=np.uint8), bitorder="little")[: self._length]
+        return np.ma.masked_array(data, mask=~valid.astype(bool))
+
+    def _numpy_dtype(self, np):
+        kind = "f" if self.values.typecode in "fd" else "i"
+        return np.dtype(f"{kind}{self.values.itemsize}")
+
+    def to_arrow(self):
+        """pyarrow Array over the column's buffers.  Numeric values, category codes and the validity bitmap are
+        handed to Arrow without copying."""
+        pa = _require("pyarrow")
+        if self.kind == NULL:
+            return pa.nulls(self._length)
+        if self.kind == OBJECT:
+            return pa.array(self.values)
+        validity = pa.py_buffer(self._validity) if self._validity is not None else None
+        if self.kind == FLOAT:
+            arrow_type = pa.float32() if self.values.typecode == "f" else pa.float64()
+        else:
+            arrow_type = {1: pa.int8(), 2: pa.int16(), 4: pa.int32(), 8: pa.int64()}[self.values.itemsize]
+        values = pa.Array.from_buffers(arrow_type, self._length, [validity, pa.py_buffer(self.values)])
+        if self.kind == CATEGORY:
+            return pa.DictionaryArray.from_arrays(values, pa.array(self.categories, type=pa.string()))
+        if self.kind == BOOL:
+            return values.cast(pa.bool_())
+        return values
+
+
+class ColumnarTable:
+    """Column oriented copy of a stats report.
+
+    Rows are folded into typed columns as they stream in and are not kept around, so a 10k row report costs a
+    few flat arrays instead of 10k dicts.  Rows missing a key, or with a null, get a null in that column.
+
+    NumPy and Arrow exports share the columns' buffers, which pins them: export once the table is complete.
+
+        table = ColumnarTable.from_rows(client.stats.iter_skater_stats_summary("20102011", "20232024"))
+        points = table["points"].to_numpy()
+    """
+
+    def __init__(self, columns: Optional[Dict[str, Column]] = None, num_rows: int = 0) -> None:
+        self.columns: Dict[str, Column] = columns or {}
+        self._num_rows = num_rows
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "ColumnarTable":
+        table = cls()
+        for row in rows:
+            table.append(row)
+        return table
+
+    def append(self, row: dict) -> None:
+        columns, n = self.columns, self._num_rows
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = Column(name)
+                for _ in range(n):
+                    column.append(None)
+            column.append(value)
+        if len(row) != len(columns):
+            for column in columns.values():
+                if len(column) == n:
+                    column.append(None)
+        self._num_rows = n + 1
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    def row(self, i: int) -> dict:
+        if not -self._num_rows <= i < self._num_rows:
+            raise IndexError(i)
+        i %= self._num_rows
+        return {name: column.get(i) for name, column in self.columns.items()}
+
+    def to_rows(self) -> List[dict]:
+        return [self.row(i) for i in range(self._num_rows)]
+
+    def to_numpy(self) -> dict:
+        """``{column name: numpy array}``, see ``Column.to_numpy``."""
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def to_arrow(self):
+        """A ``pyarrow.Table`` over the columns' buffers, see ``Column.to_arrow``."""
+        pa = _require("pyarrow")
+        return pa.table({name: column.to_arrow() for name, column in self.columns.items()})
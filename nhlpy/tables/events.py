@@ -0,0 +1,281 @@
+import array
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from nhlpy.tables.columnar import _require
+
+# typeCode -> typeDescKey as the play-by-play endpoint reports them.  Codes not listed here are learned as games
+# are appended.
+EVENT_TYPES: Dict[int, str] = {
+    502: "faceoff",
+    503: "hit",
+    504: "giveaway",
+    505: "goal",
+    506: "shot-on-goal",
+    507: "missed-shot",
+    508: "blocked-shot",
+    509: "penalty",
+    516: "stoppage",
+    520: "period-start",
+    521: "period-end",
+    523: "shootout-complete",
+    524: "game-end",
+    525: "takeaway",
+    535: "delayed-penalty",
+    537: "failed-shot-attempt",
+}
+
+SHOT_EVENTS = ("goal", "shot-on-goal", "missed-shot", "blocked-shot")
+
+# Stand in for plays without coordinates.  Ids (team, players) use 0, which the API never hands out.
+NO_COORD = -32768
+
+# Column name -> array typecode.
+SCHEMA = {
+    "game_id": "i",
+    "event_id": "i",
+    "period": "b",
+    "period_seconds": "h",
+    "type_code": "h",
+    "team_id": "h",
+    "x": "h",
+    "y": "h",
+    "situation_code": "h",
+    "player_id": "i",
+    "secondary_player_id": "i",
+    "tertiary_player_id": "i",
+    "goalie_id": "i",
+}
+
+PLAYER_COLUMNS = ("player_id", "secondary_player_id", "tertiary_player_id", "goalie_id")
+
+# Where each player column is read from in a play's ``details``, first key present wins.  The primary player is
+# the one doing the thing: shooter, scorer, hitter, faceoff winner, penalized player.
+_PLAYER_KEYS = {
+    "player_id": (
+        "scoringPlayerId",
+        "shootingPlayerId",
+        "hittingPlayerId",
+        "winningPlayerId",
+        "committedByPlayerId",
+        "playerId",
+    ),
+    "secondary_player_id": (
+        "assist1PlayerId",
+        "blockingPlayerId",
+        "hitteePlayerId",
+        "losingPlayerId",
+        "drawnByPlayerId",
+    ),
+    "tertiary_player_id": ("assist2PlayerId", "servedByPlayerId"),
+    "goalie_id": ("goalieInNetId",),
+}
+
+
+def _seconds(clock: Optional[str]) -> int:
+    """Converts a "MM:SS" clock to seconds."""
+    if not clock:
+        return 0
+    minutes, _, seconds = clock.partition(":")
+    return int(minutes) * 60 + int(seconds or 0)
+
+
+class EventTable:
+    """Play-by-play events for any number of games, as flat typed arrays.
+
+    Each play becomes one row across the columns in ``SCHEMA`` (37 bytes, about 60 with the indexes), instead of
+    the nested dicts ``GameCenter.play_by_play`` returns.  Missing ids are 0 and missing coordinates are ``NO_COORD``.
+
+    Rows are indexed by event type, player (any player column) and game as they are appended, so filters like
+    "every shot by a player this season" only touch the matching rows, see ``select``.
+
+        events = EventTable()
+        for game_id in client.helpers.game_ids_by_season("20232024", game_types=[2]):
+            events.append_game(client.game_center.play_by_play(game_id))
+        shots = events.select(event_types=SHOT_EVENTS, player_id=8478402)
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array.array] = {name: array.array(code) for name, code in SCHEMA.items()}
+        self.event_types: Dict[int, str] = dict(EVENT_TYPES)
+        self.games: Dict[int, dict] = {}
+        self._game_rows: Dict[int, range] = {}
+        self._by_type: Dict[int, array.array] = {}
+        self._by_player: Dict[int, array.array] = {}
+
+    @classmethod
+    def from_games(cls, games: Iterable[dict]) -> "EventTable":
+        table = cls()
+        for game in games:
+            table.append_game(game)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.columns["game_id"])
+
+    def __getitem__(self, name: str) -> array.array:
+        return self.columns[name]
+
+    def append_game(self, play_by_play: dict) -> None:
+        """Adds the plays of one ``GameCenter.play_by_play`` response.
+
+        Raises:
+            ValueError: The game is already in the table.
+        """
+        game_id = play_by_play["id"]
+        if game_id in self.games:
+            raise ValueError(f"Game {game_id} is already loaded.")
+
+        columns = self.columns
+        start = len(self)
+        row = start
+        for play in play_by_play.get("plays", []):
+            details = play.get("details") or {}
+            type_code = play.get("typeCode", 0)
+            if type_code not in self.event_types and play.get("typeDescKey"):
+                self.event_types[type_code] = play["typeDescKey"]
+            situation = play.get("situationCode")
+
+            columns["game_id"].append(game_id)
+            columns["event_id"].append(play.get("eventId", 0))
+            columns["period"].append((play.get("periodDescriptor") or {}).get("number", 0))
+            columns["period_seconds"].append(_seconds(play.get("timeInPeriod")))
+            columns["type_code"].append(type_code)
+            columns["team_id"].append(details.get("eventOwnerTeamId") or 0)
+            columns["x"].append(details.get("xCoord", NO_COORD))
+            columns["y"].append(details.get("yCoord", NO_COORD))
+            columns["situation_code"].append(int(situation) if situation else -1)
+
+            self._index(self._by_type, type_code, row)
+            seen = set()
+            for column, keys in _PLAYER_KEYS.items():
+                player = next((details[key] for key in keys if details.get(key)), 0)
+                columns[column].append(player)
+                if player and player not in seen:
+                    seen.add(player)
+                    self._index(self._by_player, player, row)
+            row += 1
+
+        self._game_rows[game_id] = range(start, row)
+        self.games[game_id] = {
+            "season": play_by_play.get("season"),
+            "gameType": play_by_play.get("gameType"),
+            "gameDate": play_by_play.get("gameDate"),
+            "homeTeamId": (play_by_play.get("homeTeam") or {}).get("id"),
+            "awayTeamId": (play_by_play.get("awayTeam") or {}).get("id"),
+        }
+
+    @staticmethod
+    def _index(index: Dict[int, array.array], key: int, row: int) -> None:
+        rows = index.get(key)
+        if rows is None:
+            rows = index[key] = array.array("i")
+        rows.append(row)
+
+    def _type_code(self, event_type: Union[int, str]) -> int:
+        if isinstance(event_type, int):
+            return event_type
+        for code, name in self.event_types.items():
+            if name == event_type:
+                return code
+        raise ValueError(f"Unknown event type {event_type!r}, known types: {sorted(self.event_types.values())}")
+
+    def select(
+        self,
+        event_types: Optional[Iterable[Union[int, str]]] = None,
+        player_id: Optional[int] = None,
+        involving_player_id: Optional[int] = None,
+        team_id: Optional[int] = None,
+        game_id: Optional[int] = None,
+        period: Optional[int] = None,
+    ) -> List[int]:
+        """Row numbers of the events matching every given filter, in table order.
+
+        Starts from the smallest applicable index (event type, player or game) and checks the remaining filters
+        on those rows only.
+
+        Args:
+            event_types: typeDescKey names (``"shot-on-goal"``) or type codes, see ``SHOT_EVENTS``.
+            player_id: Primary player of the event: shooter, scorer, hitter, faceoff winner, penalized player...
+            involving_player_id: The player shows up in any player column, goalies and assists included.
+            team_id: Team the event is credited to (eventOwnerTeamId).
+            game_id: Game id.
+            period: Period number.
+
+        Raises:
+            ValueError: An event type name that isn't known.
+        """
+        columns = self.columns
+        # (row count, rows) per applicable index.  Event types span several index lists, merged only if used.
+        candidates: List[tuple] = []
+        checks = []
+
+        if event_types is not None:
+            codes = {self._type_code(t) for t in event_types}
+            per_type = [self._by_type.get(code, ()) for code in codes]
+            candidates.append((sum(map(len, per_type)), per_type))
+            checks.append(lambda i, col=columns["type_code"]: col[i] in codes)
+        if player_id is not None:
+            rows = self._by_player.get(player_id, ())
+            candidates.append((len(rows), rows))
+            checks.append(lambda i, col=columns["player_id"]: col[i] == player_id)
+        if involving_player_id is not None:
+            rows = self._by_player.get(involving_player_id, ())
+            candidates.append((len(rows), rows))
+            player_columns = [columns[name] for name in PLAYER_COLUMNS]
+            checks.append(lambda i: any(col[i] == involving_player_id for col in player_columns))
+        if game_id is not None:
+            rows = self._game_rows.get(game_id, ())
+            candidates.append((len(rows), rows))
+            checks.append(lambda i, col=columns["game_id"]: col[i] == game_id)
+        if team_id is not None:
+            checks.append(lambda i, col=columns["team_id"]: col[i] == team_id)
+        if period is not None:
+            checks.append(lambda i, col=columns["period"]: col[i] == period)
+
+        if not candidates:
+            rows = range(len(self))
+        else:
+            _, rows = min(candidates, key=lambda candidate: candidate[0])
+            if isinstance(rows, list):
+                rows = sorted(chain.from_iterable(rows))
+        return [i for i in rows if all(check(i) for check in checks)]
+
+    def event(self, i: int) -> dict:
+        """Row ``i`` as a flat dict, with ``type`` added and missing values as None."""
+        out = {}
+        for name, column in self.columns.items():
+            value = column[i]
+            if (name in ("x", "y") and value == NO_COORD) or (name == "situation_code" and value < 0):
+                value = None
+            elif (name in PLAYER_COLUMNS or name == "team_id") and not value:
+                value = None
+            out[name] = value
+        out["type"] = self.event_types.get(out["type_code"])
+        return out
+
+    def events(self, rows: Optional[Iterable[int]] = None) -> Iterator[dict]:
+        """``event`` for each of ``rows`` (default: every row)."""
+        for i in range(len(self)) if rows is None else rows:
+            yield self.event(i)
+
+    def to_numpy(self) -> Dict[str, object]:
+        """``{column name: numpy array}`` sharing the columns' memory.  Sentinels are left as is."""
+        np = _require("numpy")
+        return {name: np.frombuffer(column, dtype=f"i{column.itemsize}") for name, column in self.columns.items()}
+
+    def to_arrow(self):
+        """A ``pyarrow.Table`` over the columns' buffers, ``type`` as a dictionary column of the type names."""
+        pa = _require("pyarrow")
+        arrow_types = {1: pa.int8(), 2: pa.int16(), 4: pa.int32(), 8: pa.int64()}
+        arrays = {
+            name: pa.Array.from_buffers(arrow_types[column.itemsize], len(column), [None, pa.py_buffer(column)])
+            for name, column in self.columns.items()
+        }
+        codes = sorted(self.event_types)
+        lookup = {code: n for n, code in enumerate(codes)}
+        arrays["type"] = pa.DictionaryArray.from_arrays(
+            pa.array([lookup.get(code) for code in self.columns["type_code"]], type=pa.int16()),
+            pa.array([self.event_types[code] for code in codes], type=pa.string()),
+        )
+        return pa.table(arrays)
@@ -0,0 +1,157 @@
+import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from nhlpy.tables.events import _seconds
+
+PERIOD_SECONDS = 1200
+SHIFT_TYPE_CODE = 517
+# Plays whose on ice skaters are the ones starting a shift at that moment, not the ones finishing one.
+_FACEOFF_TYPE_CODES = frozenset({502, 520})
+
+OnIce = Dict[int, FrozenSet[int]]
+
+
+def game_seconds(period: int, period_seconds: int) -> int:
+    """Seconds since the start of the game, counting every period as 20 minutes."""
+    return (period - 1) * PERIOD_SECONDS + period_seconds
+
+
+class ShiftIndex:
+    """Who was on the ice, per team, at any moment of one game.
+
+    Built from ``GameCenter.shift_chart_data`` rows with a sweep over the shift start / end times: the sorted change
+    times are kept in an array next to the on ice set of each interval between two changes, so a lookup is a
+    bisect, ``O(log n)``.
+
+    At a change time two sets of players are candidates.  Events are credited to the players finishing their shift
+    (a goal ends the shifts of the players on the ice), faceoffs and period starts to the ones starting theirs.
+
+        index = client.game_center.shift_index("2023020204")
+        index.on_ice(2, 754)  # {team id: frozenset of player ids}
+    """
+
+    def __init__(self, shifts: Iterable[dict]) -> None:
+        changes: Dict[int, List[Tuple[int, int, int]]] = {}
+        game_id = None
+        for shift in shifts:
+            if shift.get("typeCode", SHIFT_TYPE_CODE) != SHIFT_TYPE_CODE or not shift.get("endTime"):
+                continue
+            if game_id is None:
+                game_id = shift["gameId"]
+            elif shift["gameId"] != game_id:
+                raise ValueError(f"Shifts of several games ({game_id}, {shift['gameId']}), build one index per game.")
+            start = game_seconds(shift["period"], _seconds(shift["startTime"]))
+            end = game_seconds(shift["period"], _seconds(shift["endTime"]))
+            if end <= start:
+                continue
+            team_id, player_id = shift["teamId"], shift["playerId"]
+            changes.setdefault(start, []).append((team_id, player_id, 1))
+            changes.setdefault(end, []).append((team_id, player_id, -1))
+
+        self.game_id: Optional[int] = game_id
+        self.change_times = array.array("i", sorted(changes))
+        # self._intervals[j]: on ice from change_times[j] to change_times[j + 1].
+        self._intervals: List[OnIce] = []
+        self.team_ids: FrozenSet[int] = frozenset(team for moves in changes.values() for team, _, _ in moves)
+
+        counts: Dict[Tuple[int, int], int] = {}
+        for time in self.change_times:
+            for team_id, player_id, step in changes[time]:
+                key = (team_id, player_id)
+                counts[key] = counts.get(key, 0) + step
+                if not counts[key]:
+                    del counts[key]
+            on_ice: Dict[int, set] = {team_id: set() for team_id in self.team_ids}
+            for team_id, player_id in counts:
+                on_ice[team_id].add(player_id)
+            self._intervals.append({team_id: frozenset(players) for team_id, players in on_ice.items()})
+
+    @classmethod
+    def from_shift_chart(cls, response: dict) -> "ShiftIndex":
+        """From a ``GameCenter.shift_chart_data`` response."""
+        return cls(response.get("data", []))
+
+    def __len__(self) -> int:
+        return len(self.change_times)
+
+    def _empty(self) -> OnIce:
+        return {team_id: frozenset() for team_id in self.team_ids}
+
+    def _interval(self, j: int) -> OnIce:
+        if 0 <= j < len(self._intervals) - 1:
+            return self._intervals[j]
+        return self._empty()
+
+    def on_ice(self, period: int, period_seconds: int, faceoff: bool = False) -> OnIce:
+        """Players on the ice at a moment of the game, goalies included.
+
+        Args:
+            period (int): Period number.
+            period_seconds (int): Seconds into the period.
+            faceoff (bool): At a change time, return the players starting a shift rather than the ones ending one.
+
+        Returns:
+            ``{team id: frozenset of player ids}``
+        """
+        t = game_seconds(period, period_seconds)
+        if faceoff:
+            return self._interval(bisect_right(self.change_times, t) - 1)
+        return self._interval(bisect_left(self.change_times, t) - 1)
+
+    def on_ice_many(self, moments: Iterable[Tuple[int, int, bool]]) -> List[OnIce]:
+        """``on_ice`` for a batch of ``(period, period_seconds, faceoff)`` moments.
+
+        The moments are sorted once and merged against the change times, so the batch costs one pass over the
+        index rather than a bisect per moment.
+        """
+        keyed = [(game_seconds(period, seconds), faceoff) for period, seconds, faceoff in moments]
+        order = sorted(range(len(keyed)), key=keyed.__getitem__)
+        out: List[Optional[OnIce]] = [None] * len(keyed)
+        times, j = self.change_times, 0
+        for n in order:
+            t, faceoff = keyed[n]
+            # Number of change times before t, at or before t for faceoffs.  Moments sort as (t, faceoff), so j
+            # only ever moves forward.
+            while j < len(times) and (times[j] <= t if faceoff else times[j] < t):
+                j += 1
+            out[n] = self._interval(j - 1)
+        return out
+
+    def annotate(self, play_by_play: dict) -> List[dict]:
+        """On ice skaters, goalies and strength for every play of the game's ``GameCenter.play_by_play``.
+
+        Goalies are told apart from skaters with the response's ``rosterSpots``.
+
+        Returns:
+            One dict per play, in order: ``eventId``, ``homeSkaters`` / ``awaySkaters`` (frozensets of player
+            ids), ``homeGoalie`` / ``awayGoalie`` (None for an empty net) and ``strength``, home skaters vs away
+            skaters, e.g. ``"5v4"``.
+        """
+        goalies = {spot["playerId"] for spot in play_by_play.get("rosterSpots", []) if spot.get("positionCode") == "G"}
+        home_id, away_id = play_by_play["homeTeam"]["id"], play_by_play["awayTeam"]["id"]
+        plays = play_by_play.get("plays", [])
+        moments = [
+            (
+                (play.get("periodDescriptor") or {}).get("number", 0),
+                _seconds(play.get("timeInPeriod")),
+                play.get("typeCode") in _FACEOFF_TYPE_CODES,
+            )
+            for play in plays
+        ]
+
+        out = []
+        for play, on_ice in zip(plays, self.on_ice_many(moments)):
+            home, away = on_ice.get(home_id, frozenset()), on_ice.get(away_id, frozenset())
+            home_skaters, away_skaters = home - goalies, away - goalies
+            out.append(
+                {
+                    "eventId": play.get("eventId"),
+                    "homeSkaters": home_skaters,
+                    "awaySkaters": away_skaters,
+                    "homeGoalie": next(iter(home & goalies), None),
+                    "awayGoalie": next(iter(away & goalies), None),
+                    "strength": f"{len(home_skaters)}v{len(away_skaters)}",
+                }
+            )
+        return out
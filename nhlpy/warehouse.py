@@ -0,0 +1,602 @@
+"""A local SQLite mirror of a season: games, plays, shifts, players, rosters and season stats, kept up to date
+incrementally.
+
+    warehouse = Warehouse("nhl.sqlite")
+    with NHLClient() as client:
+        report = warehouse.sync(client, "20232024")
+    print(report)  # 20232024: 31 requests, 9 games changed, 9 loaded, 0 failed, stats refreshed in 4.2s
+    warehouse.execute("SELECT type_desc_key, COUNT(*) FROM plays GROUP BY 1").fetchall()
+
+The first sync of a season walks its whole schedule and loads every game played so far.  Later syncs only read
+the schedule weeks since the previous one, load the games that started or changed state since (plus any live
+ones), and refresh the season stats when a game went final, so a daily refresh costs a few dozen requests.
+"""
+
+import json
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+import httpx
+
+from nhlpy.api.game_center import FINAL_GAME_STATES, LIVE_GAME_STATES
+from nhlpy.concurrency import as_completed_bounded, worker_pool
+from nhlpy.http_client import NHLApiException
+from nhlpy.sqlite_store import SQLiteStore
+from nhlpy.tables.events import _PLAYER_KEYS, _seconds
+
+# Games in these states have plays worth loading.  FUT, PRE, PPD and CNCL games don't.
+STARTED_GAME_STATES = LIVE_GAME_STATES | FINAL_GAME_STATES
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id INTEGER PRIMARY KEY,
+    season INTEGER NOT NULL,
+    game_type INTEGER NOT NULL,
+    game_date TEXT,
+    start_time_utc TEXT,
+    venue TEXT,
+    home_team TEXT,
+    away_team TEXT,
+    home_team_id INTEGER,
+    away_team_id INTEGER,
+    home_score INTEGER,
+    away_score INTEGER,
+    game_state TEXT,
+    final INTEGER NOT NULL DEFAULT 0,
+    -- game_state the plays and shifts were loaded at, NULL until they are.
+    loaded_state TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_season_date ON games (season, game_date);
+
+CREATE TABLE IF NOT EXISTS plays (
+    game_id INTEGER NOT NULL,
+    event_id INTEGER NOT NULL,
+    sort_order INTEGER,
+    period INTEGER,
+    period_type TEXT,
+    time_in_period TEXT,
+    period_seconds INTEGER,
+    type_code INTEGER,
+    type_desc_key TEXT,
+    situation_code TEXT,
+    team_id INTEGER,
+    x INTEGER,
+    y INTEGER,
+    player_id INTEGER,
+    secondary_player_id INTEGER,
+    tertiary_player_id INTEGER,
+    goalie_id INTEGER,
+    details TEXT,
+    PRIMARY KEY (game_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS plays_player ON plays (player_id);
+
+CREATE TABLE IF NOT EXISTS shifts (
+    shift_id INTEGER PRIMARY KEY,
+    game_id INTEGER NOT NULL,
+    player_id INTEGER,
+    team_id INTEGER,
+    team_abbrev TEXT,
+    period INTEGER,
+    shift_number INTEGER,
+    start_time TEXT,
+    end_time TEXT,
+    duration TEXT,
+    type_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS shifts_game ON shifts (game_id);
+CREATE INDEX IF NOT EXISTS shifts_player ON shifts (player_id);
+
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    first_name TEXT,
+    last_name TEXT,
+    position_code TEXT,
+    sweater_number INTEGER,
+    shoots_catches TEXT,
+    birth_date TEXT,
+    birth_country TEXT,
+    height_in_inches INTEGER,
+    weight_in_pounds INTEGER,
+    headshot TEXT,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rosters (
+    season INTEGER NOT NULL,
+    team TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    sweater_number INTEGER,
+    position_code TEXT,
+    PRIMARY KEY (season, team, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS skater_season_stats (
+    season INTEGER NOT NULL,
+    game_type INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    team_abbrevs TEXT,
+    position_code TEXT,
+    games_played INTEGER,
+    goals INTEGER,
+    assists INTEGER,
+    points INTEGER,
+    plus_minus INTEGER,
+    penalty_minutes INTEGER,
+    shots INTEGER,
+    time_on_ice_per_game REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (season, game_type, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS goalie_season_stats (
+    season INTEGER NOT NULL,
+    game_type INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    team_abbrevs TEXT,
+    games_played INTEGER,
+    games_started INTEGER,
+    wins INTEGER,
+    losses INTEGER,
+    ot_losses INTEGER,
+    save_pct REAL,
+    goals_against_average REAL,
+    shutouts INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (season, game_type, player_id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_PLAYER_UPSERT = """
+INSERT INTO players (
+    player_id, first_name, last_name, position_code, sweater_number, shoots_catches, birth_date, birth_country,
+    height_in_inches, weight_in_pounds, headshot, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (player_id) DO UPDATE SET
+    first_name = COALESCE(excluded.first_name, first_name),
+    last_name = COALESCE(excluded.last_name, last_name),
+    position_code = COALESCE(excluded.position_code, position_code),
+    sweater_number = COALESCE(excluded.sweater_number, sweater_number),
+    shoots_catches = COALESCE(excluded.shoots_catches, shoots_catches),
+    birth_date = COALESCE(excluded.birth_date, birth_date),
+    birth_country = COALESCE(excluded.birth_country, birth_country),
+    height_in_inches = COALESCE(excluded.height_in_inches, height_in_inches),
+    weight_in_pounds = COALESCE(excluded.weight_in_pounds, weight_in_pounds),
+    headshot = COALESCE(excluded.headshot, headshot),
+    updated_at = excluded.updated_at
+"""
+
+_GAME_UPSERT = """
+INSERT INTO games (
+    game_id, season, game_type, game_date, start_time_utc, venue, home_team, away_team, home_team_id,
+    away_team_id, home_score, away_score, game_state, final, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (game_id) DO UPDATE SET
+    game_date = excluded.game_date,
+    start_time_utc = excluded.start_time_utc,
+    venue = COALESCE(excluded.venue, venue),
+    home_score = COALESCE(excluded.home_score, home_score),
+    away_score = COALESCE(excluded.away_score, away_score),
+    game_state = excluded.game_state,
+    final = excluded.final,
+    updated_at = excluded.updated_at
+"""
+
+
+def _default(value):
+    """Localized names come as ``{"default": ...}``."""
+    return value.get("default") if isinstance(value, dict) else value
+
+
+class SyncReport:
+    """What a ``Warehouse.sync`` run did."""
+
+    def __init__(self, season: str) -> None:
+        self.season = season
+        self.games_changed = 0
+        self.games_loaded = 0
+        self.failed: Dict[int, BaseException] = {}
+        self.rosters_synced = False
+        self.stats_synced = False
+        self.requests = 0
+        self.elapsed = 0.0
+
+    def __str__(self) -> str:
+        parts = [f"{self.requests} requests", f"{self.games_changed} games changed", f"{self.games_loaded} loaded"]
+        parts.append(f"{len(self.failed)} failed")
+        if self.rosters_synced:
+            parts.append("rosters refreshed")
+        if self.stats_synced:
+            parts.append("stats refreshed")
+        return f"{self.season}: " + ", ".join(parts) + f" in {self.elapsed:.1f}s"
+
+
+class Warehouse(SQLiteStore):
+    """Normalized SQLite store of NHL data, filled and refreshed by ``sync``.
+
+    Tables: ``games`` (one row per scheduled game, with its state and whether it is final), ``plays`` and
+    ``shifts`` (per game, replaced whenever the game is reloaded), ``players``, ``rosters`` (per season and team),
+    ``skater_season_stats`` and ``goalie_season_stats`` (the league summary reports, the full row in ``data``) and
+    ``sync_state``.  Query them with ``execute`` or any SQLite client; like ``DiskCache`` the file runs in WAL mode
+    so readers don't block a running sync.
+    """
+
+    _schema = _SCHEMA
+
+    def execute(self, sql: str, params: Iterable = ()) -> sqlite3.Cursor:
+        return self._connection().execute(sql, tuple(params))
+
+    def _state(self, key: str) -> Optional[str]:
+        row = self.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_state(conn: sqlite3.Connection, key: str, value) -> None:
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def sync(
+        self,
+        client,
+        season: str,
+        game_types: Optional[List[int]] = None,
+        rosters_max_age: float = 7 * 24 * 3600,
+        today: Optional[date] = None,
+    ) -> SyncReport:
+        """Brings the season up to date.
+
+        1. Schedule: the whole season on the first run (``Schedule.season_games``), afterwards only the weeks
+           from the previous sync (or the oldest game of the last week that isn't final yet) to today.
+        2. Games that started, changed state or are live get their play-by-play and shift chart (re)loaded,
+           concurrently up to ``ClientConfig.max_concurrency``.  A game whose requests fail is kept in
+           ``report.failed`` and retried by the next sync.
+        3. Rosters, when older than ``rosters_max_age`` seconds and the season isn't over.
+        4. The skater and goalie summary reports of each game type (regular season, playoffs) in which a game
+           went final.
+
+        Only a synchronous ``NHLClient`` is supported.
+
+        Args:
+            client (NHLClient): Client to fetch with.
+            season (str): Season in YYYYYYYY format (e.g., "20232024").
+            game_types (List[int], optional): Only these game types (1: Preseason, 2: Regular season,
+                3: Playoffs).  Defaults to every game.
+            rosters_max_age (float): Defaults to a week.  Seconds before rosters are fetched again.
+            today (date, optional): Last day of schedule to read.  Defaults to today.
+
+        Returns:
+            SyncReport: Requests used, games changed, loaded and failed.
+        """
+        started = time.monotonic()
+        requests_before = client.request_stats.get("requests", 0)
+        max_concurrency = client.config.max_concurrency
+        report = SyncReport(season)
+        today = today or date.today()
+
+        went_final = self._sync_schedule(client, season, game_types, today, report)
+        went_final |= self._load_games(client, season, game_types, report, max_concurrency)
+        if self._rosters_due(season, rosters_max_age):
+            self._sync_rosters(client, season, max_concurrency)
+            report.rosters_synced = True
+        stale_stats = [
+            game_type
+            for game_type in self._stats_game_types(season, game_types)
+            if game_type in went_final or self._state(f"stats:{season}:{game_type}") is None
+        ]
+        if stale_stats:
+            self._sync_stats(client, season, stale_stats)
+            report.stats_synced = True
+
+        report.requests = client.request_stats.get("requests", 0) - requests_before
+        report.elapsed = time.monotonic() - started
+        return report
+
+    def _schedule_stubs(self, client, season: str, game_types, today: date) -> Iterator[dict]:
+        """Schedule game stubs to upsert, the whole season the first time and the weeks since the last sync after."""
+        synced_through = self._state(f"schedule:{season}")
+        if synced_through is None:
+            yield from client.schedule.season_games(season, game_types)
+            return
+
+        start = date.fromisoformat(synced_through) - timedelta(days=1)
+        stale = self.execute(
+            "SELECT MIN(game_date) FROM games WHERE season = ? AND NOT final AND game_date BETWEEN ? AND ?",
+            (int(season), (today - timedelta(days=7)).isoformat(), today.isoformat()),
+        ).fetchone()[0]
+        if stale:
+            start = min(start, date.fromisoformat(stale))
+        week: Optional[str] = start.isoformat()
+        while week and week <= today.isoformat():
+            page = client.schedule.weekly_schedule(week)
+            for day in page.get("gameWeek", []):
+                for game in day.get("games", []):
+                    if str(game.get("season", season)) != str(season):
+                        continue
+                    if game_types and game.get("gameType") not in game_types:
+                        continue
+                    yield {**game, "gameDate": day.get("date")}
+            next_week = page.get("nextStartDate")
+            week = next_week if next_week and next_week > week else None
+
+    def _sync_schedule(self, client, season: str, game_types, today: date, report: SyncReport) -> Set[int]:
+        """Upserts the schedule.  Returns the game types in which a game went final."""
+        stubs = list(self._schedule_stubs(client, season, game_types, today))
+        now = time.time()
+        went_final = set()
+        with self._transaction() as conn:
+            for game in stubs:
+                home, away = game.get("homeTeam") or {}, game.get("awayTeam") or {}
+                state = game.get("gameState")
+                final = state in FINAL_GAME_STATES
+                row = (
+                    game["id"],
+                    int(season),
+                    game.get("gameType"),
+                    game.get("gameDate"),
+                    game.get("startTimeUTC"),
+                    _default(game.get("venue")),
+                    home.get("abbrev"),
+                    away.get("abbrev"),
+                    home.get("id"),
+                    away.get("id"),
+                    home.get("score"),
+                    away.get("score"),
+                    state,
+                    int(final),
+                    now,
+                )
+                before = conn.execute(
+                    "SELECT game_state, home_score, away_score, game_date FROM games WHERE game_id = ?", (game["id"],)
+                ).fetchone()
+                after = (state, home.get("score"), away.get("score"), game.get("gameDate"))
+                if before != after:
+                    report.games_changed += 1
+                    if final and (before is None or before[0] not in FINAL_GAME_STATES):
+                        went_final.add(game.get("gameType"))
+                conn.execute(_GAME_UPSERT, row)
+            self._set_state(conn, f"schedule:{season}", today.isoformat())
+        return went_final
+
+    def _load_games(self, client, season: str, game_types, report: SyncReport, max_concurrency: int) -> Set[int]:
+        """(Re)loads plays and shifts of the games that need it.  Returns the game types in which a game went
+        final."""
+        states = ", ".join(f"'{state}'" for state in sorted(STARTED_GAME_STATES))
+        live = ", ".join(f"'{state}'" for state in sorted(LIVE_GAME_STATES))
+        query = (
+            f"SELECT game_id FROM games WHERE season = ? AND game_state IN ({states}) "
+            f"AND (loaded_state IS NULL OR loaded_state != game_state OR game_state IN ({live}))"
+        )
+        params: list = [int(season)]
+        if game_types:
+            query += f" AND game_type IN ({', '.join('?' * len(game_types))})"
+            params += list(game_types)
+        game_ids = [game_id for (game_id,) in self.execute(query + " ORDER BY game_id", params)]
+
+        def fetch(game_id: int) -> tuple:
+            return client.game_center.play_by_play(str(game_id)), client.game_center.shift_chart_data(str(game_id))
+
+        went_final = set()
+        with worker_pool(max_concurrency) as pool:
+            # Each game is written and dropped as it arrives, only the games in flight are held in memory.
+            for game_id, future in as_completed_bounded(pool, fetch, game_ids, max_concurrency):
+                try:
+                    play_by_play, shift_chart = future.result()
+                except (NHLApiException, httpx.HTTPError) as e:
+                    report.failed[game_id] = e
+                    continue
+                game_type = self._store_game(play_by_play, shift_chart)
+                if game_type is not None:
+                    went_final.add(game_type)
+                report.games_loaded += 1
+        return went_final
+
+    def _store_game(self, play_by_play: dict, shift_chart: dict) -> Optional[int]:
+        """Replaces one game's plays and shifts, in one transaction.  Returns the game's type when it is now final
+        and wasn't before, None otherwise."""
+        game_id = play_by_play["id"]
+        state = play_by_play.get("gameState")
+        home, away = play_by_play.get("homeTeam") or {}, play_by_play.get("awayTeam") or {}
+        now = time.time()
+        plays = []
+        for play in play_by_play.get("plays", []):
+            details = play.get("details") or {}
+            period = play.get("periodDescriptor") or {}
+            players = [next((details[key] for key in keys if details.get(key)), None) for keys in _PLAYER_KEYS.values()]
+            plays.append(
+                (
+                    game_id,
+                    play.get("eventId"),
+                    play.get("sortOrder"),
+                    period.get("number"),
+                    period.get("periodType"),
+                    play.get("timeInPeriod"),
+                    _seconds(play.get("timeInPeriod")),
+                    play.get("typeCode"),
+                    play.get("typeDescKey"),
+                    play.get("situationCode"),
+                    details.get("eventOwnerTeamId"),
+                    details.get("xCoord"),
+                    details.get("yCoord"),
+                    *players,
+                    json.dumps(details) if details else None,
+                )
+            )
+        shifts = [
+            (
+                shift.get("id"),
+                game_id,
+                shift.get("playerId"),
+                shift.get("teamId"),
+                shift.get("teamAbbrev"),
+                shift.get("period"),
+                shift.get("shiftNumber"),
+                shift.get("startTime"),
+                shift.get("endTime"),
+                shift.get("duration"),
+                shift.get("typeCode"),
+            )
+            for shift in shift_chart.get("data", [])
+        ]
+        players = [
+            (
+                spot["playerId"],
+                _default(spot.get("firstName")),
+                _default(spot.get("lastName")),
+                spot.get("positionCode"),
+                spot.get("sweaterNumber"),
+                None,
+                None,
+                None,
+                None,
+                None,
+                spot.get("headshot"),
+                now,
+            )
+            for spot in play_by_play.get("rosterSpots", [])
+        ]
+        final = state in FINAL_GAME_STATES
+        with self._transaction() as conn:
+            game_type, loaded_state = conn.execute(
+                "SELECT game_type, loaded_state FROM games WHERE game_id = ?", (game_id,)
+            ).fetchone()
+            conn.execute("DELETE FROM plays WHERE game_id = ?", (game_id,))
+            conn.execute("DELETE FROM shifts WHERE game_id = ?", (game_id,))
+            conn.executemany(f"INSERT INTO plays VALUES ({', '.join('?' * 18)})", plays)
+            conn.executemany(f"INSERT OR REPLACE INTO shifts VALUES ({', '.join('?' * 11)})", shifts)
+            conn.executemany(_PLAYER_UPSERT, players)
+            conn.execute(
+                "UPDATE games SET game_state = ?, final = ?, loaded_state = ?, home_score = COALESCE(?, home_score), "
+                "away_score = COALESCE(?, away_score), venue = COALESCE(?, venue), updated_at = ? WHERE game_id = ?",
+                (
+                    state,
+                    int(final),
+                    state,
+                    home.get("score"),
+                    away.get("score"),
+                    _default(play_by_play.get("venue")),
+                    now,
+                    game_id,
+                ),
+            )
+        return game_type if final and loaded_state not in FINAL_GAME_STATES else None
+
+    def _rosters_due(self, season: str, max_age: float) -> bool:
+        synced_at = self._state(f"rosters:{season}")
+        if synced_at is None:
+            return True
+        unfinished = self.execute("SELECT 1 FROM games WHERE season = ? AND NOT final LIMIT 1", (int(season),))
+        return time.time() - float(synced_at) > max_age and unfinished.fetchone() is not None
+
+    def _sync_rosters(self, client, season: str, max_concurrency: int) -> None:
+        teams = [
+            team
+            for (team,) in self.execute(
+                "SELECT home_team FROM games WHERE season = ? UNION SELECT away_team FROM games WHERE season = ?",
+                (int(season), int(season)),
+            )
+            if team
+        ]
+
+        def roster(team: str) -> dict:
+            return client.teams.team_roster(team_abbr=team, season=season)
+
+        now = time.time()
+        with worker_pool(max_concurrency) as pool:
+            rosters = list(zip(teams, pool.map(roster, teams)))
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM rosters WHERE season = ?", (int(season),))
+            for team, players in rosters:
+                for p in players.get("forwards", []) + players.get("defensemen", []) + players.get("goalies", []):
+                    conn.execute(
+                        _PLAYER_UPSERT,
+                        (
+                            p["id"],
+                            _default(p.get("firstName")),
+                            _default(p.get("lastName")),
+                            p.get("positionCode"),
+                            p.get("sweaterNumber"),
+                            p.get("shootsCatches"),
+                            p.get("birthDate"),
+                            p.get("birthCountry"),
+                            p.get("heightInInches"),
+                            p.get("weightInPounds"),
+                            p.get("headshot"),
+                            now,
+                        ),
+                    )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO rosters VALUES (?, ?, ?, ?, ?)",
+                        (int(season), team, p["id"], p.get("sweaterNumber"), p.get("positionCode")),
+                    )
+            self._set_state(conn, f"rosters:{season}", now)
+
+    def _stats_game_types(self, season: str, game_types) -> List[int]:
+        """Regular season / playoffs, among ``game_types``, with a final game: the ones the summary reports cover."""
+        return [
+            game_type
+            for (game_type,) in self.execute(
+                "SELECT DISTINCT game_type FROM games WHERE season = ? AND final AND game_type IN (2, 3) ORDER BY 1",
+                (int(season),),
+            )
+            if not game_types or game_type in game_types
+        ]
+
+    def _sync_stats(self, client, season: str, game_types: List[int]) -> None:
+        """Replaces the season's skater and goalie summary rows of ``game_types``, leaving the other types'."""
+        skaters, goalies = [], []
+        for game_type in game_types:
+            for row in client.stats.iter_skater_stats_summary(season, season, game_type_id=game_type):
+                skaters.append(
+                    (
+                        int(season),
+                        game_type,
+                        row["playerId"],
+                        row.get("teamAbbrevs"),
+                        row.get("positionCode"),
+                        row.get("gamesPlayed"),
+                        row.get("goals"),
+                        row.get("assists"),
+                        row.get("points"),
+                        row.get("plusMinus"),
+                        row.get("penaltyMinutes"),
+                        row.get("shots"),
+                        row.get("timeOnIcePerGame"),
+                        json.dumps(row),
+                    )
+                )
+            for row in client.stats.iter_goalie_stats_summary(season, season, game_type_id=game_type):
+                goalies.append(
+                    (
+                        int(season),
+                        game_type,
+                        row["playerId"],
+                        row.get("teamAbbrevs"),
+                        row.get("gamesPlayed"),
+                        row.get("gamesStarted"),
+                        row.get("wins"),
+                        row.get("losses"),
+                        row.get("otLosses"),
+                        row.get("savePct"),
+                        row.get("goalsAgainstAverage"),
+                        row.get("shutouts"),
+                        json.dumps(row),
+                    )
+                )
+        types = ", ".join("?" * len(game_types))
+        with self._transaction() as conn:
+            for table in ("skater_season_stats", "goalie_season_stats"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE season = ? AND game_type IN ({types})", (int(season), *game_types)
+                )
+            conn.executemany(f"INSERT OR REPLACE INTO skater_season_stats VALUES ({', '.join('?' * 14)})", skaters)
+            conn.executemany(f"INSERT OR REPLACE INTO goalie_season_stats VALUES ({', '.join('?' * 13)})", goalies)
+            now = time.time()
+            for game_type in game_types:
+                self._set_state(conn, f"stats:{season}:{game_type}", now)
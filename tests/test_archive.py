@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.archive import GameArchive
+from nhlpy.config import ClientConfig
+
+GAME_IDS = [str(2023020001 + i) for i in range(6)]
+
+
+def _api(seen: list, broken=(), live=()):
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        _, _, _, game_id, kind = request.url.path.split("/")
+        with lock:
+            seen.append((game_id, kind))
+        if game_id in broken:
+            return httpx.Response(503)
+        state = "LIVE" if game_id in live else "OFF"
+        return httpx.Response(200, json={"id": int(game_id), "gameState": state, "kind": kind})
+
+    return httpx.MockTransport(handler)
+
+
+def _client(transport) -> NHLClient:
+    return NHLClient(config=ClientConfig(transport=transport, rate_limit=None, max_retries=0, max_concurrency=3))
+
+
+def test_download_stores_every_payload(tmp_path):
+    seen, reports = [], []
+    path = str(tmp_path / "games.sqlite")
+    with _client(_api(seen)) as client:
+        report = client.game_center.download_games(GAME_IDS, path, progress=lambda p: reports.append(p.done))
+
+    assert len(seen) == 12 and report.downloaded == 6 and report.skipped == 0 and report.failed == {}
+    assert report.bytes > 0 and report.games_per_second > 0 and report.eta == 0
+    assert reports == [1, 2, 3, 4, 5, 6]
+    assert "6/6 games (0 skipped, 0 failed)" in str(report)
+    with GameArchive(path) as archive:
+        assert len(archive) == 6 and 2023020001 in archive
+        assert archive.load("2023020003", "play-by-play") == {
+            "id": 2023020003,
+            "gameState": "OFF",
+            "kind": "play-by-play",
+        }
+        assert [game_id for game_id, _ in archive.items("boxscore")] == [int(g) for g in GAME_IDS]
+        with pytest.raises(KeyError):
+            archive.load(2023020001, "landing")
+
+
+def test_rerun_resumes_after_failures(tmp_path):
+    path = str(tmp_path / "games.sqlite")
+    seen = []
+    with _client(_api(seen, broken={GAME_IDS[2]}, live={GAME_IDS[4]})) as client:
+        report = client.game_center.download_games(GAME_IDS, path)
+    assert report.downloaded == 5 and report.not_final == 1
+    assert list(report.failed) == [GAME_IDS[2]] and "ServerErrorException" in repr(report.failed[GAME_IDS[2]])
+
+    # Only the failed and the live game are fetched again.
+    seen.clear()
+    with _client(_api(seen)) as client:
+        report = client.game_center.download_games(GAME_IDS, path)
+    assert sorted({game_id for game_id, _ in seen}) == [GAME_IDS[2], GAME_IDS[4]]
+    assert report.skipped == 4 and report.downloaded == 2 and report.not_final == 0
+
+    # A new kind means every game is missing something.
+    seen.clear()
+    with _client(_api(seen)) as client:
+        client.game_center.download_games(GAME_IDS, path, kinds=["boxscore", "landing"])
+    assert len(seen) == 12
+
+
+def test_archive_completed(tmp_path):
+    archive = GameArchive(str(tmp_path / "games.sqlite"))
+    final = json.dumps({"gameState": "FINAL"}).encode()
+    assert archive.put(1, {"boxscore": final, "play-by-play": final})
+    assert not archive.put(2, {"boxscore": b'{"gameState": "FUT"}', "play-by-play": b"{}"})
+    assert archive.put(3, {"boxscore": final})
+    assert archive.completed(["boxscore", "play-by-play"]) == {1}
+    assert archive.completed(["boxscore"]) == {1, 3}
+    assert archive.get(1, "boxscore") == final and archive.size_bytes > 0
+    archive.close()
+
+
+def test_async_download(tmp_path):
+    seen = []
+    path = str(tmp_path / "games.sqlite")
+
+    async def download():
+        config = ClientConfig(async_transport=_api(seen), rate_limit=None)
+        async with AsyncNHLClient(config=config) as client:
+            return await client.game_center.download_games(GAME_IDS, path)
+
+    assert asyncio.run(download()).downloaded == 6 and len(seen) == 12
@@ -0,0 +1,139 @@
+import asyncio
+import inspect
+import time
+
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.async_nhl_client import _async_api
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import Endpoint, ResourceNotFoundException
+
+
+def _client(handler, max_concurrency: int = 10) -> AsyncNHLClient:
+    config = ClientConfig(async_transport=httpx.MockTransport(handler), max_concurrency=max_concurrency, rate_limit=None)
+    return AsyncNHLClient(config=config)
+
+
+def test_async_client_mirrors_every_sync_method():
+    sync_client, async_client = NHLClient(), AsyncNHLClient()
+    for name in ("teams", "standings", "schedule", "game_center", "stats", "misc", "helpers", "players", "edge"):
+        sync_api, async_api = getattr(sync_client, name), getattr(async_client, name)
+        for method_name, method in inspect.getmembers(sync_api, inspect.ismethod):
+            if method_name.startswith("_"):
+                continue
+            async_method = getattr(async_api, method_name)
+            assert inspect.iscoroutinefunction(async_method) or inspect.isasyncgenfunction(async_method)
+            assert inspect.signature(async_method) == inspect.signature(method)
+
+
+def test_boxscore():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"id": 2020020001})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.game_center.boxscore(game_id="2020020001")
+
+    assert asyncio.run(run()) == {"id": 2020020001}
+    assert requested == ["https://api-web.nhle.com/v1/gamecenter/2020020001/boxscore"]
+
+
+def test_multi_request_method():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("franchise"):
+            return httpx.Response(200, json={"data": [{"id": 19, "fullName": "Buffalo Sabres"}]})
+        standings = [{"teamName": {"default": "Buffalo Sabres"}, "teamAbbrev": {"default": "BUF"}}]
+        return httpx.Response(200, json={"standings": standings})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.teams.teams()
+
+    teams = asyncio.run(run())
+    assert teams[0]["abbr"] == "BUF"
+    assert teams[0]["franchise_id"] == 19
+
+
+def test_gather_respects_max_concurrency():
+    in_flight, peak = 0, 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with _client(handler, max_concurrency=4) as client:
+            return await asyncio.gather(*(client.game_center.boxscore(game_id=str(i)) for i in range(20)))
+
+    assert len(asyncio.run(run())) == 20
+    assert 1 < peak <= 4
+
+
+def test_errors_propagate():
+    async def run():
+        async with _client(lambda request: httpx.Response(404, json={"message": "nope"})) as client:
+            await client.game_center.boxscore(game_id="1")
+
+    with pytest.raises(ResourceNotFoundException):
+        asyncio.run(run())
+
+
+def test_generator_methods_become_async_generators():
+    class Pages:
+        def __init__(self, http_client):
+            self.client = http_client
+
+        def pages(self, count: int):
+            for i in range(count):
+                yield self.client.get(endpoint=Endpoint.API_STATS, resource=f"en/page/{i}").json()["page"]
+
+    AsyncPages = _async_api(Pages)
+    client = _client(lambda request: httpx.Response(200, json={"page": request.url.path.rsplit("/", 1)[-1]}))
+
+    async def run():
+        async with client:
+            api = AsyncPages(client._http_client, client._executor)
+            return [page async for page in api.pages(3)]
+
+    assert inspect.isasyncgenfunction(AsyncPages.pages)
+    assert asyncio.run(run()) == ["0", "1", "2"]
+
+
+def test_cancelling_an_async_generator_stops_it():
+    class Pages:
+        def __init__(self, http_client):
+            self.client = http_client
+
+        def pages(self):
+            while True:
+                yield self.client.get(endpoint=Endpoint.API_STATS, resource="en/page").json()
+                time.sleep(0.2)
+
+    AsyncPages = _async_api(Pages)
+    requests = []
+    client = _client(lambda request: requests.append(request) or httpx.Response(200, json={}))
+
+    async def run():
+        async with client:
+            pages = AsyncPages(client._http_client, client._executor).pages()
+            await pages.__anext__()
+            # Cancelled while next() is sleeping on its worker thread.
+            step = asyncio.ensure_future(pages.__anext__())
+            await asyncio.sleep(0.05)
+            step.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await step
+            polls = len(requests)
+            await asyncio.sleep(0.3)
+            return polls
+
+    assert asyncio.run(run()) == len(requests) == 2
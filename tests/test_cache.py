@@ -0,0 +1,214 @@
+import httpx
+import pytest
+
+from nhlpy.cache import ResponseCache
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import Endpoint, HttpClient, ResourceNotFoundException
+from nhlpy.nhl_client import NHLClient
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(body: bytes = b"{}") -> httpx.Response:
+    return httpx.Response(200, content=body)
+
+
+def _counting_transport(handler=None):
+    calls = []
+
+    def wrapped(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return handler(request) if handler else httpx.Response(200, json={"data": []})
+
+    return httpx.MockTransport(wrapped), calls
+
+
+@pytest.mark.parametrize(
+    "resource,ttl",
+    [
+        ("stats/rest/en/glossary?sort=fullName", 86400),
+        ("stats/rest/en/country", 86400),
+        ("en/franchise", 86400),
+        ("score/now", 10),
+        ("standings/now", 30),
+        ("roster/BUF/20232024", 60),
+    ],
+)
+def test_default_ttls(resource, ttl):
+    assert ResponseCache().ttl_for(resource) == ttl
+
+
+def test_custom_rules_take_precedence():
+    cache = ResponseCache(ttl_rules=[(r"^score/", 0), (r"^roster/", 600)])
+    assert cache.ttl_for("score/now") == 0
+    assert cache.ttl_for("roster/BUF/20232024") == 600
+
+
+def test_key_ignores_param_order():
+    assert ResponseCache.key(Endpoint.API_STATS, "en/skater/summary", {"a": 1, "b": 2}) == ResponseCache.key(
+        Endpoint.API_STATS, "en/skater/summary", {"b": 2, "a": 1}
+    )
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.set("k", "score/now", _response())
+    clock.now = 9
+    assert cache.get("k") is not None
+    clock.now = 10
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "x", _response())
+    cache.set("b", "x", _response())
+    cache.get("a")
+    cache.set("c", "x", _response())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=3000)
+    for key in "abc":
+        cache.set(key, "x", _response(b"x" * 900))
+    assert len(cache) == 2
+    assert cache.size_bytes <= 3000
+    cache.set("huge", "x", _response(b"x" * 5000))
+    assert cache.get("huge") is None
+
+
+def test_zero_ttl_is_not_cached():
+    cache = ResponseCache(ttl_rules=[(r"^score/", 0)])
+    cache.set("k", "score/now", _response())
+    assert len(cache) == 0
+
+
+def test_http_client_serves_repeats_from_cache():
+    transport, calls = _counting_transport()
+    http_client = HttpClient(ClientConfig(transport=transport, cache=True))
+    for _ in range(3):
+        http_client.get(endpoint=Endpoint.API_STATS, resource="en/franchise")
+    assert len(calls) == 1
+    assert http_client.stats["cache_hits"] == 2
+    assert http_client.stats["cache_misses"] == 1
+
+
+def test_errors_are_not_cached():
+    transport, calls = _counting_transport(lambda request: httpx.Response(404))
+    http_client = HttpClient(ClientConfig(transport=transport, cache=True, max_retries=0))
+    for _ in range(2):
+        with pytest.raises(ResourceNotFoundException):
+            http_client.get(endpoint=Endpoint.API_STATS, resource="en/franchise")
+    assert len(calls) == 2
+
+
+def test_cache_is_off_by_default():
+    assert ClientConfig().cache is None
+
+
+def test_repeated_teams_calls_hit_the_network_once():
+    transport, calls = _counting_transport()
+    client = NHLClient(config=ClientConfig(transport=transport, cache=True))
+    client.teams.teams()
+    client.teams.teams()
+    assert calls == ["https://api-web.nhle.com/v1/standings/now", "https://api.nhle.com/stats/rest/en/franchise"]
+
+
+def _etag_transport(body: bytes = b'{"standings": []}'):
+    """Serves ``body`` with an ETag and answers 304 when the client already has it."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, content=body, headers={"ETag": '"v1"', "Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler), seen
+
+
+def test_expired_entries_with_validators_are_kept_for_revalidation():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.set("k", "standings/now", httpx.Response(200, content=b"{}", headers={"ETag": '"v1"'}))
+    clock.now = 31
+    assert cache.get("k") is None
+    assert cache.conditional_headers("k") == {"If-None-Match": '"v1"'}
+
+    cache.refresh("k", "standings/now", httpx.Response(304))
+    assert cache.get("k") is not None
+
+
+def test_cached_response_parses_once():
+    cache = ResponseCache()
+    cached = cache.set("k", "x", httpx.Response(200, json={"a": [1]}))
+    assert cache.get("k").json() is cached.json()
+
+
+def test_not_modified_returns_cached_parsed_object():
+    clock = FakeClock()
+    transport, seen = _etag_transport()
+    http_client = HttpClient(ClientConfig(transport=transport, cache=ResponseCache(clock=clock)))
+
+    first = http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now").json()
+    clock.now = 31
+    second = http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now").json()
+
+    assert seen == [None, '"v1"']
+    assert second is first
+    stats = http_client.stats
+    assert stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(b'{"standings": []}')
+    assert stats["parses_saved"] == 1
+
+    # The 304 restarted the TTL, the next call doesn't touch the network.
+    http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now")
+    assert len(seen) == 2
+
+
+def test_not_modified_after_eviction_refetches():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    transport, seen = _etag_transport()
+    http_client = HttpClient(ClientConfig(transport=transport, cache=cache))
+    http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now")
+    clock.now = 31
+    original_refresh = cache.refresh
+
+    def evicting_refresh(key, resource, response):
+        cache.clear()
+        return original_refresh(key, resource, response)
+
+    cache.refresh = evicting_refresh
+    assert http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now").json() == {"standings": []}
+    assert seen == [None, '"v1"', None]
+
+
+def test_all_players_does_not_mutate_cached_rosters():
+    roster = {
+        "forwards": [{"id": 1, "firstName": {"default": "A"}, "lastName": {"default": "B"}}],
+        "defensemen": [],
+        "goalies": [],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/v1/roster/"):
+            return httpx.Response(200, json=roster)
+        if request.url.path == "/v1/standings/now":
+            return httpx.Response(200, json={"standings": [{"teamAbbrev": {"default": "BUF"}}]})
+        return httpx.Response(200, json={"data": []})
+
+    client = NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), cache=True))
+    first = client.helpers.all_players("20232024")
+    second = client.helpers.all_players("20232024")
+    assert first == second == [{"id": 1, "firstName": "A", "lastName": "B", "team": "BUF"}]
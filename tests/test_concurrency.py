@@ -0,0 +1,34 @@
+import gc
+import weakref
+
+from nhlpy.concurrency import as_completed_bounded, worker_pool
+
+
+class _Payload:
+    pass
+
+
+def test_as_completed_bounded_holds_only_the_window():
+    pulled, results = [], []
+
+    def items():
+        for i in range(50):
+            pulled.append(i)
+            yield i
+
+    def fetch(i: int) -> _Payload:
+        payload = _Payload()
+        results.append(weakref.ref(payload))
+        return payload
+
+    seen = []
+    with worker_pool(3) as pool:
+        for i, future in as_completed_bounded(pool, fetch, items(), 3):
+            future.result()
+            seen.append(i)
+            # One more item is pulled per completed one, never the whole input.
+            assert len(pulled) <= len(seen) + 3
+            gc.collect()
+            # The calls in flight plus finished ones waiting to be yielded, not every result so far.
+            assert sum(ref() is not None for ref in results) <= 2 * 3
+    assert sorted(seen) == list(range(50))
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import sys
+
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.config import ClientConfig
+from nhlpy.decoding import get_decoder, raw_responses
+from nhlpy.responses import JsonResponse
+
+BODY = {"id": 2023020001, "plays": [{"eventId": 1, "typeDescKey": "faceoff"}]}
+
+
+def _counting_decoder(calls: list):
+    def decode(content: bytes):
+        calls.append(len(content))
+        return json.loads(content)
+
+    return decode
+
+
+def _client(decoder, **config) -> NHLClient:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=BODY))
+    return NHLClient(config=ClientConfig(transport=transport, rate_limit=None, json_decoder=decoder, **config))
+
+
+def test_get_decoder():
+    assert get_decoder("json") is json.loads
+    assert get_decoder(len) is len
+    assert get_decoder("auto")(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+    with pytest.raises(ValueError):
+        get_decoder("simdjson")
+
+
+def test_missing_decoder_is_an_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    with pytest.raises(ImportError, match="pip install orjson"):
+        get_decoder("orjson")
+    assert get_decoder("auto") is json.loads
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_optional_decoders(name):
+    pytest.importorskip(name)
+    assert _client(name).game_center.play_by_play("2023020001") == BODY
+
+
+def test_configured_decoder_backs_response_json():
+    calls = []
+    client = _client(_counting_decoder(calls))
+    assert client.game_center.play_by_play("2023020001") == BODY
+    assert client.game_center.play_by_play("2023020001") == BODY
+    assert len(calls) == 2
+
+
+def test_cached_responses_decode_once_with_configured_decoder(tmp_path):
+    final = dict(BODY, gameState="OFF")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=final))
+
+    def client(calls):
+        config = ClientConfig(
+            transport=transport,
+            rate_limit=None,
+            json_decoder=_counting_decoder(calls),
+            cache=True,
+            disk_cache=str(tmp_path / "cache.sqlite"),
+        )
+        return NHLClient(config=config)
+
+    calls = []
+    first = client(calls)
+    for _ in range(3):
+        assert first.game_center.boxscore("2023020001") == final
+    assert len(calls) == 1
+
+    # A fresh memory cache, served from disk: still the configured decoder.
+    calls = []
+    second = client(calls)
+    assert second.game_center.boxscore("2023020001") == final
+    assert second.request_stats["disk_cache_hits"] == 1
+    assert len(calls) == 1
+
+
+def test_raw_responses_return_bytes():
+    calls = []
+    client = _client(_counting_decoder(calls), cache=True)
+    with raw_responses():
+        body = client.game_center.play_by_play("2023020001")
+    assert isinstance(body, bytes) and json.loads(body) == BODY
+    assert calls == []
+    # Raw mode ends with the block, and didn't stand in for the cached parse.
+    assert client.game_center.play_by_play("2023020001") == BODY
+    assert len(calls) == 1
+
+
+def test_raw_responses_with_async_client():
+    async def fetch():
+        config = ClientConfig(async_transport=httpx.MockTransport(lambda r: httpx.Response(200, json=BODY)))
+        async with AsyncNHLClient(config=config) as client:
+            with raw_responses():
+                raw = await client.game_center.play_by_play("2023020001")
+            return raw, await client.game_center.play_by_play("2023020001")
+
+    raw, decoded = asyncio.run(fetch())
+    assert isinstance(raw, bytes) and decoded == BODY
+
+
+def test_json_response_keeps_stdlib_kwargs():
+    response = JsonResponse.from_response(httpx.Response(200, json={"a": 1.5}), decoder=len)
+    assert response.json() == len(response.content)
+    assert response.json(parse_float=str) == {"a": "1.5"}
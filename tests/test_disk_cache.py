@@ -0,0 +1,102 @@
+import threading
+from datetime import date
+from unittest import mock
+
+import httpx
+
+from nhlpy.config import ClientConfig
+from nhlpy.disk_cache import DiskCache, is_past_season
+from nhlpy.http_client import Endpoint, HttpClient
+
+FINAL_BOXSCORE = b'{"id": 2023020001, "gameState": "OFF", "homeTeam": {"score": 3}}'
+LIVE_BOXSCORE = b'{"id": 2023020001, "gameState": "LIVE", "homeTeam": {"score": 1}}'
+
+
+def _response(body: bytes, url: str = "https://api-web.nhle.com/v1/x", **headers) -> httpx.Response:
+    return httpx.Response(200, content=body, headers=headers, request=httpx.Request("GET", url))
+
+
+def test_finished_game_round_trips(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    cache.set("k", "gamecenter/2023020001/boxscore", _response(FINAL_BOXSCORE, **{"content-type": "application/json"}))
+
+    cached = cache.get("k")
+    assert cached.status_code == 200
+    assert cached.json()["gameState"] == "OFF"
+    assert cached.headers["content-type"] == "application/json"
+
+
+def test_wire_encoding_headers_are_dropped(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    response = _response(FINAL_BOXSCORE)
+    response.headers["content-encoding"] = "gzip"
+    cache.set("k", "gamecenter/2023020001/play-by-play", response)
+    assert "content-encoding" not in cache.get("k").headers
+
+
+def test_live_games_are_not_persisted(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"))
+    cache.set("k", "gamecenter/2023020001/boxscore", _response(LIVE_BOXSCORE))
+    assert cache.get("k") is None
+
+
+def test_past_seasons_are_immutable():
+    response = _response(b"{}")
+    assert is_past_season("roster/BUF/20222023", response, today=date(2023, 7, 1))
+    assert not is_past_season("roster/BUF/20222023", response, today=date(2023, 6, 15))
+    assert not is_past_season("roster/BUF/current", response)
+
+
+def test_mutable_responses_respect_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    with mock.patch("nhlpy.disk_cache.time") as time_mock:
+        time_mock.time.return_value = 1000
+        cache.set("k", "standings/now", _response(b"{}"))
+        time_mock.time.return_value = 1059
+        assert cache.get("k") is not None
+        time_mock.time.return_value = 1061
+        assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_read(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_bytes=2000, compress_level=0)
+    with mock.patch("nhlpy.disk_cache.time") as time_mock:
+        time_mock.time.side_effect = [1, 2, 3]
+        for key in "abc":
+            cache.set(key, "roster/BUF/20102011", _response(b"x" * 900))
+    cache.evict()
+    assert cache.size_bytes <= 2000
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+def test_shared_between_instances_and_threads(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    writer, reader = DiskCache(path), DiskCache(path)
+
+    threads = [
+        threading.Thread(target=writer.set, args=(f"k{i}", "roster/BUF/20102011", _response(b"{}"))) for i in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(reader) == 8
+
+
+def test_http_client_reads_disk_cache_after_restart(tmp_path):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, content=FINAL_BOXSCORE)
+
+    path = str(tmp_path / "cache.sqlite")
+    for _ in range(2):
+        http_client = HttpClient(ClientConfig(transport=httpx.MockTransport(handler), disk_cache=path))
+        response = http_client.get(endpoint=Endpoint.API_WEB_V1, resource="gamecenter/2023020001/boxscore")
+        assert response.json()["id"] == 2023020001
+
+    assert len(calls) == 1
+    assert http_client.stats["disk_cache_hits"] == 1
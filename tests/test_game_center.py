@@ -1,5 +1,11 @@
+import asyncio
 from unittest import mock
 
+import httpx
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.config import ClientConfig
+
 
 @mock.patch("httpx.Client.get")
 def test_boxscore(h_m, nhl_client):
@@ -78,3 +84,114 @@ def test_game_story(h_m, nhl_client):
     nhl_client.game_center.game_story(game_id="2020020001")
     h_m.assert_called_once()
     assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/wsc/game-story/2020020001"
+
+
+def _live_server():
+    """Serves a scripted game, one step per play-by-play poll.  Answers 304 to a matching If-None-Match."""
+    play = {"eventId": 1, "typeDescKey": "faceoff"}
+    goal = {"eventId": 2, "typeDescKey": "goal"}
+    steps = [
+        ("PRE", False, [], 0),
+        ("LIVE", False, [play], 0),
+        ("LIVE", False, [play], 0),  # nothing happened
+        ("LIVE", False, [play, goal], 1),
+        ("LIVE", True, [play, dict(goal, details={"scoringPlayerId": 8478402})], 1),
+        ("OFF", False, [play, goal], 1),
+    ]
+    state = {"step": -1, "not_modified": 0, "requests": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"] += 1
+        if request.url.path.endswith("/play-by-play"):
+            state["step"] += 1
+        game_state, intermission, plays, score = steps[state["step"]]
+        if request.url.path.endswith("/play-by-play"):
+            body = {"gameState": game_state, "clock": {"inIntermission": intermission}, "plays": plays}
+        else:
+            body = {"gameState": game_state, "homeTeam": {"score": score}, "awayTeam": {"score": 0}}
+        etag = f'"{hash(repr(body))}"'
+        if request.headers.get("If-None-Match") == etag:
+            state["not_modified"] += 1
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return handler, state
+
+
+def _follow(client):
+    return client.game_center.live_game("2023020001", live_interval=0, intermission_interval=0, pregame_interval=0)
+
+
+def test_live_game_yields_only_changes():
+    handler, state = _live_server()
+    client = NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None, cache=True))
+    events = list(_follow(client))
+
+    assert [
+        (e["type"], e.get("gameState") or e.get("play", {}).get("eventId")) for e in events if e["type"] != "boxscore"
+    ] == [
+        ("state", "PRE"),
+        ("state", "LIVE"),
+        ("play", 1),
+        ("play", 2),
+        ("play-updated", 2),
+        ("state", "OFF"),
+        ("play-updated", 2),
+    ]
+    boxscores = [e["changes"] for e in events if e["type"] == "boxscore"]
+    assert boxscores[0] == {"gameState": "PRE", "homeTeam.score": 0, "awayTeam.score": 0}
+    assert boxscores[1:] == [{"gameState": "LIVE"}, {"homeTeam.score": 1}, {"gameState": "OFF"}]
+    # Six polls of both resources, the unchanged ones answered with a 304 from the cached copy.
+    assert state["requests"] == 12
+    assert state["not_modified"] == 3
+
+
+def test_live_game_without_cache_still_skips_unchanged_polls():
+    handler, state = _live_server()
+    client = NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+    events = list(_follow(client))
+    assert len([e for e in events if e["type"] == "play"]) == 2
+    assert state["not_modified"] == 0
+
+
+def test_live_game_async_iterator():
+    handler, _ = _live_server()
+
+    async def follow():
+        config = ClientConfig(async_transport=httpx.MockTransport(handler), rate_limit=None)
+        async with AsyncNHLClient(config=config) as client:
+            return [event async for event in _follow(client)]
+
+    events = asyncio.run(follow())
+    assert events[-1] == {"type": "boxscore", "gameId": "2023020001", "changes": {"gameState": "OFF"}}
+
+
+def test_cancelled_async_live_game_stops_polling():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"id": 2023020001, "gameState": "PRE", "plays": []})
+
+    async def follow(client):
+        async for _ in client.game_center.live_game("2023020001", pregame_interval=60):
+            pass
+
+    async def run():
+        config = ClientConfig(async_transport=httpx.MockTransport(handler), rate_limit=None, max_concurrency=2)
+        async with AsyncNHLClient(config=config) as client:
+            subscriptions = [asyncio.ensure_future(follow(client)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            # Waiting subscriptions don't hold the client's worker threads.
+            boxscore = await asyncio.wait_for(client.game_center.boxscore("2023020002"), 2)
+            for subscription in subscriptions:
+                subscription.cancel()
+            results = await asyncio.gather(*subscriptions, return_exceptions=True)
+            polls = len(requests)
+            await asyncio.sleep(0.2)
+        return boxscore, results, polls
+
+    boxscore, results, polls = asyncio.run(run())
+    assert boxscore["gameState"] == "PRE"
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert polls == len(requests) == 5
@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+
+import httpx
+
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+
+TEAMS = ["BUF", "TOR", "MTL"]
+
+# Every game is on both teams' schedules.
+GAMES = [
+    {"id": 2023020003, "gameType": 2, "teams": ("BUF", "TOR")},
+    {"id": 2023010001, "gameType": 1, "teams": ("BUF", "MTL")},
+    {"id": 2023020001, "gameType": 2, "teams": ("TOR", "MTL")},
+    {"id": 2023030001, "gameType": 3, "teams": ("BUF", "TOR")},
+]
+
+
+def _season_handler(delay: float = 0.0):
+    state = {"in_flight": 0, "max_in_flight": 0, "schedules": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/standings/now":
+            return httpx.Response(200, json={"standings": [{"teamAbbrev": {"default": abbr}} for abbr in TEAMS]})
+        if path.startswith("/v1/club-schedule-season/"):
+            abbr = path.split("/")[3]
+            with lock:
+                state["schedules"] += 1
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            time.sleep(delay)
+            with lock:
+                state["in_flight"] -= 1
+            games = [{"id": g["id"], "gameType": g["gameType"]} for g in GAMES if abbr in g["teams"]]
+            return httpx.Response(200, json={"games": games})
+        return httpx.Response(200, json={"data": []})
+
+    return handler, state
+
+
+def _client(handler) -> NHLClient:
+    return NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+
+
+def test_game_ids_by_season_are_unique_and_sorted():
+    handler, state = _season_handler()
+    game_ids = _client(handler).helpers.game_ids_by_season("20232024")
+    assert game_ids == [2023010001, 2023020001, 2023020003, 2023030001]
+    assert state["schedules"] == len(TEAMS)
+
+
+def test_game_ids_by_season_filters_game_types():
+    handler, _ = _season_handler()
+    assert _client(handler).helpers.game_ids_by_season("20232024", game_types=[2]) == [2023020001, 2023020003]
+
+
+def test_game_ids_by_season_fetches_schedules_concurrently():
+    handler, state = _season_handler(delay=0.05)
+    _client(handler).helpers.game_ids_by_season("20232024")
+    assert state["max_in_flight"] > 1
+
+
+def _player(player_id: int) -> dict:
+    return {"id": player_id, "firstName": {"default": "F"}, "lastName": {"default": "L"}}
+
+
+def _summary_handler(requested: list):
+    """Three teams with two players each, plus a league wide summary report of 250 skaters."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested.append(path)
+        if path == "/v1/standings/now":
+            return httpx.Response(200, json={"standings": [{"teamAbbrev": {"default": abbr}} for abbr in TEAMS]})
+        if path.startswith("/v1/roster/"):
+            index = TEAMS.index(path.split("/")[3])
+            return httpx.Response(
+                200, json={"forwards": [_player(index * 2)], "defensemen": [_player(index * 2 + 1)], "goalies": []}
+            )
+        if path == "/stats/rest/en/skater/summary":
+            start, limit = int(request.url.params["start"]), int(request.url.params["limit"])
+            rows = [{"playerId": pid, "points": pid} for pid in range(start, min(start + limit, 250))]
+            return httpx.Response(200, json={"data": rows, "total": 250})
+        return httpx.Response(200, json={"data": []})
+
+    return handler
+
+
+def test_all_players_summary_statistics_joins_league_report_to_rosters(caplog):
+    requested = []
+    client = _client(_summary_handler(requested))
+    with caplog.at_level(logging.INFO, logger="nhlpy.api.helpers"):
+        rows = client.helpers.all_players_summary_statistics("20232024")
+
+    assert [row["playerId"] for row in rows] == list(range(250))
+    assert rows[4] == {"id": 4, "firstName": "F", "lastName": "L", "team": "MTL", "playerId": 4, "points": 4}
+    assert "team" not in rows[6]
+
+    # standings + franchises, 3 rosters and 3 pages of summary stats, instead of a query per franchise.
+    assert len(requested) == 2 + 3 + 3
+    assert requested.count("/stats/rest/en/skater/summary") == 3
+    assert "used 8 requests" in caplog.text
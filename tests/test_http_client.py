@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from nhlpy.config import ClientConfig
+from nhlpy.async_nhl_client import AsyncNHLClient
+from nhlpy.http_client import AsyncHttpClient, Endpoint, HttpClient, ResourceNotFoundException
+from nhlpy.nhl_client import NHLClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalTransport(httpx.HTTPTransport):
+    """Sends every request to the local stand-in server regardless of the NHL host in the url."""
+
+    def __init__(self, port: int, **kwargs):
+        super().__init__(**kwargs)
+        self._port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self._port)
+        return super().handle_request(request)
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_is_created_lazily_and_reused():
+    http_client = HttpClient(ClientConfig())
+    assert http_client._client is None
+    first = http_client.client
+    assert http_client.client is first
+    http_client.close()
+    assert http_client._client is None
+
+
+def test_close_is_idempotent_and_client_reopens():
+    http_client = HttpClient(ClientConfig())
+    first = http_client.client
+    http_client.close()
+    http_client.close()
+    assert first.is_closed
+    assert http_client.client is not first
+
+
+def test_pool_limits_come_from_config():
+    config = ClientConfig(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+    limits = HttpClient(config)._limits()
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 3
+    assert limits.keepalive_expiry == 1.5
+
+
+def test_per_host_limits_mount_a_pool_per_nhl_host():
+    http_client = HttpClient(ClientConfig(max_connections_per_host=4))
+    mounts = {str(pattern.pattern) for pattern in http_client.client._mounts}
+    assert mounts == {"https://api-web.nhle.com", "https://api.nhle.com"}
+
+
+def test_nhl_client_shares_one_http_client_and_closes_it():
+    with NHLClient() as c:
+        assert c.teams.client is c.schedule.client is c.stats.client is c._http_client
+        pool = c._http_client.client
+    assert pool.is_closed
+
+
+def test_connections_are_reused_across_requests(local_server):
+    config = ClientConfig(transport=LocalTransport(local_server.server_address[1]))
+    with HttpClient(config) as http_client:
+        for _ in range(10):
+            assert http_client.get(endpoint=Endpoint.API_WEB_V1, resource="score/now").json() == {"ok": True}
+
+    assert local_server.connections == 1
+
+
+def _slow_handler(calls: list, status: int = 200, delay: float = 0.2):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        time.sleep(delay)
+        return httpx.Response(status, json={"standings": []})
+
+    return handler
+
+
+def _concurrent_gets(http_client: HttpClient, n: int = 8) -> list:
+    barrier = threading.Barrier(n)
+
+    def get(_):
+        barrier.wait()
+        try:
+            return http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now")
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(get, range(n)))
+
+
+def test_identical_concurrent_gets_share_one_request():
+    calls = []
+    http_client = HttpClient(ClientConfig(transport=httpx.MockTransport(_slow_handler(calls)), rate_limit=None))
+    responses = _concurrent_gets(http_client)
+    assert calls == ["/v1/standings/now"]
+    assert all(response is responses[0] for response in responses)
+    assert http_client.stats["coalesced"] == 7
+
+    # Once it landed, the next call goes out again.
+    http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now")
+    assert len(calls) == 2
+
+
+def test_coalesced_waiters_get_the_error():
+    calls = []
+    transport = httpx.MockTransport(_slow_handler(calls, status=404))
+    results = _concurrent_gets(HttpClient(ClientConfig(transport=transport, rate_limit=None)))
+    assert len(calls) == 1
+    assert all(isinstance(result, ResourceNotFoundException) for result in results)
+
+
+def test_coalescing_can_be_disabled():
+    calls = []
+    transport = httpx.MockTransport(_slow_handler(calls, delay=0.05))
+    _concurrent_gets(HttpClient(ClientConfig(transport=transport, rate_limit=None, coalesce_requests=False)))
+    assert len(calls) == 8
+
+
+def test_async_identical_gets_share_one_request():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"standings": []})
+
+    async def run():
+        config = ClientConfig(async_transport=httpx.MockTransport(handler), rate_limit=None)
+        async with AsyncNHLClient(config=config) as client:
+            results = await asyncio.gather(*(client.standings.league_standings() for _ in range(6)))
+            return results, client.request_stats
+
+    results, stats = asyncio.run(run())
+    assert len(calls) == 1 and stats["coalesced"] == 5
+    assert all(result == {"standings": []} for result in results)
+
+
+def test_async_waiter_takes_over_when_the_leader_is_cancelled():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        http_client = AsyncHttpClient(ClientConfig(async_transport=httpx.MockTransport(handler), rate_limit=None))
+        leader = asyncio.ensure_future(http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now"))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(http_client.get(endpoint=Endpoint.API_WEB_V1, resource="standings/now"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        response = await waiter
+        await http_client.aclose()
+        return leader, response
+
+    leader, response = asyncio.run(run())
+    assert leader.cancelled()
+    assert response.json() == {"ok": True}
+    assert len(calls) == 2
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+from nhlpy import NHLClient
+from nhlpy.api.teams import Teams
+
+
+def _import_times(script: str) -> dict:
+    """Cumulative import time in microseconds per module imported by ``script``, from ``python -X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_creating_a_client_loads_neither_httpx_nor_the_api_modules():
+    times = _import_times("import nhlpy; nhlpy.NHLClient().close()")
+    assert "nhlpy.config" in times
+    loaded = [name for name in times if name.startswith(("httpx", "nhlpy.api", "asyncio", "sqlite3", "email"))]
+    assert loaded == []
+
+
+def test_sub_module_is_loaded_on_first_access():
+    times = _import_times("import nhlpy; nhlpy.NHLClient().teams")
+    assert "nhlpy.api.teams" in times and "httpx" in times
+    assert "nhlpy.api.stats" not in times and "nhlpy.api.game_center" not in times
+
+
+def test_import_time_budget():
+    # Relative to httpx so the check holds on slow machines: a client used to cost about twice an httpx import.
+    client = _import_times("import nhlpy; nhlpy.NHLClient()")
+    httpx = _import_times("import httpx")
+    assert client["nhlpy"] + client["nhlpy.nhl_client"] < httpx["httpx"] / 2
+
+
+def test_sub_modules_share_one_lazily_created_http_client():
+    client = NHLClient()
+    assert client._http is None and client.request_stats == {}
+    assert isinstance(client.teams, Teams) and client.teams is client.teams
+    assert client.teams.client is client.game_center.client is client._http
+    client.close()
+
+
+def test_closing_an_unused_client():
+    with NHLClient() as client:
+        pass
+    assert client._http is None
@@ -0,0 +1,128 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import Endpoint, ResourceNotFoundException
+from nhlpy.metrics import Hooks, MetricsCollector, RequestEvent, resource_template
+
+BOXSCORE = {"id": 2023020001, "homeTeam": {"abbrev": "BUF"}}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if "boxscore" in request.url.path:
+        return httpx.Response(200, json=BOXSCORE)
+    if "roster" in request.url.path:
+        return httpx.Response(503)
+    return httpx.Response(404, json={"message": "not found"})
+
+
+def _client(**config) -> NHLClient:
+    config.setdefault("rate_limit", None)
+    return NHLClient(config=ClientConfig(transport=httpx.MockTransport(_handler), **config))
+
+
+@pytest.mark.parametrize(
+    "resource, template",
+    [
+        ("gamecenter/2023020001/boxscore", "gamecenter/{id}/boxscore"),
+        ("roster/BUF/20232024", "roster/{team}/{season}"),
+        ("schedule/2024-01-15", "schedule/{date}"),
+        ("player/8478402/game-log/20232024/2", "player/{id}/game-log/{season}/{id}"),
+        ("en/skater/summary?limit=5", "en/skater/summary"),
+        ("standings/now", "standings/now"),
+    ],
+)
+def test_resource_template(resource, template):
+    assert resource_template(resource) == template
+
+
+def test_hooks_see_every_event():
+    events = []
+    hooks = {name: [events.append] for name in ("before_request", "after_response", "on_retry", "on_error")}
+    hooks["on_cache_hit"] = events.append
+    with _client(event_hooks=hooks, max_retries=1, retry_backoff_max=0, cache=True) as client:
+        client.game_center.boxscore("2023020001")
+        with pytest.raises(Exception):
+            client.teams.team_roster("BUF", "20232024")
+        client.game_center.boxscore("2023020001")
+
+    assert [(e.name, e.status_code, e.attempt) for e in events] == [
+        ("before_request", None, 0),
+        ("after_response", 200, 0),
+        ("before_request", None, 0),
+        ("after_response", 503, 0),
+        ("on_retry", 503, 0),
+        ("before_request", None, 1),
+        ("after_response", 503, 1),
+        ("on_error", None, None),
+        ("on_cache_hit", 200, None),
+    ]
+    assert events[0].endpoint is Endpoint.API_WEB_V1 and events[0].template == "gamecenter/{id}/boxscore"
+    assert events[1].elapsed > 0 and events[4].delay == 0
+    assert type(events[7].error).__name__ == "ServerErrorException"
+
+
+def test_unknown_event():
+    with pytest.raises(ValueError, match="on_response"):
+        Hooks({"on_response": [print]})
+
+
+def test_metrics_per_endpoint_and_template():
+    with _client(metrics=True, max_retries=0) as client:
+        for game_id in ("2023020001", "2023020002"):
+            assert client.game_center.boxscore(game_id) == BOXSCORE
+        with pytest.raises(ResourceNotFoundException):
+            client.game_center.play_by_play("2023020003")
+        metrics = client.metrics.to_dict()
+
+    boxscore = metrics["API_WEB_V1"]["gamecenter/{id}/boxscore"]
+    assert boxscore["requests"] == 2 and boxscore["statuses"] == {200: 2} and boxscore["errors"] == {}
+    assert boxscore["bytes"] == 2 * len(httpx.Response(200, json=BOXSCORE).content)
+    assert boxscore["decodes"] == 2 and boxscore["decode_seconds"] > 0
+    latency = boxscore["latency"]
+    assert latency["count"] == 2 and 0 < latency["p50"] <= latency["p95"] <= latency["p99"]
+    pbp = metrics["API_WEB_V1"]["gamecenter/{id}/play-by-play"]
+    assert pbp["statuses"] == {404: 1} and pbp["errors"] == {"ResourceNotFoundException": 1}
+
+
+def test_percentiles():
+    collector = MetricsCollector(window=100)
+    response = httpx.Response(200, content=b"{}")
+    for ms in range(1, 201):
+        collector.after_response(
+            RequestEvent("after_response", Endpoint.API_STATS, "en/team/summary", response=response, elapsed=ms / 1000)
+        )
+    latency = collector.to_dict()["API_STATS"]["en/team/summary"]["latency"]
+    # Percentiles over the last 100 responses, the histogram over all 200.
+    assert (latency["p50"], latency["p95"], latency["p99"]) == (0.15, 0.195, 0.199)
+    assert latency["count"] == 200 and latency["sum"] == pytest.approx(20.1)
+
+
+def test_prometheus_export():
+    collector = MetricsCollector()
+    with _client(metrics=collector, cache=True) as client:
+        client.game_center.boxscore("2023020001")
+        client.game_center.boxscore("2023020001")
+    text = collector.to_prometheus()
+
+    labels = 'endpoint="API_WEB_V1",resource="gamecenter/{id}/boxscore"'
+    assert "# TYPE nhlpy_request_duration_seconds histogram" in text
+    assert f'nhlpy_requests_total{{{labels},status="200"}} 1' in text
+    assert f"nhlpy_cache_hits_total{{{labels}}} 1" in text
+    assert f'nhlpy_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"nhlpy_request_duration_seconds_count{{{labels}}} 1" in text
+    collector.reset()
+    assert collector.to_dict() == {}
+
+
+def test_async_metrics():
+    async def fetch(config):
+        async with AsyncNHLClient(config=config) as client:
+            await asyncio.gather(*(client.game_center.boxscore(str(2023020001 + i)) for i in range(3)))
+
+    config = ClientConfig(async_transport=httpx.MockTransport(_handler), rate_limit=None, metrics=True)
+    asyncio.run(fetch(config))
+    assert config.metrics.to_dict()["API_WEB_V1"]["gamecenter/{id}/boxscore"]["statuses"] == {200: 3}
@@ -0,0 +1,125 @@
+import json
+import sys
+
+import pytest
+
+from nhlpy import models
+from nhlpy.models import GameLogEntry, Play, PlayDetails, Shift, StatsRow, Team
+
+PLAY = {
+    "eventId": 102,
+    "periodDescriptor": {"number": 1, "periodType": "REG", "maxRegulationPeriods": 3},
+    "timeInPeriod": "00:00",
+    "timeRemaining": "20:00",
+    "situationCode": "1551",
+    "homeTeamDefendingSide": "left",
+    "typeCode": 502,
+    "typeDescKey": "faceoff",
+    "sortOrder": 11,
+    "details": {
+        "eventOwnerTeamId": 7,
+        "losingPlayerId": 8478403,
+        "winningPlayerId": 8480002,
+        "xCoord": 0,
+        "yCoord": 0,
+        "zoneCode": "N",
+        "highlightClip": 123,
+    },
+}
+PLAY_BY_PLAY = {"id": 2023020001, "plays": [PLAY, dict(PLAY, eventId=103, details=None)]}
+
+
+def test_play_fields_and_lazy_nested_objects():
+    play = models.plays(PLAY_BY_PLAY)[0]
+    assert (play.event_id, play.type_desc_key, play.time_in_period) == (102, "faceoff", "00:00")
+    # Nested payloads stay as they came until read, then are converted once.
+    assert play._details is PLAY["details"]
+    details = play.details
+    assert isinstance(details, PlayDetails) and play.details is details
+    assert (details.winning_player_id, details.zone_code, details.shooting_player_id) == (8480002, "N", None)
+    assert details.extra == {"highlightClip": 123}
+    assert play.period == 1 and play.period_descriptor.period_type == "REG"
+
+
+def test_models_are_slotted():
+    play = Play.from_dict(PLAY)
+    assert not hasattr(play, "__dict__")
+    with pytest.raises(AttributeError):
+        play.not_a_field = 1
+    assert sys.getsizeof(play.details) < sys.getsizeof(PLAY["details"])
+
+
+def test_missing_nested_object():
+    play = models.plays(PLAY_BY_PLAY)[1]
+    assert play.details is None and play.event_id == 103
+
+
+def test_decodes_bytes():
+    body = json.dumps(PLAY_BY_PLAY).encode()
+    assert models.plays(body) == models.plays(PLAY_BY_PLAY)
+    assert models.plays(body, decoder=json.loads)[0].details.losing_player_id == 8478403
+
+
+def test_to_dict():
+    out = Play.from_dict(PLAY).to_dict()
+    assert out["event_id"] == 102
+    assert out["period_descriptor"] == {"number": 1, "period_type": "REG", "max_regulation_periods": 3}
+    assert out["details"]["extra"] == {"highlightClip": 123}
+    assert "extra" not in out
+
+
+def test_team():
+    team = Team.from_dict(
+        {
+            "conference": {"abbr": "E", "name": "Eastern"},
+            "division": {"abbr": "A", "name": "Atlantic"},
+            "name": "Buffalo Sabres",
+            "common_name": "Sabres",
+            "abbr": "BUF",
+            "logo": "https://assets.nhle.com/logos/nhl/svg/BUF_light.svg",
+            "franchise_id": 19,
+        }
+    )
+    assert (team.abbr, team.franchise_id, team.division.name, team.conference.abbr) == ("BUF", 19, "Atlantic", "E")
+
+
+def test_roster_players_flattens_localized_names():
+    player = {
+        "id": 8478403,
+        "firstName": {"default": "Jack", "cs": "Jack"},
+        "lastName": {"default": "Eichel"},
+        "sweaterNumber": 9,
+        "positionCode": "C",
+        "birthCity": {"default": "North Chelmsford"},
+    }
+    roster = {"forwards": [player], "defensemen": [], "goalies": [dict(player, id=1, positionCode="G")]}
+    players = models.roster_players(roster)
+    assert [p.position_code for p in players] == ["C", "G"]
+    assert (players[0].first_name, players[0].last_name, players[0].birth_city) == ("Jack", "Eichel", "North Chelmsford")
+
+
+def test_game_log_and_shifts():
+    entry = {"gameId": 2023020001, "goals": 1, "assists": 2, "commonName": {"default": "Oilers"}, "toi": "21:03"}
+    for payload in ([entry], {"gameLog": [entry]}):
+        (game,) = models.game_log(payload)
+        assert isinstance(game, GameLogEntry)
+        assert (game.game_id, game.points, game.common_name, game.toi) == (2023020001, None, "Oilers", "21:03")
+
+    shift = {"id": 1, "gameId": 2023020001, "playerId": 8478402, "period": 2, "startTime": "01:10", "typeCode": 517}
+    (parsed,) = models.shifts({"data": [shift], "total": 1})
+    assert isinstance(parsed, Shift) and (parsed.player_id, parsed.start_time) == (8478402, "01:10")
+
+
+def test_stats_rows_get_one_class_per_schema():
+    rows = [
+        {"playerId": 1, "goals": 10, "pointsPerGame": 1.2},
+        {"playerId": 2, "goals": 3, "pointsPerGame": 0.4},
+        {"goalieFullName": "A", "savePct": 0.91},
+    ]
+    parsed = models.stats_rows(rows)
+    assert all(isinstance(row, StatsRow) for row in parsed)
+    assert type(parsed[0]) is type(parsed[1]) is not type(parsed[2])
+    assert type(StatsRow.from_dict(rows[0])) is type(parsed[0])
+    assert parsed[1].points_per_game == 0.4 and parsed[2].save_pct == 0.91
+    assert not hasattr(parsed[0], "__dict__")
+    assert models.stats_rows(json.dumps({"data": rows}))[0] == parsed[0]
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import Mock, patch
+from nhlpy.config import ClientConfig
 from nhlpy.nhl_client import NHLClient
 from nhlpy.api import teams, standings, schedule
 from nhlpy.http_client import (
@@ -32,15 +33,8 @@ class MockResponse:
 
 @pytest.fixture
 def mock_config():
-    """Fixture for config object"""
-    config = Mock()
-    config.debug = False
-    config.ssl_verify = True
-    config.timeout = 30
-    config.follow_redirects = True
-    config.api_web_base_url = "https://api.nhl.com"
-    config.api_web_api_ver = "/v1"
-    return config
+    """Fixture for config object, retries are off so error responses surface immediately"""
+    return ClientConfig(timeout=30, max_retries=0)
 
 
 @pytest.fixture
@@ -84,7 +78,7 @@ def test_http_client_error_handling(http_client, status_code, expected_exception
     mock_response = MockResponse(status_code=status_code, json_data={"message": "Test error message"})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(expected_exception) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
@@ -98,7 +92,7 @@ def test_http_client_success_response(http_client):
     mock_response = MockResponse(status_code=200, json_data={"data": "test"})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
         response = http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
         assert response.status_code == 200
 
@@ -109,7 +103,7 @@ def test_http_client_non_json_error_response(http_client):
     mock_response.json = Mock(side_effect=ValueError)  # Simulate JSON decode error
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(ServerErrorException) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="test")
@@ -124,7 +118,7 @@ def test_http_client_get_by_url_with_params(http_client):
     query_params = {"season": "20232024"}
 
     with patch("httpx.Client") as mock_client:
-        mock_instance = mock_client.return_value.__enter__.return_value
+        mock_instance = mock_client.return_value
         mock_instance.get.return_value = mock_response
 
         response = http_client.get(endpoint=Endpoint.API_CORE, resource="test", query_params=query_params)
@@ -139,7 +133,7 @@ def test_http_client_custom_error_message(http_client):
     mock_response = MockResponse(status_code=400, json_data={"message": custom_message})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(BadRequestException) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
@@ -0,0 +1,106 @@
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import Endpoint, HttpClient
+from nhlpy.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_over_time_up_to_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now = 100
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_rejects_bad_settings():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_limiter_shares_bucket_per_host():
+    limiter = RateLimiter(rate=5, burst=5)
+    assert limiter.bucket(Endpoint.API_CORE) is limiter.bucket(Endpoint.API_STATS)
+    assert limiter.bucket(Endpoint.API_CORE) is not limiter.bucket(Endpoint.API_WEB_V1)
+
+
+def test_limiter_host_overrides():
+    limiter = RateLimiter(rate=5, burst=5, host_limits={Endpoint.API_STATS: (1, 2), "api-web.nhle.com": (None, 1)})
+    assert limiter.bucket(Endpoint.API_CORE).rate == 1
+    assert limiter.bucket(Endpoint.API_CORE).burst == 2
+    assert limiter.bucket(Endpoint.API_WEB_V1) is None
+
+
+def test_limiter_disabled():
+    assert ClientConfig(rate_limit=None).rate_limiter is None
+
+
+@mock.patch("nhlpy.rate_limiter.time.sleep")
+def test_acquire_sleeps_for_reserved_wait(sleep_mock):
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+    limiter.acquire(Endpoint.API_WEB_V1)
+    sleep_mock.assert_not_called()
+    limiter.acquire(Endpoint.API_WEB_V1)
+    sleep_mock.assert_called_once_with(pytest.approx(1.0))
+
+
+def test_acquire_async_sleeps_for_reserved_wait():
+    limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+
+    async def run():
+        with mock.patch("asyncio.sleep") as sleep_mock:
+            await limiter.acquire_async(Endpoint.API_WEB_V1)
+            await limiter.acquire_async(Endpoint.API_WEB_V1)
+            return sleep_mock
+
+    sleep_mock = asyncio.run(run())
+    sleep_mock.assert_called_once_with(pytest.approx(1.0))
+
+
+def test_http_client_acquires_before_each_request():
+    config = ClientConfig(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+    config.rate_limiter = mock.Mock()
+    HttpClient(config).get(endpoint=Endpoint.API_STATS, resource="en/franchise")
+    config.rate_limiter.acquire.assert_called_once_with(Endpoint.API_STATS)
+
+
+def test_penalize_pauses_and_halves_rate_then_recovers():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=4, burst=4, clock=clock)
+    bucket.penalize(3)
+    assert bucket.rate == 2
+    assert bucket.reserve() == pytest.approx(3 + 0.5)
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 4
+
+
+def test_penalize_never_drops_below_floor():
+    bucket = TokenBucket(rate=16, burst=1, clock=FakeClock())
+    for _ in range(10):
+        bucket.penalize(0)
+    assert bucket.rate == 1
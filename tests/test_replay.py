@@ -0,0 +1,133 @@
+import asyncio
+import gzip
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import RateLimitExceededException
+from nhlpy.replay import Cassette, CassetteMissError, RecordingTransport, ReplayTransport
+
+FRANCHISES = {"data": [{"id": 19, "fullName": "Buffalo Sabres"}], "total": 1}
+
+
+def _source(seen: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        if request.url.path.endswith("/franchise"):
+            return httpx.Response(200, json=FRANCHISES, headers={"ETag": '"v1"'})
+        if "roster" in request.url.path:
+            return httpx.Response(503)
+        if "summary" in request.url.path:
+            body = gzip.compress(json.dumps({"data": [dict(request.url.params)], "total": 1}).encode())
+            return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+        return httpx.Response(404, json={"message": "not found"})
+
+    return httpx.MockTransport(handler)
+
+
+def _client(transport, **config) -> NHLClient:
+    return NHLClient(config=ClientConfig(transport=transport, rate_limit=None, max_retries=0, **config))
+
+
+def _entries(cassette: Cassette) -> dict:
+    entries = {}
+    for name in os.listdir(cassette.path):
+        with gzip.open(os.path.join(cassette.path, name), "rt") as f:
+            entries[name] = json.load(f)
+    return entries
+
+
+@pytest.fixture
+def cassette(tmp_path) -> Cassette:
+    seen = []
+    cassette = Cassette(tmp_path / "cassette")
+    with _client(RecordingTransport(cassette, transport=_source(seen))) as client:
+        assert client.teams.franchises() == FRANCHISES["data"]
+        client.stats.skater_stats_summary("20232024", "20232024", limit=5)
+        with pytest.raises(Exception):
+            client.teams.team_roster("BUF", "20232024")
+        with pytest.raises(Exception):
+            client.game_center.boxscore("1")
+    assert len(seen) == 4
+    return cassette
+
+
+def test_replays_recorded_responses(cassette):
+    # franchise, summary and the 404.  The 503 is transient and wasn't recorded.
+    assert len(cassette) == 3
+    transport = ReplayTransport(cassette)
+    with _client(transport) as client:
+        assert client.teams.franchises() == FRANCHISES["data"]
+        (row,) = client.stats.skater_stats_summary("20232024", "20232024", limit=5)
+        assert row["limit"] == "5"
+        with pytest.raises(Exception, match="not found"):
+            client.game_center.boxscore("1")
+        with pytest.raises(CassetteMissError, match="roster"):
+            client.teams.team_roster("BUF", "20232024")
+    assert transport.requests == 4 and transport.throttled == 0
+    assert transport.bytes_sent == sum(len(entry["body"].encode()) for entry in _entries(cassette).values())
+
+
+def test_cassette_files(cassette):
+    entry = _entries(cassette)["get-api.nhle.com_stats_rest_en_franchise.json.gz"]
+    assert entry["status"] == 200 and json.loads(entry["body"]) == FRANCHISES
+    assert ["etag", '"v1"'] in entry["headers"]
+
+    # Query params are matched regardless of their order.
+    a = httpx.Request("GET", "https://api.nhle.com/stats/rest/en/skater/summary?start=0&limit=5")
+    b = httpx.Request("GET", "https://api.nhle.com/stats/rest/en/skater/summary?limit=5&start=0")
+    assert cassette.file_name(a) == cassette.file_name(b)
+
+
+def test_recording_decodes_content_encoding(cassette):
+    (entry,) = [e for name, e in _entries(cassette).items() if "summary" in name]
+    assert json.loads(entry["body"])["total"] == 1
+    assert all(k.lower() != "content-encoding" for k, _ in entry["headers"])
+
+
+def test_latency_and_bandwidth(cassette):
+    transport = ReplayTransport(cassette, latency=0.05, bandwidth=1_000)
+    with _client(transport) as client:
+        start = time.perf_counter()
+        client.teams.franchises()
+        assert time.perf_counter() - start >= 0.05 + transport.bytes_sent / 1_000
+
+
+def test_server_rate_limit(cassette):
+    transport = ReplayTransport(cassette, rate_limit=(0.5, 2))
+    with _client(transport) as client:
+        client.teams.franchises()
+        client.teams.franchises()
+        with pytest.raises(RateLimitExceededException):
+            client.teams.franchises()
+    assert transport.throttled == 1 and transport.requests == 3
+
+
+def test_server_rate_limit_is_retried(cassette, monkeypatch):
+    now, sleeps = [0.0], []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr("nhlpy.http_client.time.sleep", sleep)
+    transport = ReplayTransport(cassette, rate_limit=(2, 1), clock=lambda: now[0])
+    config = ClientConfig(transport=transport, rate_limit=None, max_retries=1, retry_backoff_max=0)
+    with NHLClient(config=config) as client:
+        client.teams.franchises()
+        client.teams.franchises()
+    assert transport.throttled == 1 and sleeps == [1.0]
+
+
+def test_async_replay(cassette):
+    async def fetch():
+        config = ClientConfig(async_transport=ReplayTransport(cassette, latency=0.01), rate_limit=None)
+        async with AsyncNHLClient(config=config) as client:
+            return await asyncio.gather(*(client.teams.franchises() for _ in range(3)))
+
+    assert asyncio.run(fetch()) == [FRANCHISES["data"]] * 3
@@ -0,0 +1,116 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import httpx
+import pytest
+
+from nhlpy.config import ClientConfig
+from nhlpy.http_client import AsyncHttpClient, Endpoint, HttpClient, ServerErrorException
+from nhlpy.nhl_client import NHLClient
+from nhlpy.retry import RetryPolicy, parse_retry_after
+
+
+def _responses(*responses):
+    """MockTransport handler answering with the given responses (or raising exceptions) in order."""
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return handler
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    in_ten = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    assert 8 < parse_retry_after(in_ten) <= 10
+
+
+def test_policy_only_retries_idempotent_requests_within_budget():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(0, 503)
+    assert policy.should_retry(1, None)
+    assert not policy.should_retry(2, 503)
+    assert not policy.should_retry(0, 404)
+    assert not policy.should_retry(0, 503, method="POST")
+
+
+def test_policy_delay_is_jittered_and_capped():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= policy.delay(attempt) <= min(5, 2**attempt) for attempt in range(6) for _ in range(20))
+    assert policy.delay(0, retry_after=7) == 7
+    assert RetryPolicy(retry_after_max=2).delay(0, retry_after=60) == 2
+
+
+@mock.patch("nhlpy.http_client.time.sleep")
+def test_retries_server_errors_then_succeeds(sleep_mock):
+    handler = _responses(httpx.Response(503), httpx.Response(502), httpx.Response(200, json={"ok": True}))
+    http_client = HttpClient(ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+
+    assert http_client.get(endpoint=Endpoint.API_WEB_V1, resource="score/now").json() == {"ok": True}
+    assert sleep_mock.call_count == 2
+    stats = http_client.stats
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+    assert stats["retries_503"] == stats["retries_502"] == 1
+
+
+@mock.patch("nhlpy.http_client.time.sleep")
+def test_gives_up_after_max_retries(sleep_mock):
+    handler = _responses(*[httpx.Response(500) for _ in range(3)])
+    http_client = HttpClient(ClientConfig(transport=httpx.MockTransport(handler), max_retries=2, rate_limit=None))
+
+    with pytest.raises(ServerErrorException):
+        http_client.get(endpoint=Endpoint.API_WEB_V1, resource="score/now")
+    assert http_client.stats["retries"] == 2
+
+
+@mock.patch("nhlpy.http_client.time.sleep")
+def test_retries_transport_errors(sleep_mock):
+    handler = _responses(httpx.ConnectError("boom"), httpx.Response(200, json={}))
+    http_client = HttpClient(ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+
+    http_client.get(endpoint=Endpoint.API_WEB_V1, resource="score/now")
+    assert http_client.stats["retries_transport_error"] == 1
+
+
+@mock.patch("nhlpy.http_client.time.sleep")
+def test_429_honors_retry_after_and_slows_the_limiter(sleep_mock):
+    handler = _responses(httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={}))
+    config = ClientConfig(transport=httpx.MockTransport(handler), rate_limit=8)
+    config.rate_limiter.penalize = mock.Mock()
+    http_client = HttpClient(config)
+
+    http_client.get(endpoint=Endpoint.API_STATS, resource="en/franchise")
+    sleep_mock.assert_called_once_with(2)
+    config.rate_limiter.penalize.assert_called_once_with(Endpoint.API_STATS, 2)
+    assert http_client.stats["retry_wait_seconds"] == 2
+
+
+def test_async_client_retries():
+    handler = _responses(httpx.Response(503), httpx.Response(200, json={"ok": True}))
+    config = ClientConfig(async_transport=httpx.MockTransport(handler), rate_limit=None, retry_backoff_factor=0)
+
+    async def run():
+        async with AsyncHttpClient(config) as http_client:
+            response = await http_client.get(endpoint=Endpoint.API_WEB_V1, resource="score/now")
+            return response.json(), http_client.stats
+
+    body, stats = asyncio.run(run())
+    assert body == {"ok": True}
+    assert stats["retries"] == 1
+
+
+@mock.patch("nhlpy.http_client.time.sleep")
+def test_nhl_client_exposes_retry_counters(sleep_mock):
+    handler = _responses(httpx.Response(503), httpx.Response(200, json={}))
+    client = NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+    client.game_center.boxscore(game_id="2023020001")
+    assert client.request_stats["retries"] == 1
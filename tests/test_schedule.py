@@ -1,7 +1,12 @@
+from datetime import date, timedelta
 from unittest import mock
 
+import httpx
 import pytest
 
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+
 
 @mock.patch("httpx.Client.get")
 def test_get_schedule_with_date(h_m, nhl_client):
@@ -91,3 +96,78 @@ def test_bracket(h_m, nhl_client):
     nhl_client.schedule.playoff_bracket(year="2024")
     h_m.assert_called_once()
     assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/playoff-bracket/2024"
+
+
+def _season_handler(requested: list):
+    """A season with one game a day: preseason from 2023-09-28, regular season 2023-10-10 to 2023-11-10,
+    playoffs to 2023-11-25.  Week pages cover the 7 days starting at the requested date."""
+    start, end = date(2023, 9, 28), date(2023, 11, 25)
+
+    def game_type(day: date) -> int:
+        return 1 if day < date(2023, 10, 10) else 2 if day <= date(2023, 11, 10) else 3
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requested.append(path)
+        if path == "/v1/standings-season":
+            return httpx.Response(
+                200, json={"seasons": [{"id": 20232024, "standingsStart": "2023-10-10", "standingsEnd": "2023-11-10"}]}
+            )
+        week = date.fromisoformat(path.rsplit("/", 1)[1])
+        days = [week + timedelta(days=i) for i in range(7)]
+        game_week = [
+            {
+                "date": day.isoformat(),
+                "games": (
+                    [{"id": day.toordinal(), "season": 20232024, "gameType": game_type(day)}]
+                    if start <= day <= end
+                    else []
+                ),
+            }
+            for day in days
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "nextStartDate": (week + timedelta(days=7)).isoformat() if week + timedelta(days=7) <= end else None,
+                "preSeasonStartDate": "2023-09-28",
+                "regularSeasonStartDate": "2023-10-10",
+                "regularSeasonEndDate": "2023-11-10",
+                "playoffEndDate": "2023-11-25",
+                "gameWeek": game_week,
+            },
+        )
+
+    return handler
+
+
+def _walk_client(requested: list) -> NHLClient:
+    return NHLClient(config=ClientConfig(transport=httpx.MockTransport(_season_handler(requested)), rate_limit=None))
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_season_games_walks_every_week_once(parallel):
+    requested = []
+    games = list(_walk_client(requested).schedule.season_games("20232024", parallel=parallel))
+
+    expected_days = (date(2023, 11, 25) - date(2023, 9, 28)).days + 1
+    assert len(games) == expected_days
+    assert [g["gameDate"] for g in games] == sorted(g["gameDate"] for g in games)
+    assert games[0]["gameDate"] == "2023-09-28" and games[-1]["gameDate"] == "2023-11-25"
+    week_pages = [p for p in requested if p.startswith("/v1/schedule/")]
+    assert len(week_pages) == len(set(week_pages)) == 9
+
+
+def test_season_games_filters_game_types():
+    requested = []
+    games = list(_walk_client(requested).schedule.season_games("20232024", game_types=[2]))
+    assert {g["gameType"] for g in games} == {2}
+    assert len(games) == 32
+    # Neither the preseason weeks nor the playoff weeks are fetched.
+    assert "/v1/schedule/2023-10-03" not in requested
+    assert "/v1/schedule/2023-11-21" not in requested
+
+
+def test_season_games_unknown_season():
+    with pytest.raises(ValueError):
+        list(_walk_client([]).schedule.season_games("19001901"))
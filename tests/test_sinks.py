@@ -0,0 +1,116 @@
+import csv
+import gzip
+import io
+import json
+import logging
+
+import httpx
+import pytest
+
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+from nhlpy.sinks import CsvSink, NdjsonSink, ParquetSink, open_sink, write_rows
+
+ROWS = [
+    {"playerId": 1, "name": "A", "team": "BUF", "birthCity": {"default": "Boston"}},
+    {"playerId": 2, "name": "B", "points": 3.5},
+    {"playerId": 3, "name": "C", "team": None, "positions": ["C", "L"]},
+]
+
+
+def test_ndjson(tmp_path):
+    path = tmp_path / "rows.ndjson.gz"
+    assert write_rows(iter(ROWS), path) == 3
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(line) for line in f] == ROWS
+
+
+def test_ndjson_flushes_while_writing():
+    buffer = io.StringIO()
+    sink = NdjsonSink(buffer, flush_interval=0)
+    sink.write(ROWS[0])
+    assert json.loads(buffer.getvalue()) == ROWS[0] and sink.rows == 1
+    sink.close()
+    assert not buffer.closed
+
+
+def test_csv_columns_from_sample(tmp_path):
+    path = tmp_path / "rows.csv"
+    with open_sink(path) as sink:
+        sink.write_all(ROWS)
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ["playerId", "name", "team", "birthCity", "points", "positions"]
+    assert rows[0]["birthCity"] == '{"default": "Boston"}' and rows[1]["team"] == ""
+    assert json.loads(rows[2]["positions"]) == ["C", "L"]
+
+
+def test_csv_drops_late_columns(caplog):
+    buffer = io.StringIO()
+    with caplog.at_level(logging.WARNING, logger="nhlpy.sinks"):
+        with CsvSink(buffer, sample_rows=1) as sink:
+            sink.write_all(ROWS)
+    assert buffer.getvalue().splitlines()[0] == "playerId,name,team,birthCity"
+    assert len(buffer.getvalue().splitlines()) == 4
+    assert "['points']" in caplog.text and "['positions']" in caplog.text
+
+
+def test_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "rows.parquet"
+    rows = [dict(row, extra=None) for row in ROWS] * 5
+    with ParquetSink(path, batch_size=4) as sink:
+        sink.write_all(rows)
+    table = pq.read_table(path)
+    assert table.num_rows == 15 and pq.ParquetFile(path).num_row_groups == 4
+    assert table.column("points").to_pylist()[:3] == [None, 3.5, None]
+    assert table.schema.field("extra").type == "string"
+
+
+def test_parquet_warns_about_fields_outside_the_schema(tmp_path, caplog):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "rows.parquet"
+    first = {"playerId": 1, "birthCity": {"default": "Boston"}, "teams": [{"abbrev": "BUF"}]}
+    later = {"playerId": 2, "birthCity": {"default": "Laval", "fr": "Laval"}, "teams": [{"abbrev": "MTL", "id": 8}]}
+    with caplog.at_level(logging.WARNING, logger="nhlpy.sinks"):
+        with ParquetSink(path, batch_size=1) as sink:
+            sink.write_all([first, dict(later, points=3), dict(later, points=4)])
+    assert pq.read_table(path).to_pylist()[1] == {
+        "playerId": 2, "birthCity": {"default": "Laval"}, "teams": [{"abbrev": "MTL"}]
+    }  # fmt: skip
+    assert caplog.text.count("ParquetSink") == 1
+    assert "['birthCity.fr', 'points', 'teams.id']" in caplog.text
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError, match="rows.xlsx"):
+        open_sink(tmp_path / "rows.xlsx")
+
+
+def _roster_handler(requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/v1/standings/now":
+            teams = [{"teamAbbrev": {"default": abbr}} for abbr in ("BUF", "TOR", "MTL")]
+            return httpx.Response(200, json={"standings": teams})
+        if request.url.path.startswith("/v1/roster/"):
+            player = {"id": len(requests), "firstName": {"default": "F"}, "lastName": {"default": "L"}}
+            return httpx.Response(200, json={"forwards": [player], "defensemen": [], "goalies": []})
+        return httpx.Response(200, json={"data": []})
+
+    return handler
+
+
+def test_iter_all_players_streams_into_a_sink(tmp_path):
+    requests = []
+    config = ClientConfig(transport=httpx.MockTransport(_roster_handler(requests)), rate_limit=None, max_concurrency=1)
+    client = NHLClient(config=config)
+    players = client.helpers.iter_all_players("20232024")
+    first = next(players)
+    # Standings, franchises and the first team's roster are enough for the first row.
+    assert first["team"] == "BUF" and first["firstName"] == "F" and len(requests) <= 4
+    players.close()
+
+    path = tmp_path / "players.ndjson"
+    assert write_rows(client.helpers.iter_all_players("20232024"), path) == 3
+    assert [json.loads(line)["team"] for line in path.read_text().splitlines()] == ["BUF", "TOR", "MTL"]
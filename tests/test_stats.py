@@ -1,5 +1,16 @@
+import asyncio
+import threading
+import time
 from unittest import mock
 
+import httpx
+import pytest
+
+from nhlpy import AsyncNHLClient, NHLClient
+from nhlpy.api.query.builder import QueryBuilder
+from nhlpy.api.query.filters.season import SeasonQuery
+from nhlpy.config import ClientConfig
+
 
 @mock.patch("httpx.Client.get")
 def test_stats_season(h_m, nhl_client):
@@ -116,3 +127,157 @@ def test_player_game_log_playoffs(h_m, nhl_client):
     nhl_client.stats.player_game_log(player_id="8481528", season_id="20232024", game_type=3)
     h_m.assert_called_once()
     assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/player/8481528/game-log/20232024/3"
+
+
+def _report_handler(total: int, delay: float = 0.0):
+    """Serves a stats REST report of ``total`` rows, honoring start / limit."""
+    state = {"pages": [], "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start, limit = int(request.url.params["start"]), int(request.url.params["limit"])
+        with lock:
+            state["pages"].append(start)
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(delay)
+        with lock:
+            state["in_flight"] -= 1
+        rows = [{"playerId": i} for i in range(start, min(start + limit, total))]
+        return httpx.Response(200, json={"data": rows, "total": total})
+
+    return handler, state
+
+
+def _stats_config(handler, max_concurrency: int = 4) -> ClientConfig:
+    transport = httpx.MockTransport(handler)
+    return ClientConfig(transport=transport, async_transport=transport, max_concurrency=max_concurrency, rate_limit=None)
+
+
+def test_iter_skater_stats_summary_yields_every_row_in_order():
+    handler, state = _report_handler(total=1050, delay=0.01)
+    client = NHLClient(config=_stats_config(handler))
+    rows = list(client.stats.iter_skater_stats_summary(start_season="20232024", end_season="20232024"))
+    assert [row["playerId"] for row in rows] == list(range(1050))
+    assert sorted(state["pages"]) == list(range(0, 1050, 100))
+    assert 1 < state["max_in_flight"] <= 4
+
+
+def test_iter_team_summary_keeps_filters():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params)
+        return httpx.Response(200, json={"data": [{"teamId": 1}], "total": 1})
+
+    client = NHLClient(config=_stats_config(handler))
+    assert list(client.stats.iter_team_summary(start_season="20202021", end_season="20212022")) == [{"teamId": 1}]
+    assert requests[0]["cayenneExp"] == "gameTypeId=2 and seasonId<=20212022 and seasonId>=20202021"
+    assert requests[0]["limit"] == "100"
+
+
+def test_iter_goalie_stats_summary_stops_fetching_when_closed():
+    handler, state = _report_handler(total=10_000)
+    client = NHLClient(config=_stats_config(handler, max_concurrency=2))
+    rows = client.stats.iter_goalie_stats_summary(start_season="20232024", page_size=10)
+    for _ in range(15):
+        next(rows)
+    rows.close()
+    # The first page, plus at most a window of pages fetched ahead.
+    assert len(state["pages"]) <= 1 + 2 + 1
+
+
+def test_async_iter_skater_stats_summary():
+    handler, _ = _report_handler(total=250)
+
+    async def run():
+        async with AsyncNHLClient(config=_stats_config(handler)) as client:
+            stats = client.stats.iter_skater_stats_summary(start_season="20232024", end_season="20232024")
+            return [row["playerId"] async for row in stats]
+
+    assert asyncio.run(run()) == list(range(250))
+
+
+def _multi_report_handler():
+    """summary / realtime / timeonice reports for players 0..149 over two seasons.  Player 7 has no realtime row."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        report = request.url.path.rsplit("/", 1)[1]
+        requested.append(report)
+        rows = []
+        for player_id in range(150):
+            for season in (20222023, 20232024):
+                if report == "realtime" and player_id == 7:
+                    continue
+                row = {"playerId": player_id, "seasonId": season, "skaterFullName": f"P{player_id}", "gamesPlayed": 82}
+                if report == "summary":
+                    row.update(points=player_id, timeOnIcePerGame=1000)
+                elif report == "realtime":
+                    row.update(hits=player_id * 2, timeOnIcePerGame=1001)
+                else:
+                    row.update(timeOnIce=player_id * 3, timeOnIcePerGame=1002)
+                rows.append(row)
+        if report == "realtime":
+            rows.reverse()
+        start, limit = int(request.url.params["start"]), int(request.url.params["limit"])
+        return httpx.Response(200, json={"data": rows[start : start + limit], "total": len(rows)})
+
+    return handler, requested
+
+
+def test_skater_reports_are_joined_per_player_season():
+    handler, requested = _multi_report_handler()
+    client = NHLClient(config=_stats_config(handler))
+    context = QueryBuilder().build(filters=[SeasonQuery(season_start="20222023", season_end="20232024")])
+    rows = list(client.stats.skater_reports_with_query_context(context, ["summary", "realtime", "timeonice"]))
+
+    assert len(rows) == 300
+    assert set(requested) == {"summary", "realtime", "timeonice"}
+    by_key = {(row["playerId"], row["seasonId"]): row for row in rows}
+    assert by_key[(3, 20232024)] == {
+        "playerId": 3,
+        "seasonId": 20232024,
+        "skaterFullName": "P3",
+        "gamesPlayed": 82,
+        "points": 3,
+        "timeOnIcePerGame": 1000,
+        "hits": 6,
+        "realtime_timeOnIcePerGame": 1001,
+        "timeOnIce": 9,
+        "timeonice_timeOnIcePerGame": 1002,
+    }
+    # Left join: a player missing from a later report keeps the columns of the others.
+    assert "hits" not in by_key[(7, 20222023)] and by_key[(7, 20222023)]["timeOnIce"] == 21
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 2, 5])
+def test_joined_reports_stay_within_max_concurrency(max_concurrency):
+    handler, _ = _multi_report_handler()
+    state = {"in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def slow_handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.01)
+        with lock:
+            state["in_flight"] -= 1
+        return handler(request)
+
+    client = NHLClient(config=_stats_config(slow_handler, max_concurrency=max_concurrency))
+    context = QueryBuilder().build(filters=[SeasonQuery(season_start="20222023", season_end="20232024")])
+    reports = ["summary", "realtime", "timeonice"]
+    rows = list(client.stats.skater_reports_with_query_context(context, reports, page_size=20))
+    assert len(rows) == 300
+    assert state["max_in_flight"] <= max_concurrency
+
+
+def test_unknown_report_types_are_rejected():
+    client = NHLClient(config=_stats_config(lambda request: httpx.Response(500)))
+    context = QueryBuilder().build(filters=[SeasonQuery(season_start="20232024", season_end="20232024")])
+    with pytest.raises(ValueError):
+        list(client.stats.skater_reports_with_query_context(context, ["summary", "hitz"]))
+    with pytest.raises(ValueError):
+        list(client.stats.goalie_reports_with_query_context(context, ["summary", "timeonice"]))
@@ -0,0 +1,342 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+from nhlpy.tables import NO_COORD, SHOT_EVENTS, ColumnarTable, EventTable, ShiftIndex
+
+ROWS = [
+    {"playerId": 8478550, "points": 120, "pointsPerGame": 1.46341, "positionCode": "L", "ties": None, "active": True},
+    {"playerId": 8478402, "points": 132, "pointsPerGame": 1.73684, "positionCode": "C", "ties": None, "active": True},
+    {"playerId": 8477934, "points": 106, "pointsPerGame": 1.29268, "positionCode": "L", "ties": None},
+]
+
+
+def test_columns_are_typed_arrays():
+    table = ColumnarTable.from_rows(ROWS)
+    assert len(table) == 3
+    assert table.column_names == ["playerId", "points", "pointsPerGame", "positionCode", "ties", "active"]
+
+    assert table["playerId"].kind == "int" and table["playerId"].values.typecode == "i"
+    assert table["pointsPerGame"].kind == "float" and table["pointsPerGame"].values.typecode == "f"
+    assert table["positionCode"].kind == "category"
+    assert table["positionCode"].categories == ["L", "C"]
+    assert list(table["positionCode"].values) == [0, 1, 0]
+    assert table["ties"].kind == "null" and table["ties"].null_count == 3
+
+
+def test_rows_round_trip_with_nulls_for_missing_keys():
+    table = ColumnarTable.from_rows(ROWS)
+    # Rates are stored as float32.
+    assert table.row(0) == pytest.approx(ROWS[0], rel=1e-6)
+    assert table.row(-1) == pytest.approx({**ROWS[2], "active": None}, rel=1e-6)
+    assert table["active"].null_count == 1
+    assert table["pointsPerGame"].get(1) == pytest.approx(1.73684, rel=1e-6)
+
+
+def test_columns_widen_as_values_require():
+    table = ColumnarTable.from_rows(
+        [{"a": 1, "b": 1, "c": "x", "d": 1}, {"a": 2**40, "b": 0.5, "c": 3, "d": None}, {"e": 1}]
+    )
+    assert table["a"].values.typecode == "q" and table["a"].to_list() == [1, 2**40, None]
+    assert table["b"].kind == "float" and table["b"].to_list() == [1.0, 0.5, None]
+    assert table["c"].kind == "object" and table["c"].to_list() == ["x", 3, None]
+    assert table["d"].to_list() == [1, None, None]
+    assert table["e"].to_list() == [None, None, 1]
+
+
+def test_many_categories_widen_codes():
+    table = ColumnarTable.from_rows({"name": f"player {i}"} for i in range(40_000))
+    assert table["name"].values.typecode == "i"
+    assert table["name"].get(39_999) == "player 39999"
+
+
+def test_to_numpy_shares_memory():
+    np = pytest.importorskip("numpy")
+    table = ColumnarTable.from_rows(ROWS)
+    arrays = table.to_numpy()
+    assert arrays["points"].dtype == np.int32 and arrays["points"].tolist() == [120, 132, 106]
+    assert np.shares_memory(arrays["points"], np.frombuffer(table["points"].values, dtype=np.int32))
+    assert arrays["positionCode"].tolist() == ["L", "C", "L"]
+    assert arrays["active"].mask.tolist() == [False, False, True]
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    arrow = ColumnarTable.from_rows(ROWS).to_arrow()
+    assert arrow.schema.field("playerId").type == pa.int32()
+    assert arrow.schema.field("pointsPerGame").type == pa.float32()
+    assert arrow.column("positionCode").to_pylist() == ["L", "C", "L"]
+    assert arrow.column("active").to_pylist() == [True, True, None]
+
+
+def test_stats_report_columnar():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": ROWS, "total": 3}))
+    client = NHLClient(config=ClientConfig(transport=transport, rate_limit=None))
+    table = client.stats.skater_stats_summary(start_season="20232024", end_season="20232024", columnar=True)
+    assert isinstance(table, ColumnarTable)
+    assert table["points"].to_list() == [120, 132, 106]
+
+    streamed = ColumnarTable.from_rows(client.stats.iter_skater_stats_summary("20232024", "20232024"))
+    assert streamed.to_rows() == table.to_rows()
+
+
+def _play(event_id, type_code, desc, period=1, clock="00:00", **details):
+    play = {
+        "eventId": event_id,
+        "periodDescriptor": {"number": period, "periodType": "REG"},
+        "timeInPeriod": clock,
+        "situationCode": "1551",
+        "typeCode": type_code,
+        "typeDescKey": desc,
+    }
+    if details:
+        play["details"] = details
+    return play
+
+
+def _game(game_id, shooter=8478402):
+    return {
+        "id": game_id,
+        "season": 20232024,
+        "gameType": 2,
+        "gameDate": "2023-11-01",
+        "homeTeam": {"id": 22, "abbrev": "EDM"},
+        "awayTeam": {"id": 7, "abbrev": "BUF"},
+        "plays": [
+            _play(1, 520, "period-start"),
+            _play(
+                2,
+                502,
+                "faceoff",
+                winningPlayerId=shooter,
+                losingPlayerId=8479420,
+                eventOwnerTeamId=22,
+                xCoord=0,
+                yCoord=0,
+            ),
+            _play(
+                3,
+                506,
+                "shot-on-goal",
+                clock="01:15",
+                shootingPlayerId=shooter,
+                goalieInNetId=8480045,
+                eventOwnerTeamId=22,
+                xCoord=-71,
+                yCoord=12,
+            ),
+            _play(
+                4,
+                508,
+                "blocked-shot",
+                clock="02:40",
+                shootingPlayerId=8479420,
+                blockingPlayerId=shooter,
+                eventOwnerTeamId=22,
+                xCoord=60,
+                yCoord=-5,
+            ),
+            _play(
+                5,
+                505,
+                "goal",
+                period=2,
+                clock="13:02",
+                scoringPlayerId=shooter,
+                assist1PlayerId=8477934,
+                goalieInNetId=8480045,
+                eventOwnerTeamId=22,
+                xCoord=-80,
+                yCoord=3,
+            ),
+            _play(6, 599, "brand-new-event", period=3, clock="19:59"),
+        ],
+    }
+
+
+def test_event_table_columns():
+    events = EventTable.from_games([_game(2023020001)])
+    assert len(events) == 6
+    assert events["period_seconds"].tolist() == [0, 0, 75, 160, 782, 1199]
+    assert events["x"].typecode == "h" and events["x"][0] == NO_COORD and events["x"][2] == -71
+    assert events.games[2023020001]["homeTeamId"] == 22
+    assert events.event(4) == {
+        "game_id": 2023020001,
+        "event_id": 5,
+        "period": 2,
+        "period_seconds": 782,
+        "type_code": 505,
+        "team_id": 22,
+        "x": -80,
+        "y": 3,
+        "situation_code": 1551,
+        "player_id": 8478402,
+        "secondary_player_id": 8477934,
+        "tertiary_player_id": None,
+        "goalie_id": 8480045,
+        "type": "goal",
+    }
+    # Unknown codes are learned from the payload.
+    assert events.event(5)["type"] == "brand-new-event"
+
+
+def test_event_table_select():
+    events = EventTable.from_games([_game(2023020001), _game(2023020002), _game(2023020003, shooter=8477934)])
+    shots = events.select(event_types=SHOT_EVENTS, player_id=8478402)
+    assert [events.event(i)["type"] for i in shots] == ["shot-on-goal", "goal"] * 2
+    assert events.select(event_types=["goal", 506], player_id=8478402, game_id=2023020002) == [8, 10]
+    # The blocked shot only shows up when any player column may match.
+    assert len(events.select(involving_player_id=8478402)) == 8
+    # Combined with a smaller index, the player still has to be in one of the player columns.
+    assert events.select(event_types=["period-start"], involving_player_id=8478402) == []
+    assert events.select(game_id=2023020002, involving_player_id=8477934) == [10]  # the assist
+    in_game = events.select(game_id=2023020003, involving_player_id=8479420)
+    assert in_game and in_game == [i for i in events.select(involving_player_id=8479420) if i >= 12]
+    assert events.select(event_types=SHOT_EVENTS, period=2, team_id=22) == [4, 10, 16]
+    assert events.select(player_id=1) == []
+    with pytest.raises(ValueError):
+        events.select(event_types=["icing"])
+
+
+def test_event_table_rejects_duplicate_games():
+    events = EventTable.from_games([_game(2023020001)])
+    with pytest.raises(ValueError):
+        events.append_game(_game(2023020001))
+
+
+def test_event_table_exports():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    events = EventTable.from_games([_game(2023020001)])
+    arrays = events.to_numpy()
+    assert arrays["player_id"].dtype == np.int32
+    assert np.shares_memory(arrays["x"], np.frombuffer(events["x"], dtype=np.int16))
+    arrow = events.to_arrow()
+    assert arrow.column("type").to_pylist() == [
+        "period-start", "faceoff", "shot-on-goal", "blocked-shot", "goal", "brand-new-event"
+    ]  # fmt: skip
+
+
+def test_play_by_play_events_loads_games_in_order():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_game(int(request.url.path.split("/")[3])))
+
+    client = NHLClient(config=ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None))
+    events = client.game_center.play_by_play_events(["2023020002", "2023020001"])
+    assert list(events.games) == [2023020002, 2023020001]
+    assert len(events) == 12
+
+
+def test_play_by_play_events_bounds_games_in_flight():
+    first_game = threading.Event()
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        game_id = int(request.url.path.split("/")[3])
+        requested.append(game_id)
+        if game_id == 2023020001:
+            first_game.wait(5)
+        return httpx.Response(200, json=_game(game_id))
+
+    config = ClientConfig(transport=httpx.MockTransport(handler), rate_limit=None, max_concurrency=2)
+    client = NHLClient(config=config)
+    game_ids = [str(2023020001 + i) for i in range(10)]
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        loading = runner.submit(client.game_center.play_by_play_events, game_ids)
+        time.sleep(0.2)
+        # The first game is stuck, so only the one after it may be fetched ahead.
+        assert len(requested) == 2
+        first_game.set()
+        events = loading.result()
+    assert len(requested) == 10 and list(events.games) == [int(game_id) for game_id in game_ids]
+
+
+def _shift(player_id, team_id, start, end, period=1, type_code=517, game_id=2023020001):
+    return {
+        "gameId": game_id,
+        "playerId": player_id,
+        "teamId": team_id,
+        "period": period,
+        "startTime": start,
+        "endTime": end,
+        "typeCode": type_code,
+    }
+
+
+# Home (22): goalie 100, skaters 101 -> 102 change at 0:45, 103.  Away (7): goalie 200, 201 off at 1:00, 202.
+SHIFTS = [
+    _shift(100, 22, "00:00", "20:00"),
+    _shift(101, 22, "00:00", "00:45"),
+    _shift(102, 22, "00:45", "01:30"),
+    _shift(103, 22, "00:00", "01:30"),
+    _shift(200, 7, "00:00", "20:00"),
+    _shift(201, 7, "00:00", "01:00"),
+    _shift(202, 7, "00:00", "01:30"),
+    _shift(202, 7, "05:00", "05:00"),
+    _shift(103, 22, "01:10", None, type_code=505),
+]
+
+
+def test_shift_index_on_ice():
+    index = ShiftIndex(SHIFTS)
+    assert index.game_id == 2023020001 and index.team_ids == {22, 7}
+    assert index.on_ice(1, 30) == {22: {100, 101, 103}, 7: {200, 201, 202}}
+    # At a change, plays go to the players finishing their shift, faceoffs to the ones starting.
+    assert index.on_ice(1, 45)[22] == {100, 101, 103}
+    assert index.on_ice(1, 45, faceoff=True)[22] == {100, 102, 103}
+    assert index.on_ice(1, 0) == {22: frozenset(), 7: frozenset()}
+    assert index.on_ice(1, 0, faceoff=True)[7] == {200, 201, 202}
+    assert index.on_ice(1, 1200)[22] == {100}
+    assert index.on_ice(2, 10) == {22: frozenset(), 7: frozenset()}
+
+
+def test_shift_index_batch_matches_single_lookups():
+    index = ShiftIndex(SHIFTS)
+    moments = [(1, s, faceoff) for s in (90, 0, 45, 60, 44, 45, 1200, 30) for faceoff in (False, True)]
+    moments.append((2, 0, True))
+    assert index.on_ice_many(moments) == [index.on_ice(*moment) for moment in moments]
+
+
+def test_shift_index_annotates_play_by_play():
+    play_by_play = {
+        "homeTeam": {"id": 22},
+        "awayTeam": {"id": 7},
+        "rosterSpots": [
+            {"playerId": 100, "teamId": 22, "positionCode": "G"},
+            {"playerId": 200, "teamId": 7, "positionCode": "G"},
+            {"playerId": 101, "teamId": 22, "positionCode": "C"},
+        ],
+        "plays": [
+            _play(1, 520, "period-start"),
+            _play(2, 506, "shot-on-goal", clock="00:30"),
+            _play(3, 509, "penalty", clock="01:00"),
+            _play(4, 502, "faceoff", clock="01:00"),
+            _play(5, 506, "shot-on-goal", clock="01:10"),
+        ],
+    }
+    rows = ShiftIndex(SHIFTS).annotate(play_by_play)
+    assert [row["strength"] for row in rows] == ["2v2", "2v2", "2v2", "2v1", "2v1"]
+    assert rows[4] == {
+        "eventId": 5,
+        "homeSkaters": {102, 103},
+        "awaySkaters": {202},
+        "homeGoalie": 100,
+        "awayGoalie": 200,
+        "strength": "2v1",
+    }
+
+
+def test_shift_index_rejects_several_games():
+    with pytest.raises(ValueError):
+        ShiftIndex(SHIFTS + [_shift(300, 1, "00:00", "00:40", game_id=2023020002)])
+
+
+def test_game_center_shift_index():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": SHIFTS, "total": len(SHIFTS)}))
+    client = NHLClient(config=ClientConfig(transport=transport, rate_limit=None))
+    assert client.game_center.shift_index("2023020001").on_ice(1, 30)[7] == {200, 201, 202}
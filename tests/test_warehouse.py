@@ -0,0 +1,179 @@
+import re
+import threading
+from datetime import date, timedelta
+
+import httpx
+
+from nhlpy.config import ClientConfig
+from nhlpy.nhl_client import NHLClient
+from nhlpy.warehouse import Warehouse
+
+SEASON = "20232024"
+
+
+def _games():
+    return {
+        2023020001: {"date": "2023-10-10", "home": "TOR", "away": "BUF", "state": "OFF"},
+        2023020002: {"date": "2023-10-12", "home": "BUF", "away": "MTL", "state": "OFF"},
+        2023020003: {"date": "2023-10-17", "home": "MTL", "away": "TOR", "state": "LIVE"},
+        2023020004: {"date": "2023-10-19", "home": "MTL", "away": "BUF", "state": "FUT"},
+    }
+
+
+def _team(abbrev: str, score) -> dict:
+    return {"id": {"BUF": 7, "TOR": 10, "MTL": 8}[abbrev], "abbrev": abbrev, "score": score}
+
+
+def _api(games: dict, seen: list, broken=()):
+    lock = threading.Lock()
+
+    def stub(game_id: int) -> dict:
+        game = games[game_id]
+        score = None if game["state"] == "FUT" else 2
+        return {
+            "id": game_id,
+            "season": int(SEASON),
+            "gameType": game.get("type", 2),
+            "gameState": game["state"],
+            "homeTeam": _team(game["home"], score),
+            "awayTeam": _team(game["away"], score),
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        with lock:
+            seen.append(path)
+        if path == "/v1/standings-season":
+            season = {"id": int(SEASON), "standingsStart": "2023-10-10", "standingsEnd": "2023-10-23"}
+            return httpx.Response(200, json={"seasons": [season]})
+        if path.startswith("/v1/schedule/"):
+            start = date.fromisoformat(path.rsplit("/", 1)[1])
+            days = [(start + timedelta(days=i)).isoformat() for i in range(7)]
+            week = [{"date": day, "games": [stub(g) for g in games if games[g]["date"] == day]} for day in days]
+            page = {"gameWeek": week, "nextStartDate": (start + timedelta(days=7)).isoformat()}
+            return httpx.Response(200, json={**page, "regularSeasonEndDate": "2023-10-23"})
+        if path.endswith("/play-by-play"):
+            game_id = int(path.split("/")[3])
+            team = _team(games[game_id]["home"], 0)["id"]
+            plays = [
+                {
+                    "eventId": 1,
+                    "periodDescriptor": {"number": 1, "periodType": "REG"},
+                    "timeInPeriod": "01:30",
+                    "typeDescKey": "shot-on-goal",
+                    "details": {"eventOwnerTeamId": team, "shootingPlayerId": 100, "goalieInNetId": 200},
+                },
+                {"eventId": 2, "periodDescriptor": {"number": 1}, "timeInPeriod": "02:00", "typeDescKey": "stoppage"},
+            ]
+            spots = [
+                {"playerId": 100, "firstName": {"default": "A"}, "lastName": {"default": "Skater"}},
+                {"playerId": 200, "firstName": {"default": "B"}, "lastName": {"default": "Goalie"}},
+            ]
+            return httpx.Response(200, json={**stub(game_id), "plays": plays, "rosterSpots": spots})
+        if path == "/stats/rest/en/shiftcharts":
+            game_id = int(re.search(r"gameId=(\d+)", request.url.params["cayenneExp"]).group(1))
+            if game_id in broken:
+                return httpx.Response(503)
+            shift = {"gameId": game_id, "playerId": 100, "period": 1, "startTime": "00:00", "endTime": "00:45"}
+            return httpx.Response(200, json={"data": [{**shift, "id": game_id * 10 + i} for i in range(3)]})
+        if path.startswith("/v1/roster/"):
+            skater = {"id": 100, "firstName": {"default": "A"}, "shootsCatches": "L", "positionCode": "C"}
+            return httpx.Response(200, json={"forwards": [skater], "defensemen": [], "goalies": []})
+        if path == "/stats/rest/en/skater/summary":
+            return httpx.Response(200, json={"data": [{"playerId": 100, "goals": 3, "points": 5}], "total": 1})
+        if path == "/stats/rest/en/goalie/summary":
+            return httpx.Response(200, json={"data": [{"playerId": 200, "wins": 2, "savePct": 0.91}], "total": 1})
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler)
+
+
+def _sync(warehouse: Warehouse, games: dict, today: str, broken=(), game_types=(2,)):
+    seen = []
+    config = ClientConfig(transport=_api(games, seen, broken), rate_limit=None, max_retries=0, max_concurrency=3)
+    with NHLClient(config=config) as client:
+        report = warehouse.sync(client, SEASON, game_types=list(game_types), today=date.fromisoformat(today))
+    assert report.requests == len(seen)
+    return report, seen
+
+
+def test_first_sync_loads_the_season(tmp_path):
+    with Warehouse(str(tmp_path / "nhl.sqlite")) as warehouse:
+        report, seen = _sync(warehouse, _games(), "2023-10-17")
+
+        # Manifest and two schedule weeks, 2 requests for each started game, 3 rosters and the 2 stats reports.
+        assert report.requests == 3 + 3 * 2 + 3 + 2
+        assert report.games_changed == 4 and report.games_loaded == 3 and not report.failed
+        assert report.rosters_synced and report.stats_synced
+        assert warehouse.execute("SELECT game_id, game_state, final FROM games ORDER BY game_id").fetchall() == [
+            (2023020001, "OFF", 1),
+            (2023020002, "OFF", 1),
+            (2023020003, "LIVE", 0),
+            (2023020004, "FUT", 0),
+        ]
+        plays = warehouse.execute(
+            "SELECT period_seconds, type_desc_key, team_id, player_id, goalie_id FROM plays WHERE game_id = ?",
+            (2023020003,),
+        ).fetchall()
+        assert plays == [(90, "shot-on-goal", 8, 100, 200), (120, "stoppage", None, None, None)]
+        assert warehouse.execute("SELECT COUNT(*) FROM shifts").fetchone() == (9,)
+        assert warehouse.execute("SELECT player_id, first_name, last_name, shoots_catches FROM players").fetchall() == [
+            (100, "A", "Skater", "L"),
+            (200, "B", "Goalie", None),
+        ]
+        assert warehouse.execute("SELECT team FROM rosters ORDER BY team").fetchall() == [("BUF",), ("MTL",), ("TOR",)]
+        assert warehouse.execute("SELECT player_id, goals, points FROM skater_season_stats").fetchall() == [(100, 3, 5)]
+        assert warehouse.execute("SELECT player_id, wins, save_pct FROM goalie_season_stats").fetchall() == [
+            (200, 2, 0.91)
+        ]
+
+
+def test_incremental_sync_only_fetches_changes(tmp_path):
+    games = _games()
+    with Warehouse(str(tmp_path / "nhl.sqlite")) as warehouse:
+        _sync(warehouse, games, "2023-10-17")
+
+        games[2023020003]["state"] = "OFF"
+        games[2023020004]["state"] = "LIVE"
+        report, seen = _sync(warehouse, games, "2023-10-19")
+        # One schedule week, the two changed games and the stats, since a game went final.
+        assert [path for path in seen if "schedule" in path] == ["/v1/schedule/2023-10-16"]
+        assert sorted(path for path in seen if path.endswith("/play-by-play")) == [
+            "/v1/gamecenter/2023020003/play-by-play",
+            "/v1/gamecenter/2023020004/play-by-play",
+        ]
+        assert report.requests == 1 + 2 * 2 + 2 and report.stats_synced and not report.rosters_synced
+        assert warehouse.execute("SELECT COUNT(*) FROM plays WHERE game_id = 2023020003").fetchone() == (2,)
+
+        # Nothing went final: only the live game is reloaded.
+        report, seen = _sync(warehouse, games, "2023-10-19")
+        assert report.requests == 1 + 2 and report.games_changed == 0 and not report.stats_synced
+        assert warehouse.execute("SELECT final FROM games WHERE game_id = 2023020003").fetchone() == (1,)
+
+
+def test_failed_games_are_retried(tmp_path):
+    games = _games()
+    with Warehouse(str(tmp_path / "nhl.sqlite")) as warehouse:
+        report, _ = _sync(warehouse, games, "2023-10-17", broken={2023020002})
+        assert list(report.failed) == [2023020002] and report.games_loaded == 2
+        assert warehouse.execute("SELECT COUNT(*) FROM plays WHERE game_id = 2023020002").fetchone() == (0,)
+
+        report, seen = _sync(warehouse, games, "2023-10-17")
+        assert "/v1/gamecenter/2023020002/play-by-play" in seen and not report.failed
+        assert warehouse.execute("SELECT COUNT(*) FROM plays WHERE game_id = 2023020002").fetchone() == (2,)
+
+
+def test_stats_are_refreshed_per_game_type(tmp_path):
+    games = _games()
+    with Warehouse(str(tmp_path / "nhl.sqlite")) as warehouse:
+        _sync(warehouse, games, "2023-10-17")
+
+        games[2023030111] = {"date": "2023-10-17", "home": "TOR", "away": "BUF", "state": "OFF", "type": 3}
+        report, seen = _sync(warehouse, games, "2023-10-17", game_types=[3])
+        assert report.stats_synced and report.games_loaded == 1
+        # Only the playoff reports were fetched, and the regular season rows are still there.
+        assert sum(path.endswith("/summary") for path in seen) == 2
+        assert warehouse.execute("SELECT game_type, player_id FROM skater_season_stats ORDER BY 1").fetchall() == [
+            (2, 100),
+            (3, 100),
+        ]